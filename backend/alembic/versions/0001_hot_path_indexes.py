@@ -0,0 +1,143 @@
+"""Add secondary indexes for hot query paths
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+The tables themselves predate Alembic and are created by
+``Base.metadata.create_all``; this revision only adds indexes. Every index is
+built with CREATE INDEX CONCURRENTLY, which can't run inside a transaction, so
+the statements run in an autocommit block and don't lock the tables against
+writes while they build. ``if_not_exists`` makes the revision safe to run on a
+database whose tables were created from the current models, which already
+declare these indexes.
+
+If a concurrent build fails, Postgres leaves an INVALID index behind; drop it
+before re-running the upgrade.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PUBLISHED = sa.text("status = 'PUBLISHED'")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # applications: candidate dashboards, duplicate-apply check, per-job lists.
+        # The unique index leads with job_id, so it also serves job_id lookups.
+        op.create_index(
+            "ix_applications_candidate_user_id",
+            "applications",
+            ["candidate_user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "uq_applications_job_candidate",
+            "applications",
+            ["job_id", "candidate_user_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # jobs: employer listings, and the published-only public listings.
+        op.create_index(
+            "ix_jobs_company_id",
+            "jobs",
+            ["company_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_jobs_published_at_published",
+            "jobs",
+            [sa.text("published_at DESC")],
+            postgresql_where=PUBLISHED,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_jobs_company_id_published",
+            "jobs",
+            ["company_id", sa.text("published_at DESC")],
+            postgresql_where=PUBLISHED,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # saved_jobs: uq_user_saved_job already covers user_id lookups.
+        op.create_index(
+            "ix_saved_jobs_job_id",
+            "saved_jobs",
+            ["job_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # refresh_tokens: token lookup on refresh/logout, bulk revoke per user.
+        op.create_index(
+            "ix_refresh_tokens_token_hash",
+            "refresh_tokens",
+            ["token_hash"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_refresh_tokens_user_id",
+            "refresh_tokens",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # users: OAuth login lookup. Password users have no provider.
+        op.create_index(
+            "ix_users_oauth_provider_oauth_id",
+            "users",
+            ["oauth_provider", "oauth_id"],
+            postgresql_where=sa.text("oauth_provider IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # companies: "my company" lookup on every employer page.
+        op.create_index(
+            "ix_companies_owner_user_id",
+            "companies",
+            ["owner_user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in (
+            ("ix_companies_owner_user_id", "companies"),
+            ("ix_users_oauth_provider_oauth_id", "users"),
+            ("ix_refresh_tokens_user_id", "refresh_tokens"),
+            ("ix_refresh_tokens_token_hash", "refresh_tokens"),
+            ("ix_saved_jobs_job_id", "saved_jobs"),
+            ("ix_jobs_company_id_published", "jobs"),
+            ("ix_jobs_published_at_published", "jobs"),
+            ("ix_jobs_company_id", "jobs"),
+            ("uq_applications_job_candidate", "applications"),
+            ("ix_applications_candidate_user_id", "applications"),
+        ):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,70 @@
+"""Add application and save counters to jobs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 12:00:00.000000
+
+Adds ``jobs.applications_count`` and ``jobs.saves_count`` and the
+``job_counter_deltas`` table their changes are queued in. The columns have a
+constant default, so adding them doesn't rewrite the table. The counters are
+then backfilled from applications and saved_jobs in one UPDATE; on a large
+table, run the upgrade off-peak or skip the backfill and run
+``python -m scripts.reconcile_job_counters`` afterwards, which repairs the
+counters in small batches.
+
+``IF NOT EXISTS`` keeps the revision safe on a database created from the
+current models, which already declare these columns and the table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS applications_count INTEGER NOT NULL DEFAULT 0")
+    op.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS saves_count INTEGER NOT NULL DEFAULT 0")
+
+    op.create_table(
+        "job_counter_deltas",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jobs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("applications", sa.Integer(), nullable=False),
+        sa.Column("saves", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_job_counter_deltas_job_id",
+        "job_counter_deltas",
+        ["job_id"],
+        if_not_exists=True,
+    )
+
+    op.execute(
+        """
+        UPDATE jobs
+        SET applications_count = (SELECT count(*) FROM applications WHERE applications.job_id = jobs.id),
+            saves_count = (SELECT count(*) FROM saved_jobs WHERE saved_jobs.job_id = jobs.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_counter_deltas_job_id", table_name="job_counter_deltas", if_exists=True)
+    op.drop_table("job_counter_deltas", if_exists=True)
+    op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS saves_count")
+    op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS applications_count")
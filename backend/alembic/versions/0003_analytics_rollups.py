@@ -0,0 +1,92 @@
+"""Add analytics rollup tables
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 15:00:00.000000
+
+Adds ``analytics_rollups`` (event counts per job, metric and hour or day)
+and ``analytics_watermarks`` (how far the aggregator has read its source),
+plus an index on ``audit_logs.created_at`` for the aggregator's windowed
+reads. The new tables start empty: on its first run the aggregator starts
+at the oldest audit log entry and works forward one window per transaction,
+so history is backfilled in the background.
+
+The audit log index is built CONCURRENTLY in an autocommit block, as in
+0001, so it doesn't lock the table against writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analytics_rollups",
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jobs.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("grain", sa.String(10), primary_key=True),
+        sa.Column("metric", sa.String(50), primary_key=True),
+        sa.Column("bucket", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column(
+            "company_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("companies.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("value", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_analytics_rollups_company",
+        "analytics_rollups",
+        ["company_id", "grain", "metric", "bucket"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_analytics_rollups_metric",
+        "analytics_rollups",
+        ["grain", "metric", "bucket"],
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "analytics_watermarks",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("position", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_created_at",
+            "audit_logs",
+            ["created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_logs_created_at",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_table("analytics_watermarks", if_exists=True)
+    op.drop_table("analytics_rollups", if_exists=True)
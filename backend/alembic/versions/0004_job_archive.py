@@ -0,0 +1,114 @@
+"""Add archive tables for closed jobs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 18:00:00.000000
+
+Adds ``jobs_archive`` and ``applications_archive``, which long-closed jobs and
+their applications are moved into, and a partial index on closed jobs'
+``updated_at`` for picking them. Archived jobs keep their IDs, so the foreign
+key from ``analytics_rollups.job_id`` to ``jobs`` is dropped: rollups are
+history and must outlive the live row.
+
+The archive tables reuse the existing enum types. The partial index is built
+CONCURRENTLY in an autocommit block, as in 0001.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def enum(name: str) -> postgresql.ENUM:
+    return postgresql.ENUM(name=name, create_type=False)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE analytics_rollups DROP CONSTRAINT IF EXISTS analytics_rollups_job_id_fkey")
+
+    op.create_table(
+        "jobs_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("company_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("slug", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("type", enum("employmenttype"), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("experience_level", sa.String(50), nullable=False),
+        sa.Column("salary_min", sa.Integer(), nullable=True),
+        sa.Column("salary_max", sa.Integer(), nullable=True),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("status", enum("jobstatus"), nullable=False),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("apply_email", sa.String(255), nullable=True),
+        sa.Column("applications_count", sa.Integer(), nullable=False),
+        sa.Column("saves_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_jobs_archive_company_id", "jobs_archive", ["company_id"], if_not_exists=True)
+
+    op.create_table(
+        "applications_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("jobs_archive.id"), nullable=False),
+        sa.Column("candidate_user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("cv_key", sa.String(500), nullable=False),
+        sa.Column("cover_letter", sa.Text(), nullable=True),
+        sa.Column("status", enum("applicationstatus"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_applications_archive_job_id", "applications_archive", ["job_id"], if_not_exists=True)
+    op.create_index(
+        "ix_applications_archive_candidate_user_id",
+        "applications_archive",
+        ["candidate_user_id"],
+        if_not_exists=True,
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_updated_at_closed",
+            "jobs",
+            ["updated_at"],
+            postgresql_where=sa.text("status = 'CLOSED'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_updated_at_closed",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    # Archived rows are not moved back; dropping the tables discards them
+    op.drop_table("applications_archive", if_exists=True)
+    op.drop_table("jobs_archive", if_exists=True)
+    op.execute("DELETE FROM analytics_rollups WHERE job_id NOT IN (SELECT id FROM jobs)")
+    op.create_foreign_key(
+        "analytics_rollups_job_id_fkey",
+        "analytics_rollups",
+        "jobs",
+        ["job_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,75 @@
+"""
+Response serialization for IQAutoJobs.
+"""
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=None)
+def get_adapter(response_type: Any) -> TypeAdapter:
+    """Get the (cached) type adapter for a response type, e.g. ``list[JobSummaryResponse]``."""
+    return TypeAdapter(response_type)
+
+
+class JSONBytesResponse(Response):
+    """
+    Response whose body is JSON already, e.g. spliced from cached fragments.
+
+    FastAPI passes a returned ``Response`` through untouched, so the content
+    is neither validated against ``response_model`` again nor encoded a
+    second time through ``jsonable_encoder`` and ``json.dumps``.
+    """
+
+    media_type = "application/json"
+
+
+class ModelJSONResponse(JSONBytesResponse):
+    """JSON response that pydantic-core serializes straight to bytes."""
+
+    def __init__(
+        self,
+        content: Any,
+        response_type: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        body = get_adapter(response_type).dump_json(content, by_alias=True)
+        super().__init__(body, status_code=status_code, headers=headers)
+
+
+def merge_headers(response: Response, sub_response: Optional[Response]) -> Response:
+    """
+    Copy the headers dependencies set on the route's injected ``Response``.
+
+    FastAPI only merges those (e.g. the ``X-RateLimit-Class`` headers from
+    ``RateLimit``) into responses it builds itself; a ``Response`` a route
+    returns is sent as it is.
+    """
+    if sub_response is not None:
+        response.headers.raw.extend(sub_response.headers.raw)
+    return response
+
+
+def json_bytes_response(body: bytes, response: Optional[Response] = None) -> JSONBytesResponse:
+    """Send JSON the service has serialized already, keeping the dependencies' headers."""
+    return merge_headers(JSONBytesResponse(body), response)
+
+
+def model_response(content: Any, response_type: Any, response: Optional[Response] = None) -> Any:
+    """
+    Serialize response models the service built from our own rows as they are.
+
+    ``response_type`` should match the route's ``response_model``, which
+    still documents the endpoint. Pass the route's injected ``response`` so
+    headers set by its dependencies are kept. With ``TRUSTED_SERIALIZATION``
+    off the content is returned for FastAPI to validate and serialize as
+    usual.
+    """
+    if not settings.TRUSTED_SERIALIZATION:
+        return content
+    return merge_headers(ModelJSONResponse(content, response_type), response)
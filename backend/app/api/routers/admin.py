@@ -7,9 +7,10 @@ from sqlalchemy.orm import Session
 from structlog import get_logger
 
 from app.db.base import get_db
+from app.db.admin_stats import admin_stats
 from app.domain.models import (
-    UserResponse, UserRole, ApplicationResponse, JobResponse, CompanyResponse,
-    AuditLogResponse
+    UserResponse, UserRole, ApplicationResponse, JobResponse, CompanyResponse, CompanySummaryResponse,
+    AuditLogResponse, SlowQueryResponse
 )
 from app.services.user_service import UserService
 from app.services.job_service import JobService
@@ -22,14 +23,18 @@ from app.repositories.application_repo import ApplicationRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.api.routers.auth import get_current_user
 from app.core.errors import NotFoundError
+from app.core.rate_limit import RateLimit
+from app.db.slow_queries import slow_query_log
+from app.core.deadline import DeadlineRoute, deadline
+from app.core.config import settings
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute, dependencies=[Depends(RateLimit("admin"))])
 
 
 def require_admin(current_user):
     """Check if current user is admin."""
-    if current_user.role != UserRole.ADMIN:
+    if current_user.role.value != UserRole.ADMIN.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -38,6 +43,7 @@ def require_admin(current_user):
 
 
 @router.get("/users", response_model=list[UserResponse])
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
 async def get_users(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
@@ -54,13 +60,13 @@ async def get_users(
     
     if role:
         if role == UserRole.EMPLOYER:
-            return user_service.get_employers(skip, limit)
+            return await user_service.get_employers(skip, limit)
         elif role == UserRole.CANDIDATE:
-            return user_service.get_candidates(skip, limit)
+            return await user_service.get_candidates(skip, limit)
         elif role == UserRole.ADMIN:
-            return user_service.get_admins(skip, limit)
+            return await user_service.get_admins(skip, limit)
     
-    return user_service.get_users(skip, limit)
+    return await user_service.get_users(skip, limit)
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
@@ -77,7 +83,7 @@ async def get_user(
     user_service = UserService(db, user_repo, audit_repo)
     
     try:
-        return user_service.get_user_by_id(user_id)
+        return await user_service.get_user_by_id(user_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -96,7 +102,7 @@ async def activate_user(
     user_service = UserService(db, user_repo, audit_repo)
     
     try:
-        return user_service.activate_user(user_id)
+        return await user_service.activate_user(user_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -115,12 +121,13 @@ async def deactivate_user(
     user_service = UserService(db, user_repo, audit_repo)
     
     try:
-        return user_service.deactivate_user(user_id)
+        return await user_service.deactivate_user(user_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.get("/companies", response_model=list[CompanyResponse])
+@router.get("/companies", response_model=list[CompanySummaryResponse])
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
 async def get_companies(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
@@ -135,7 +142,7 @@ async def get_companies(
     audit_repo = AuditLogRepository(db)
     company_service = CompanyService(db, company_repo, user_repo, audit_repo)
     
-    return company_service.get_companies(skip, limit)
+    return await company_service.get_companies(skip, limit)
 
 
 @router.get("/companies/{company_id}", response_model=CompanyResponse)
@@ -153,12 +160,13 @@ async def get_company(
     company_service = CompanyService(db, company_repo, user_repo, audit_repo)
     
     try:
-        return company_service.get_company_by_id(company_id)
+        return await company_service.get_company_by_id(company_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/jobs", response_model=list[JobResponse])
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
 async def get_jobs(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
@@ -173,7 +181,7 @@ async def get_jobs(
     audit_repo = AuditLogRepository(db)
     job_service = JobService(db, job_repo, company_repo, audit_repo)
     
-    return job_service.get_jobs(skip, limit)
+    return await job_service.get_jobs(skip, limit)
 
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
@@ -191,12 +199,13 @@ async def get_job(
     job_service = JobService(db, job_repo, company_repo, audit_repo)
     
     try:
-        return job_service.get_job_by_id(job_id)
+        return await job_service.get_job_by_id(job_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/applications", response_model=list[ApplicationResponse])
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
 async def get_applications(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
@@ -212,7 +221,7 @@ async def get_applications(
     audit_repo = AuditLogRepository(db)
     app_service = ApplicationService(db, app_repo, job_repo, user_repo, audit_repo)
     
-    return app_service.search_applications(skip=skip, limit=limit)
+    return await app_service.search_applications(skip=skip, limit=limit)
 
 
 @router.get("/applications/{application_id}", response_model=ApplicationResponse)
@@ -231,12 +240,13 @@ async def get_application(
     app_service = ApplicationService(db, app_repo, job_repo, user_repo, audit_repo)
     
     try:
-        return app_service.get_application_by_id(application_id)
+        return await app_service.get_application_by_id(application_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/audit-logs", response_model=list[AuditLogResponse])
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
 async def get_audit_logs(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
@@ -251,36 +261,52 @@ async def get_audit_logs(
     audit_repo = AuditLogRepository(db)
     
     if action:
-        logs = audit_repo.get_by_action(action, skip, limit)
+        logs = await audit_repo.get_by_action(action, skip, limit)
     elif subject_type:
-        logs = audit_repo.get_by_subject_type(subject_type, skip, limit)
+        logs = await audit_repo.get_by_subject_type(subject_type, skip, limit)
     else:
-        logs = audit_repo.get_audit_logs_with_actor(skip, limit)
+        logs = await audit_repo.get_audit_logs_with_actor(skip, limit)
     
     return [AuditLogResponse.from_orm(log) for log in logs]
 
 
+@router.get("/slow-queries", response_model=list[SlowQueryResponse])
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=200, description="Limit count"),
+    current_user = Depends(get_current_user)
+):
+    """Get the slowest recorded SQL statements in this process (admin only)."""
+    require_admin(current_user)
+    return slow_query_log.top(limit)
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(current_user = Depends(get_current_user)):
+    """Clear the recorded slow SQL statements (admin only)."""
+    require_admin(current_user)
+    slow_query_log.clear()
+
+
 @router.get("/stats")
+@deadline(settings.REQUEST_DEADLINE_ADMIN)
 async def get_admin_stats(current_user = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get admin statistics (admin only)."""
     require_admin(current_user)
     
-    user_repo = UserRepository(db)
-    job_repo = JobRepository(db)
-    app_repo = ApplicationRepository(db)
-    company_repo = CompanyRepository(db)
+    counts = await admin_stats.get(db)
     
     stats = {
-        "total_users": user_repo.count(),
-        "total_companies": company_repo.count(),
-        "total_jobs": job_repo.count(),
-        "total_applications": app_repo.count(),
-        "active_users": user_repo.count({"is_active": True}),
-        "published_jobs": job_repo.count({"status": "PUBLISHED"}),
+        "total_users": counts["total_users"],
+        "total_companies": counts["total_companies"],
+        "total_jobs": counts["total_jobs"],
+        "total_applications": counts["total_applications"],
+        "active_users": counts["active_users"],
+        "published_jobs": counts["published_jobs"],
         "users_by_role": {
-            "admins": user_repo.count_by_role("ADMIN"),
-            "employers": user_repo.count_by_role("EMPLOYER"),
-            "candidates": user_repo.count_by_role("CANDIDATE")
+            "admins": counts["admins"],
+            "employers": counts["employers"],
+            "candidates": counts["candidates"]
         }
     }
     
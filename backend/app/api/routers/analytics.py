@@ -0,0 +1,56 @@
+"""
+Analytics router for IQAutoJobs.
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from structlog import get_logger
+
+from app.db.replicas import get_read_db
+from app.domain.models import AnalyticsFunnelResponse, AnalyticsSeriesResponse
+from app.services.analytics_service import AnalyticsService
+from app.repositories.analytics_repo import AnalyticsRepository
+from app.api.routers.auth import get_current_user
+from app.core.deadline import DeadlineRoute
+
+logger = get_logger()
+router = APIRouter(route_class=DeadlineRoute)
+
+
+async def get_analytics_service(db: Session = Depends(get_read_db)) -> AnalyticsService:
+    """Get analytics service instance; rollups are fine to read from a replica."""
+    return AnalyticsService(db, AnalyticsRepository(db))
+
+
+@router.get("/series", response_model=AnalyticsSeriesResponse)
+async def get_series(
+    metric: str = Query("applications", description="applications, jobs_published or status_<STATUS>"),
+    grain: str = Query("day", description="hour, day or week"),
+    start: Optional[datetime] = Query(None, description="Start of the range (default: 30 days before end)"),
+    end: Optional[datetime] = Query(None, description="End of the range, exclusive (default: now)"),
+    company_id: Optional[UUID] = Query(None, description="Limit to one company"),
+    job_id: Optional[UUID] = Query(None, description="Limit to one job"),
+    current_user = Depends(get_current_user),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    """Get a metric over time for a job, a company (its owner) or the whole site (admins)."""
+    return await analytics_service.get_series(
+        current_user, metric, grain, start, end, company_id=company_id, job_id=job_id
+    )
+
+
+@router.get("/funnel", response_model=AnalyticsFunnelResponse)
+async def get_funnel(
+    start: Optional[datetime] = Query(None, description="Start of the range (default: 30 days before end)"),
+    end: Optional[datetime] = Query(None, description="End of the range, exclusive (default: now)"),
+    company_id: Optional[UUID] = Query(None, description="Limit to one company"),
+    job_id: Optional[UUID] = Query(None, description="Limit to one job"),
+    current_user = Depends(get_current_user),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    """Get application status conversions per job and in total."""
+    return await analytics_service.get_funnel(
+        current_user, start, end, company_id=company_id, job_id=job_id
+    )
@@ -19,9 +19,11 @@ from app.repositories.user_repo import UserRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.api.routers.auth import get_current_user
 from app.core.errors import NotFoundError, ConflictError, FileUploadError
+from app.core.rate_limit import RateLimit
+from app.core.deadline import DeadlineRoute
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 async def get_application_service(db: Session = Depends(get_db)) -> ApplicationService:
@@ -73,8 +75,8 @@ async def get_application(
         application = await app_service.get_application_by_id(application_id)
         
         # Check if user has permission to view this application
-        if (application.job.company.owner_user_id != current_user.id and 
-            application.candidate_user_id != current_user.id):
+        if (application.job.company.owner.id != current_user.id and 
+            application.candidate.id != current_user.id):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You don't have permission to view this application")
         
         return application
@@ -82,7 +84,7 @@ async def get_application(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.post("/", response_model=ApplicationResponse)
+@router.post("/", response_model=ApplicationResponse, dependencies=[Depends(RateLimit("upload"))])
 async def create_application(
     job_id: str,
     cover_letter: Optional[str] = None,
@@ -6,7 +6,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from structlog import get_logger
 
-from app.db.base import get_db
+from app.db.base import get_db, release_connection
 from app.domain.models import (
     UserCreate, UserLogin, Token, PasswordResetRequest, PasswordReset,
     PasswordChange, UserResponse
@@ -17,26 +17,31 @@ from app.repositories.user_repo import UserRepository
 from app.repositories.token_repo import RefreshTokenRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.core.errors import AuthenticationError, ConflictError, NotFoundError
+from app.core.rate_limit import RateLimit
 from app.api.dependencies import get_auth_service
+from app.core.deadline import DeadlineRoute
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 security = HTTPBearer()
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthService = Depends(get_auth_service),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get current user from JWT token."""
     user = await auth_service.get_current_user(credentials.credentials)
     if not user:
         raise AuthenticationError("Invalid authentication credentials")
     
+    # Don't hold the connection while the endpoint does non-database work
+    await release_connection(db)
     return user
 
 
-@router.post("/register", response_model=dict)
+@router.post("/register", response_model=dict, dependencies=[Depends(RateLimit("auth", cost=5))])
 async def register(
     user_data: UserCreate,
     auth_service: AuthService = Depends(get_auth_service)
@@ -57,7 +62,7 @@ async def register(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Registration failed")
 
 
-@router.post("/login", response_model=dict)
+@router.post("/login", response_model=dict, dependencies=[Depends(RateLimit("auth", cost=5))])
 async def login(
     login_data: UserLogin,
     auth_service: AuthService = Depends(get_auth_service)
@@ -78,7 +83,7 @@ async def login(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Login failed")
 
 
-@router.post("/refresh", response_model=dict)
+@router.post("/refresh", response_model=dict, dependencies=[Depends(RateLimit("auth", cost=3))])
 async def refresh_token(
     refresh_token: str,
     auth_service: AuthService = Depends(get_auth_service)
@@ -94,7 +99,7 @@ async def refresh_token(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Token refresh failed")
 
 
-@router.post("/logout")
+@router.post("/logout", dependencies=[Depends(RateLimit("auth", cost=3, key_by="user"))])
 async def logout(
     refresh_token: str,
     current_user = Depends(get_current_user),
@@ -109,7 +114,7 @@ async def logout(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Logout failed")
 
 
-@router.post("/request-reset")
+@router.post("/request-reset", dependencies=[Depends(RateLimit("auth", cost=3))])
 async def request_password_reset(
     request_data: PasswordResetRequest,
     auth_service: AuthService = Depends(get_auth_service),
@@ -123,7 +128,7 @@ async def request_password_reset(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Password reset request failed")
 
 
-@router.post("/reset")
+@router.post("/reset", dependencies=[Depends(RateLimit("auth", cost=5))])
 async def reset_password(
     reset_data: PasswordReset,
     auth_service: AuthService = Depends(get_auth_service)
@@ -141,7 +146,7 @@ async def reset_password(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Password reset failed")
 
 
-@router.post("/change-password")
+@router.post("/change-password", dependencies=[Depends(RateLimit("auth", cost=5, key_by="both"))])
 async def change_password(
     password_data: PasswordChange,
     current_user = Depends(get_current_user),
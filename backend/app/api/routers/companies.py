@@ -7,17 +7,22 @@ from sqlalchemy.orm import Session
 from structlog import get_logger
 
 from app.db.base import get_db
-from app.domain.models import CompanyCreate, CompanyUpdate, CompanyResponse
+from app.db.replicas import get_read_db
+from app.domain.models import CompanyCreate, CompanyUpdate, CompanyResponse, CompanySummaryResponse, JobSummaryResponse
 from app.services.company_service import CompanyService
 from app.services.file_service import FileService
 from app.repositories.company_repo import CompanyRepository
 from app.repositories.user_repo import UserRepository
 from app.repositories.audit_log_repo import AuditLogRepository
+from app.api.responses import json_bytes_response, model_response
 from app.api.routers.auth import get_current_user
 from app.core.errors import NotFoundError, ConflictError, FileUploadError
+from app.core.rate_limit import RateLimit
+from app.core.deadline import DeadlineRoute, deadline
+from app.core.config import settings
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 def get_company_service(db: Session) -> CompanyService:
@@ -28,82 +33,85 @@ def get_company_service(db: Session) -> CompanyService:
     return CompanyService(db, company_repo, user_repo, audit_repo)
 
 
-@router.get("/", response_model=list[CompanyResponse])
+@router.get("/", response_model=list[CompanySummaryResponse])
 async def get_companies(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get companies with pagination."""
     company_service = get_company_service(db)
-    return company_service.get_companies(skip, limit)
+    return await company_service.get_companies(skip, limit)
 
 
 @router.get("/with-jobs", response_model=list[CompanyResponse])
 async def get_companies_with_jobs(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get companies with their jobs."""
     company_service = get_company_service(db)
-    return company_service.get_companies_with_jobs(skip, limit)
+    return await company_service.get_companies_with_jobs(skip, limit)
 
 
-@router.get("/search", response_model=list[CompanyResponse])
+@router.get("/search", response_model=list[CompanySummaryResponse], dependencies=[Depends(RateLimit("search"))])
+@deadline(settings.REQUEST_DEADLINE_SEARCH, max_concurrency=settings.SEARCH_MAX_CONCURRENCY)
 async def search_companies(
     search: str = Query(..., description="Search term"),
     industry: Optional[str] = Query(None, description="Industry filter"),
     location: Optional[str] = Query(None, description="Location filter"),
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Search companies."""
     company_service = get_company_service(db)
-    return company_service.search_companies(search, industry, location, skip, limit)
+    return await company_service.search_companies(search, industry, location, skip, limit)
 
 
-@router.get("/by-industry/{industry}", response_model=list[CompanyResponse])
+@router.get("/by-industry/{industry}", response_model=list[CompanySummaryResponse], dependencies=[Depends(RateLimit("search"))])
+@deadline(settings.REQUEST_DEADLINE_SEARCH, max_concurrency=settings.SEARCH_MAX_CONCURRENCY)
 async def get_companies_by_industry(
     industry: str,
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get companies by industry."""
     company_service = get_company_service(db)
-    return company_service.get_companies_by_industry(industry, skip, limit)
+    return await company_service.get_companies_by_industry(industry, skip, limit)
 
 
-@router.get("/by-location/{location}", response_model=list[CompanyResponse])
+@router.get("/by-location/{location}", response_model=list[CompanySummaryResponse], dependencies=[Depends(RateLimit("search"))])
+@deadline(settings.REQUEST_DEADLINE_SEARCH, max_concurrency=settings.SEARCH_MAX_CONCURRENCY)
 async def get_companies_by_location(
     location: str,
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get companies by location."""
     company_service = get_company_service(db)
-    return company_service.get_companies_by_location(location, skip, limit)
+    return await company_service.get_companies_by_location(location, skip, limit)
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
-async def get_company(company_id: str, db: Session = Depends(get_db)):
+async def get_company(company_id: str, db: Session = Depends(get_read_db)):
     """Get company by ID."""
     company_service = get_company_service(db)
     
     try:
-        return company_service.get_company_by_id(company_id)
+        return await company_service.get_company_by_id(company_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/slug/{slug}", response_model=CompanyResponse)
-async def get_company_by_slug(slug: str, db: Session = Depends(get_db)):
+async def get_company_by_slug(slug: str, db: Session = Depends(get_read_db)):
     """Get company by slug."""
     company_service = get_company_service(db)
-    company = company_service.get_company_by_slug(slug)
+    company = await company_service.get_company_by_slug(slug)
     if not company:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
     return company
@@ -113,7 +121,7 @@ async def get_company_by_slug(slug: str, db: Session = Depends(get_db)):
 async def get_my_company(current_user = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get current user's company."""
     company_service = get_company_service(db)
-    company = company_service.get_company_by_owner(current_user.id)
+    company = await company_service.get_company_by_owner(current_user.id)
     if not company:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
     return company
@@ -129,7 +137,7 @@ async def create_company(
     company_service = get_company_service(db)
     
     try:
-        return company_service.create_company(company_data, current_user.id)
+        return await company_service.create_company(company_data, current_user.id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ConflictError as e:
@@ -150,7 +158,7 @@ async def update_company(
     company_service = get_company_service(db)
     
     try:
-        return company_service.update_company(company_id, company_data, current_user.id)
+        return await company_service.update_company(company_id, company_data, current_user.id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ConflictError as e:
@@ -160,7 +168,7 @@ async def update_company(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Company update failed")
 
 
-@router.post("/{company_id}/logo")
+@router.post("/{company_id}/logo", dependencies=[Depends(RateLimit("upload"))])
 async def upload_company_logo(
     company_id: str,
     file: UploadFile = File(...),
@@ -173,8 +181,8 @@ async def upload_company_logo(
     
     try:
         # Check if user owns the company
-        company = company_service.get_company_by_id(company_id)
-        if company.owner_user_id != current_user.id:
+        company = await company_service.get_company_by_id(company_id)
+        if company.owner.id != current_user.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You don't have permission to upload logo for this company")
         
         # Validate file
@@ -214,15 +222,17 @@ async def upload_company_logo(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Logo upload failed")
 
 
-@router.get("/{company_id}/jobs")
+@router.get("/{company_id}/jobs", response_model=list[JobSummaryResponse])
 async def get_company_jobs(
     company_id: str,
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get jobs for a company."""
-    from app.api.routers.jobs import get_job_service
+    from app.api.routers.jobs import get_read_job_service, serve_job_fragments
     
-    job_service = get_job_service(db)
-    return job_service.get_jobs_by_company(company_id, skip, limit)
\ No newline at end of file
+    job_service = await get_read_job_service(db)
+    if serve_job_fragments():
+        return json_bytes_response(await job_service.get_jobs_by_company_json(company_id, skip, limit))
+    return model_response(await job_service.get_jobs_by_company(company_id, skip, limit), list[JobSummaryResponse])
\ No newline at end of file
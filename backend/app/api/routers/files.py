@@ -2,23 +2,22 @@
 Files router for IQAutoJobs.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
 from structlog import get_logger
 
-from app.db.base import get_db
 from app.services.file_service import FileService
 from app.api.routers.auth import get_current_user
 from app.core.errors import FileUploadError
+from app.core.rate_limit import RateLimit
+from app.core.deadline import DeadlineRoute
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
-@router.post("/cv")
+@router.post("/cv", dependencies=[Depends(RateLimit("upload"))])
 async def upload_cv(
     file: UploadFile = File(...),
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user)
 ):
     """Upload CV file."""
     file_service = FileService()
@@ -63,8 +62,7 @@ async def upload_cv(
 @router.get("/cv/{file_key}")
 async def get_cv_url(
     file_key: str,
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user)
 ):
     """Get CV download URL."""
     file_service = FileService()
@@ -85,8 +83,7 @@ async def get_cv_url(
 @router.delete("/cv/{file_key}")
 async def delete_cv(
     file_key: str,
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user)
 ):
     """Delete CV file."""
     file_service = FileService()
@@ -117,8 +114,7 @@ async def delete_cv(
 @router.get("/cv/{file_key}/info")
 async def get_cv_info(
     file_key: str,
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user)
 ):
     """Get CV file information."""
     file_service = FileService()
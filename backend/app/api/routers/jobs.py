@@ -2,16 +2,18 @@
 Jobs router for IQAutoJobs.
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 from structlog import get_logger
 
 from app.db.base import get_db
+from app.db.replicas import get_read_db
 from app.domain.models import (
-    JobCreate, JobUpdate, JobResponse, JobSearchFilters, JobSearchResponse,
+    JobCreate, JobUpdate, JobResponse, JobSummaryResponse, JobSearchFilters, JobSearchResponse,
     JobStatus, EmploymentType
 )
-from app.services.job_service import JobService
+from app.services.job_service import JobService, job_fragments
 from app.services.company_service import CompanyService
 from app.services.auth_service import AuthService
 from app.repositories.job_repo import JobRepository
@@ -19,11 +21,15 @@ from app.repositories.company_repo import CompanyRepository
 from app.repositories.user_repo import UserRepository
 from app.repositories.token_repo import RefreshTokenRepository
 from app.repositories.audit_log_repo import AuditLogRepository
+from app.api.responses import json_bytes_response, model_response
 from app.api.routers.auth import get_current_user
 from app.core.errors import NotFoundError, ConflictError
+from app.core.rate_limit import RateLimit, get_token_subject
+from app.core.deadline import DeadlineRoute, deadline
+from app.core.config import settings
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 async def get_job_service(db: Session = Depends(get_db)) -> JobService:
@@ -34,8 +40,24 @@ async def get_job_service(db: Session = Depends(get_db)) -> JobService:
     return JobService(db, job_repo, company_repo, audit_repo)
 
 
-@router.get("/", response_model=JobSearchResponse)
+async def get_read_job_service(db: Session = Depends(get_read_db)) -> JobService:
+    """Get job service instance for read-only endpoints."""
+    job_repo = JobRepository(db)
+    company_repo = CompanyRepository(db)
+    audit_repo = AuditLogRepository(db)
+    return JobService(db, job_repo, company_repo, audit_repo)
+
+
+def serve_job_fragments() -> bool:
+    """Whether job reads are answered from cached JSON (see JobService.get_job_json)."""
+    return job_fragments.enabled and settings.TRUSTED_SERIALIZATION
+
+
+@router.get("/", response_model=JobSearchResponse, dependencies=[Depends(RateLimit("search"))])
+@deadline(settings.REQUEST_DEADLINE_SEARCH, max_concurrency=settings.SEARCH_MAX_CONCURRENCY)
 async def get_jobs(
+    request: Request,
+    response: Response,
     search: Optional[str] = Query(None, description="Search term"),
     location: Optional[str] = Query(None, description="Location filter"),
     type: Optional[EmploymentType] = Query(None, description="Employment type"),
@@ -45,9 +67,9 @@ async def get_jobs(
     salary_max: Optional[int] = Query(None, description="Maximum salary"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
-    job_service: JobService = Depends(get_job_service)
+    job_service: JobService = Depends(get_read_job_service)
 ):
-    """Get jobs with search and filters."""
+    """Get jobs with search and filters; signed-in users also get applied/saved flags."""
     filters = JobSearchFilters(
         search=search,
         location=location,
@@ -58,62 +80,80 @@ async def get_jobs(
         salary_max=salary_max
     )
     
-    return await job_service.search_jobs(filters, page, size)
+    # The flags only need the user's ID, which the token carries; no user lookup
+    user_id = get_token_subject(request)
+    if not user_id and serve_job_fragments():
+        return json_bytes_response(await job_service.search_jobs_json(filters, page, size), response)
+    return model_response(
+        await job_service.search_jobs(filters, page, size, UUID(user_id) if user_id else None),
+        JobSearchResponse,
+        response,
+    )
 
 
-@router.get("/recent", response_model=list[JobResponse])
+@router.get("/recent", response_model=list[JobSummaryResponse])
 async def get_recent_jobs(
     limit: int = Query(10, ge=1, le=50, description="Number of recent jobs"),
-    job_service: JobService = Depends(get_job_service)
+    job_service: JobService = Depends(get_read_job_service)
 ):
     """Get recent published jobs."""
-    return await job_service.get_recent_jobs(limit)
+    if serve_job_fragments():
+        return json_bytes_response(await job_service.get_recent_jobs_json(limit))
+    return model_response(await job_service.get_recent_jobs(limit), list[JobSummaryResponse])
 
 
-@router.get("/by-type/{employment_type}", response_model=list[JobResponse])
+@router.get("/by-type/{employment_type}", response_model=list[JobSummaryResponse])
 async def get_jobs_by_type(
     employment_type: EmploymentType,
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    job_service: JobService = Depends(get_job_service)
+    job_service: JobService = Depends(get_read_job_service)
 ):
     """Get jobs by employment type."""
-    return await job_service.get_jobs_by_type(employment_type, skip, limit)
+    return model_response(await job_service.get_jobs_by_type(employment_type, skip, limit), list[JobSummaryResponse])
 
 
-@router.get("/by-category/{category}", response_model=list[JobResponse])
+@router.get("/by-category/{category}", response_model=list[JobSummaryResponse], dependencies=[Depends(RateLimit("search"))])
+@deadline(settings.REQUEST_DEADLINE_SEARCH, max_concurrency=settings.SEARCH_MAX_CONCURRENCY)
 async def get_jobs_by_category(
     category: str,
+    response: Response,
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    job_service: JobService = Depends(get_job_service)
+    job_service: JobService = Depends(get_read_job_service)
 ):
     """Get jobs by category."""
-    return await job_service.get_jobs_by_category(category, skip, limit)
+    if serve_job_fragments():
+        return json_bytes_response(await job_service.get_jobs_by_category_json(category, skip, limit), response)
+    return model_response(await job_service.get_jobs_by_category(category, skip, limit), list[JobSummaryResponse], response)
 
 
-@router.get("/by-location/{location}", response_model=list[JobResponse])
+@router.get("/by-location/{location}", response_model=list[JobSummaryResponse], dependencies=[Depends(RateLimit("search"))])
+@deadline(settings.REQUEST_DEADLINE_SEARCH, max_concurrency=settings.SEARCH_MAX_CONCURRENCY)
 async def get_jobs_by_location(
     location: str,
+    response: Response,
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    job_service: JobService = Depends(get_job_service)
+    job_service: JobService = Depends(get_read_job_service)
 ):
     """Get jobs by location."""
-    return await job_service.get_jobs_by_location(location, skip, limit)
+    return model_response(await job_service.get_jobs_by_location(location, skip, limit), list[JobSummaryResponse], response)
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str, job_service: JobService = Depends(get_job_service)):
+async def get_job(job_id: UUID, job_service: JobService = Depends(get_read_job_service)):
     """Get job by ID."""
     try:
+        if serve_job_fragments():
+            return json_bytes_response(await job_service.get_job_json(job_id))
         return await job_service.get_job_by_id(job_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/slug/{slug}", response_model=JobResponse)
-async def get_job_by_slug(slug: str, job_service: JobService = Depends(get_job_service)):
+async def get_job_by_slug(slug: str, job_service: JobService = Depends(get_read_job_service)):
     """Get job by slug."""
     job = await job_service.get_job_by_slug(slug)
     if not job:
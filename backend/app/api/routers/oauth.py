@@ -17,9 +17,11 @@ from app.repositories.user_repo import UserRepository
 from app.repositories.token_repo import RefreshTokenRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.core.errors import AuthenticationError
+from app.core.rate_limit import RateLimit
+from app.core.deadline import DeadlineRoute
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 # Google OAuth URLs
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
@@ -62,7 +64,7 @@ async def google_login(
     return RedirectResponse(url=auth_url)
 
 
-@router.get("/google/callback")
+@router.get("/google/callback", dependencies=[Depends(RateLimit("auth", cost=3))])
 async def google_callback(
     code: str = Query(..., description="Authorization code from Google"),
     state: str = Query(..., description="State parameter for CSRF protection"),
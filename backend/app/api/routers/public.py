@@ -6,25 +6,26 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from structlog import get_logger
 
-from app.db.base import get_db
+from app.db.replicas import get_read_db
 from app.domain.models import UserResponse
 from app.services.user_service import UserService
 from app.repositories.user_repo import UserRepository
 from app.repositories.audit_log_repo import AuditLogRepository
+from app.core.deadline import DeadlineRoute
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.get("/users", response_model=List[UserResponse])
 async def get_public_users(
     skip: int = Query(0, ge=0, description="Skip count"),
     limit: int = Query(100, ge=1, le=100, description="Limit count"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get all users (public endpoint for demo purposes)."""
     user_repo = UserRepository(db)
     audit_repo = AuditLogRepository(db)
     user_service = UserService(db, user_repo, audit_repo)
     
-    return user_service.get_users(skip, limit)
+    return await user_service.get_users(skip, limit)
@@ -12,16 +12,14 @@ from app.repositories.user_repo import UserRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 from app.api.routers.auth import get_current_user
 from app.core.errors import NotFoundError
+from app.core.deadline import DeadlineRoute
 
 logger = get_logger()
-router = APIRouter()
+router = APIRouter(route_class=DeadlineRoute)
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+async def get_current_user_profile(current_user = Depends(get_current_user)):
     """Get current authenticated user's profile."""
     return UserResponse.from_orm(current_user)
 
@@ -38,7 +36,7 @@ async def update_current_user_profile(
     user_service = UserService(db, user_repo, audit_repo)
     
     try:
-        updated_user = user_service.update_user(current_user.id, user_data)
+        updated_user = await user_service.update_user(current_user.id, user_data)
         return updated_user
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,48 @@
+"""
+Background periodic tasks for IQAutoJobs.
+"""
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from structlog import get_logger
+
+logger = get_logger()
+
+
+class PeriodicTask:
+    """Run a coroutine function every ``interval`` seconds until stopped."""
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[None]], interval: float):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start running in the background on the current event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+            logger.info("Background task started", task=self.name, interval=self.interval)
+
+    async def stop(self) -> None:
+        """Cancel the task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Background task stopped", task=self.name)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.func()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # One failed run must not kill the loop
+                logger.error("Background task failed", task=self.name, error=str(e))
+            await asyncio.sleep(self.interval)
@@ -22,7 +22,30 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = Field(..., env="DATABASE_URL")
+    DB_POOL_SIZE: int = Field(default=5, env="DB_POOL_SIZE")  # connections kept open per worker
+    DB_MAX_OVERFLOW: int = Field(default=10, env="DB_MAX_OVERFLOW")  # extra connections allowed under load
+    DB_POOL_TIMEOUT: float = Field(default=30, env="DB_POOL_TIMEOUT")  # seconds to wait for a connection
+    DB_POOL_RECYCLE: int = Field(default=300, env="DB_POOL_RECYCLE")  # seconds before a connection is replaced
+    DB_POOL_LIVENESS: str = Field(default="idle", env="DB_POOL_LIVENESS")  # "pre_ping", "idle" or "none"
+    DB_POOL_PING_AFTER_IDLE: float = Field(default=30, env="DB_POOL_PING_AFTER_IDLE")  # seconds, for "idle" liveness
+    DATABASE_REPLICA_URLS: List[str] = Field(default=[], env="DATABASE_REPLICA_URLS")  # read replicas, JSON list
+    DB_REPLICA_MAX_LAG: float = Field(default=5, env="DB_REPLICA_MAX_LAG")  # seconds before a replica is skipped
+    DB_REPLICA_CHECK_INTERVAL: float = Field(default=5, env="DB_REPLICA_CHECK_INTERVAL")  # seconds
+    DB_REPLICA_CHECK_TIMEOUT: float = Field(default=2, env="DB_REPLICA_CHECK_TIMEOUT")  # seconds
+    DB_READ_YOUR_WRITES_WINDOW: float = Field(default=10, env="DB_READ_YOUR_WRITES_WINDOW")  # seconds on the primary after a write
     REDIS_URL: str = Field(default="redis://localhost:6379", env="REDIS_URL")
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.5, env="REDIS_SOCKET_TIMEOUT")  # seconds
+    DB_BULK_CHUNK_SIZE: int = Field(default=1000, env="DB_BULK_CHUNK_SIZE")  # rows per bulk INSERT/UPDATE
+    DB_BULK_COPY_THRESHOLD: int = Field(default=5000, env="DB_BULK_COPY_THRESHOLD")  # rows before bulk_insert uses COPY
+    DB_QUERY_CACHE_SIZE: int = Field(default=500, env="DB_QUERY_CACHE_SIZE")  # compiled SQL statements kept per engine
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(default=100, env="DB_PREPARED_STATEMENT_CACHE_SIZE")  # per connection
+    DB_PGBOUNCER: bool = Field(default=False, env="DB_PGBOUNCER")  # behind PgBouncer in transaction pooling mode
+    DB_REQUEST_FANOUT: int = Field(default=3, env="DB_REQUEST_FANOUT")  # connections one request may query on at once
+    DB_N_PLUS_ONE_THRESHOLD: int = Field(default=5, env="DB_N_PLUS_ONE_THRESHOLD")  # repeats of one statement per request
+    DB_SLOW_QUERY_MS: float = Field(default=200, env="DB_SLOW_QUERY_MS")  # log statements slower than this
+    DB_SLOW_QUERY_TOP_N: int = Field(default=50, env="DB_SLOW_QUERY_TOP_N")  # slow statement shapes kept in memory
+    DB_SLOW_QUERY_EXPLAIN_RATE: float = Field(default=0.1, env="DB_SLOW_QUERY_EXPLAIN_RATE")  # share of slow SELECTs explained
+    DB_SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = Field(default=5000, env="DB_SLOW_QUERY_EXPLAIN_TIMEOUT_MS")
     
     # R2/S3 Storage
     R2_ACCOUNT_ID: str = Field(..., env="R2_ACCOUNT_ID")
@@ -44,6 +67,48 @@ class Settings(BaseSettings):
     # Rate limiting
     RATE_LIMIT_REQUESTS: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     RATE_LIMIT_WINDOW: int = Field(default=60, env="RATE_LIMIT_WINDOW")  # seconds
+    RATE_LIMIT_BACKEND: str = Field(default="redis", env="RATE_LIMIT_BACKEND")  # "redis" or "memory"
+    RATE_LIMIT_REDIS_RETRY: int = Field(default=5, env="RATE_LIMIT_REDIS_RETRY")  # seconds before retrying Redis
+
+    # Per-class rate limit budgets (see app.core.rate_limit.RATE_LIMIT_POLICIES)
+    RATE_LIMIT_AUTH_REQUESTS: int = Field(default=30, env="RATE_LIMIT_AUTH_REQUESTS")
+    RATE_LIMIT_AUTH_WINDOW: int = Field(default=300, env="RATE_LIMIT_AUTH_WINDOW")  # seconds
+    RATE_LIMIT_SEARCH_REQUESTS: int = Field(default=120, env="RATE_LIMIT_SEARCH_REQUESTS")
+    RATE_LIMIT_SEARCH_WINDOW: int = Field(default=60, env="RATE_LIMIT_SEARCH_WINDOW")  # seconds
+    RATE_LIMIT_UPLOAD_REQUESTS: int = Field(default=30, env="RATE_LIMIT_UPLOAD_REQUESTS")
+    RATE_LIMIT_UPLOAD_WINDOW: int = Field(default=3600, env="RATE_LIMIT_UPLOAD_WINDOW")  # seconds
+    RATE_LIMIT_ADMIN_REQUESTS: int = Field(default=300, env="RATE_LIMIT_ADMIN_REQUESTS")
+    RATE_LIMIT_ADMIN_WINDOW: int = Field(default=60, env="RATE_LIMIT_ADMIN_WINDOW")  # seconds
+
+    # Request deadlines (seconds); routes without their own budget get REQUEST_DEADLINE
+    REQUEST_DEADLINE: float = Field(default=30, env="REQUEST_DEADLINE")
+    REQUEST_DEADLINE_SEARCH: float = Field(default=5, env="REQUEST_DEADLINE_SEARCH")
+    REQUEST_DEADLINE_ADMIN: float = Field(default=15, env="REQUEST_DEADLINE_ADMIN")
+    SEARCH_MAX_CONCURRENCY: int = Field(default=8, env="SEARCH_MAX_CONCURRENCY")  # per worker
+
+    # List views
+    LIST_DESCRIPTION_EXCERPT: int = Field(default=300, env="LIST_DESCRIPTION_EXCERPT")  # characters of description shown
+    JOB_LIST_ROW_READS: bool = Field(default=True, env="JOB_LIST_ROW_READS")  # hot job lists skip ORM objects
+    TRUSTED_SERIALIZATION: bool = Field(default=True, env="TRUSTED_SERIALIZATION")  # list responses skip re-validation
+    JOB_FRAGMENT_CACHE_SIZE: int = Field(default=20000, env="JOB_FRAGMENT_CACHE_SIZE")  # job JSON blobs per worker; 0 disables
+
+    # Job counters (applications_count, saves_count)
+    JOB_COUNTER_FOLD_INTERVAL: float = Field(default=5, env="JOB_COUNTER_FOLD_INTERVAL")  # seconds between folds
+    JOB_COUNTER_FOLD_BATCH: int = Field(default=5000, env="JOB_COUNTER_FOLD_BATCH")  # deltas folded per statement
+
+    # Admin dashboard
+    ADMIN_STATS_REFRESH_INTERVAL: float = Field(default=60, env="ADMIN_STATS_REFRESH_INTERVAL")  # seconds between recounts
+
+    # Analytics rollups
+    ANALYTICS_ROLLUP_INTERVAL: float = Field(default=60, env="ANALYTICS_ROLLUP_INTERVAL")  # seconds between aggregator runs
+    ANALYTICS_ROLLUP_LAG: int = Field(default=120, env="ANALYTICS_ROLLUP_LAG")  # seconds left for in-flight transactions
+    ANALYTICS_ROLLUP_WINDOW: int = Field(default=6 * 3600, env="ANALYTICS_ROLLUP_WINDOW")  # seconds of events per transaction
+    ANALYTICS_HOURLY_RETENTION_DAYS: int = Field(default=30, env="ANALYTICS_HOURLY_RETENTION_DAYS")
+
+    # Job archive
+    JOB_ARCHIVE_AFTER_DAYS: int = Field(default=180, env="JOB_ARCHIVE_AFTER_DAYS")  # days closed before a job is archived
+    JOB_ARCHIVE_BATCH: int = Field(default=500, env="JOB_ARCHIVE_BATCH")  # jobs moved per transaction
+    JOB_ARCHIVE_INTERVAL: float = Field(default=3600, env="JOB_ARCHIVE_INTERVAL")  # seconds between archiver runs
 
     # Email
     EMAIL_PROVIDER: str
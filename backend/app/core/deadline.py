@@ -0,0 +1,122 @@
+"""
+Request deadlines for IQAutoJobs.
+"""
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+from structlog import get_logger
+
+from app.core.config import settings
+from app.core.errors import DatabaseUnavailableError, DeadlineExceededError
+
+logger = get_logger()
+
+# Postgres SQLSTATE for a statement cancelled by statement_timeout
+QUERY_CANCELED = "57014"
+
+
+class Deadline:
+    """When the current request must be finished by."""
+
+    def __init__(self, budget: float, explicit: bool):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+        self.explicit = explicit
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def get_deadline() -> Optional[Deadline]:
+    """Get the current request's deadline, if any."""
+    return _deadline.get()
+
+
+def statement_timeout_ms() -> Optional[int]:
+    """
+    Get the statement timeout for a transaction starting now.
+
+    Only routes with their own budget get one; it's whatever is left of the
+    budget, so a transaction begun late in the request gets a shorter timeout.
+    """
+    deadline = _deadline.get()
+    if deadline is None or not deadline.explicit:
+        return None
+    return max(1, int(deadline.remaining() * 1000))
+
+
+def deadline(seconds: float, max_concurrency: Optional[int] = None) -> Callable:
+    """
+    Give a route its own time budget.
+
+    The budget covers the whole request. Any database transaction the request
+    opens gets a matching ``statement_timeout``, so Postgres stops a runaway
+    query and frees the connection even if the client is gone.
+    ``max_concurrency`` caps how many requests to this route may run at once
+    in a worker; queueing for a slot counts against the budget. That keeps
+    one slow query type from taking every pooled connection.
+    """
+    def decorator(func: Callable) -> Callable:
+        func.__deadline__ = seconds
+        func.__deadline_semaphore__ = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        return func
+    return decorator
+
+
+def is_statement_timeout(error: DBAPIError) -> bool:
+    """Check whether Postgres cancelled the statement for running too long."""
+    orig = getattr(error, "orig", None)
+    return getattr(orig, "sqlstate", None) == QUERY_CANCELED or getattr(orig, "pgcode", None) == QUERY_CANCELED
+
+
+class DeadlineRoute(APIRoute):
+    """
+    Route that runs its handler under a deadline.
+
+    Uses the endpoint's ``@deadline`` budget, or ``REQUEST_DEADLINE`` when it
+    has none. When the budget runs out, outstanding awaits are cancelled and
+    the client gets a 504; a statement timeout or an exhausted pool becomes a
+    503.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        budget = getattr(self.endpoint, "__deadline__", None)
+        semaphore = getattr(self.endpoint, "__deadline_semaphore__", None)
+        explicit = budget is not None
+        budget = budget if explicit else settings.REQUEST_DEADLINE
+
+        async def deadline_handler(request: Request):
+            token = _deadline.set(Deadline(budget, explicit))
+            timeout = asyncio.timeout(budget)
+            try:
+                async with timeout:
+                    if semaphore is None:
+                        return await handler(request)
+                    async with semaphore:
+                        return await handler(request)
+            except TimeoutError:
+                if not timeout.expired():
+                    raise
+                logger.warning("Request deadline exceeded", path=request.url.path, budget=budget)
+                raise DeadlineExceededError(f"Request exceeded its {budget:g}s deadline")
+            except DBAPIError as e:
+                if not is_statement_timeout(e):
+                    raise
+                logger.warning("Statement timeout", path=request.url.path, budget=budget)
+                raise DatabaseUnavailableError("Query took too long; try narrowing the request") from e
+            except PoolTimeoutError as e:
+                logger.warning("Database pool exhausted", path=request.url.path)
+                raise DatabaseUnavailableError("Database is busy; try again shortly") from e
+            finally:
+                _deadline.reset(token)
+
+        return deadline_handler
@@ -93,6 +93,28 @@ class RateLimitError(BaseHTTPException):
         )
 
 
+class DeadlineExceededError(BaseHTTPException):
+    """Request ran past its deadline."""
+    
+    def __init__(self, detail: str = "Request deadline exceeded"):
+        super().__init__(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            error_code="DEADLINE_EXCEEDED",
+            detail=detail,
+        )
+
+
+class DatabaseUnavailableError(BaseHTTPException):
+    """Database couldn't serve the request in time."""
+    
+    def __init__(self, detail: str = "Database unavailable"):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="DATABASE_UNAVAILABLE",
+            detail=detail,
+        )
+
+
 class FileUploadError(BaseHTTPException):
     """File upload error."""
     
@@ -0,0 +1,56 @@
+"""
+Serialized JSON fragment cache for IQAutoJobs.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class FragmentCache:
+    """
+    Per-worker LRU of serialized JSON fragments, such as one job's response.
+
+    Each key holds one fragment with the version it was built from (say,
+    the source rows' ``updated_at``). A lookup with any other version
+    misses, so a fragment stops being served as soon as a read sees its
+    source change, whichever worker changed it; storing the new version
+    replaces the old one. Nothing here awaits, so the event loop needs no
+    locking.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, bytes]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether fragments are kept at all (``max_entries`` above zero)."""
+        return self.max_entries > 0
+
+    def get(self, key: Hashable, version: Any) -> Optional[bytes]:
+        """Get the fragment stored under ``key`` if it was built from ``version``."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, version: Any, fragment: bytes) -> None:
+        """Store a fragment, evicting the least recently used ones past ``max_entries``."""
+        if not self.enabled:
+            return
+        self._entries[key] = (version, fragment)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the fragment stored under ``key``, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every fragment."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of fragments currently stored."""
+        return len(self._entries)
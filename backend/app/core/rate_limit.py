@@ -3,12 +3,17 @@ Rate limiting utilities for IQAutoJobs.
 """
 import time
 from collections import defaultdict
-from typing import Dict, List, Optional
-from fastapi import Request, HTTPException, status
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+from fastapi import Request, Response, HTTPException, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from structlog import get_logger
 
 from app.core.config import settings
-from app.core.errors import RateLimitError
+from app.core.errors import RateLimitError, base_exception_handler
+from app.core.redis import get_redis
+from app.core.security import verify_token
 
 logger = get_logger()
 
@@ -21,7 +26,7 @@ class RateLimiter:
         self.window = window
         self.buckets: Dict[str, List[float]] = defaultdict(list)
     
-    def is_allowed(self, key: str) -> bool:
+    def is_allowed(self, key: str, cost: int = 1) -> bool:
         """Check if request is allowed."""
         now = time.time()
         
@@ -30,8 +35,8 @@ class RateLimiter:
         bucket[:] = [timestamp for timestamp in bucket if timestamp > now - self.window]
         
         # Check if bucket has capacity
-        if len(bucket) < self.requests:
-            bucket.append(now)
+        if len(bucket) + cost <= self.requests:
+            bucket.extend([now] * cost)
             return True
         
         return False
@@ -43,25 +48,271 @@ class RateLimiter:
         bucket[:] = [timestamp for timestamp in bucket if timestamp > now - self.window]
         return max(0, self.requests - len(bucket))
 
+    async def hit(self, key: str, cost: int = 1) -> Tuple[bool, int]:
+        """Record a request and return whether it is allowed and the remaining budget."""
+        return await self.hit_all([key], cost)
+
+    async def hit_all(self, keys: List[str], cost: int = 1) -> Tuple[bool, int]:
+        """
+        Record a request against every key, but only if all of them have room.
+
+        A request one key denies spends none of the others' budgets. Returns
+        whether it is allowed and the smallest remaining budget.
+        """
+        now = time.time()
+        buckets = []
+        for key in keys:
+            bucket = self.buckets[key]
+            bucket[:] = [timestamp for timestamp in bucket if timestamp > now - self.window]
+            buckets.append(bucket)
+        
+        allowed = all(len(bucket) + cost <= self.requests for bucket in buckets)
+        if allowed:
+            for bucket in buckets:
+                bucket.extend([now] * cost)
+        return allowed, min(max(0, self.requests - len(bucket)) for bucket in buckets)
+
+
+# Sliding-window log kept in a sorted set per key. Pruning, counting and
+# recording the request happen in one script so concurrent workers can't
+# interleave between the check and the write. With several keys the request is
+# recorded against all of them only if every one has room, so one key's denial
+# doesn't spend the others' budgets. The server clock is used so hosts can't
+# disagree about where the window starts. A request of cost N records N members.
+SLIDING_WINDOW_SCRIPT = """
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local member = ARGV[3]
+local cost = tonumber(ARGV[4])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local counts = {}
+local allowed = 1
+for i, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    counts[i] = redis.call('ZCARD', key)
+    if counts[i] + cost > limit then
+        allowed = 0
+    end
+end
+
+local remaining = limit
+for i, key in ipairs(KEYS) do
+    if allowed == 1 then
+        for j = 1, cost do
+            redis.call('ZADD', key, now, member .. ':' .. j)
+        end
+        counts[i] = counts[i] + cost
+    end
+    redis.call('EXPIRE', key, math.ceil(window))
+    remaining = math.min(remaining, limit - counts[i])
+end
+
+return {allowed, remaining}
+"""
+
+
+class RedisRateLimiter:
+    """Rate limiter shared by every worker through Redis."""
+
+    def __init__(
+        self,
+        client: Redis,
+        requests: int = 100,
+        window: int = 60,
+        fallback: Optional[RateLimiter] = None,
+        prefix: str = "ratelimit",
+        retry_interval: float = 5.0,
+    ):
+        self.client = client
+        self.requests = requests
+        self.window = window
+        self.fallback = fallback or RateLimiter(requests=requests, window=window)
+        self.prefix = prefix
+        self.retry_interval = retry_interval
+        self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._retry_at = 0.0
+
+    async def hit(self, key: str, cost: int = 1) -> Tuple[bool, int]:
+        """Record a request and return whether it is allowed and the remaining budget."""
+        return await self.hit_all([key], cost)
+
+    async def hit_all(self, keys: List[str], cost: int = 1) -> Tuple[bool, int]:
+        """Record a request against every key if all have room; see ``RateLimiter.hit_all``."""
+        if time.monotonic() < self._retry_at:
+            return await self.fallback.hit_all(keys, cost)
+
+        try:
+            allowed, remaining = await self._script(
+                keys=[f"{self.prefix}:{key}" for key in keys],
+                args=[self.window, self.requests, uuid4().hex, cost],
+            )
+        except (RedisError, OSError) as e:
+            # Don't pay a connect timeout on every request while Redis is down.
+            self._retry_at = time.monotonic() + self.retry_interval
+            logger.warning(
+                "Redis rate limiter unavailable, falling back to local limits",
+                error=str(e),
+            )
+            return await self.fallback.hit_all(keys, cost)
+
+        return bool(allowed), max(0, int(remaining))
+
+
+def create_rate_limiter(
+    requests: int,
+    window: int,
+    backend: Optional[str] = None,
+    prefix: str = "ratelimit",
+):
+    """Create a rate limiter with custom settings."""
+    backend = backend or settings.RATE_LIMIT_BACKEND
+    if backend == "redis":
+        return RedisRateLimiter(
+            get_redis(),
+            requests=requests,
+            window=window,
+            prefix=prefix,
+            retry_interval=settings.RATE_LIMIT_REDIS_RETRY,
+        )
+    return RateLimiter(requests=requests, window=window)
+
 
 # Global rate limiter instance
-rate_limiter = RateLimiter(
+rate_limiter = create_rate_limiter(
     requests=settings.RATE_LIMIT_REQUESTS,
     window=settings.RATE_LIMIT_WINDOW
 )
 
 
-async def rate_limit_middleware(request: Request, call_next):
-    """Rate limiting middleware."""
-    # Get client identifier
+def get_client_ip(request: Request) -> str:
+    """Get the client IP, honouring the first X-Forwarded-For hop."""
     client_ip = request.client.host if request.client else "unknown"
     forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
         client_ip = forwarded.split(",")[0].strip()
+    return client_ip
+
+
+def get_token_subject(request: Request) -> Optional[str]:
+    """Get the user ID from the bearer token without touching the database."""
+    authorization = request.headers.get("authorization")
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    payload = verify_token(authorization[7:].strip(), "access")
+    return payload.get("sub") if payload else None
+
+
+class RateLimitPolicy:
+    """A named request budget shared by every endpoint in one limit class."""
+
+    def __init__(self, name: str, requests: int, window: int, key_by: str = "ip"):
+        if key_by not in ("ip", "user", "both"):
+            raise ValueError(f"Unknown rate limit key: {key_by}")
+        self.name = name
+        self.requests = requests
+        self.window = window
+        self.key_by = key_by
+        self.limiter = create_rate_limiter(
+            requests=requests, window=window, prefix=f"ratelimit:{name}"
+        )
+
+
+# Limit classes. Each has its own budget, so exhausting the auth budget with
+# password attempts never eats into search or browsing.
+RATE_LIMIT_POLICIES: Dict[str, RateLimitPolicy] = {
+    "auth": RateLimitPolicy(
+        "auth",
+        requests=settings.RATE_LIMIT_AUTH_REQUESTS,
+        window=settings.RATE_LIMIT_AUTH_WINDOW,
+        key_by="ip",
+    ),
+    "search": RateLimitPolicy(
+        "search",
+        requests=settings.RATE_LIMIT_SEARCH_REQUESTS,
+        window=settings.RATE_LIMIT_SEARCH_WINDOW,
+        key_by="ip",
+    ),
+    "upload": RateLimitPolicy(
+        "upload",
+        requests=settings.RATE_LIMIT_UPLOAD_REQUESTS,
+        window=settings.RATE_LIMIT_UPLOAD_WINDOW,
+        key_by="user",
+    ),
+    "admin": RateLimitPolicy(
+        "admin",
+        requests=settings.RATE_LIMIT_ADMIN_REQUESTS,
+        window=settings.RATE_LIMIT_ADMIN_WINDOW,
+        key_by="user",
+    ),
+}
+
+
+class RateLimit:
+    """
+    Route dependency charging a request against a limit class.
+
+    Usage: ``dependencies=[Depends(RateLimit("auth", cost=5))]``. The cost is
+    how many requests' worth of the class budget one call consumes, so
+    endpoints doing an argon2 hash can be throttled tighter than cheap ones
+    sharing the same class. ``key_by`` overrides the class default: "ip",
+    "user" (falls back to IP for anonymous callers) or "both", where the IP
+    and the user each have to be within budget.
+    """
+
+    def __init__(self, limit_class: str, cost: int = 1, key_by: Optional[str] = None):
+        if limit_class not in RATE_LIMIT_POLICIES:
+            raise ValueError(f"Unknown rate limit class: {limit_class}")
+        self.policy = RATE_LIMIT_POLICIES[limit_class]
+        self.cost = cost
+        self.key_by = key_by or self.policy.key_by
+
+    def _keys(self, request: Request) -> List[str]:
+        client_ip = get_client_ip(request)
+        if self.key_by == "ip":
+            return [f"ip:{client_ip}"]
+
+        user_id = get_token_subject(request)
+        if not user_id:
+            return [f"ip:{client_ip}"]
+        if self.key_by == "user":
+            return [f"user:{user_id}"]
+        return [f"ip:{client_ip}", f"user:{user_id}"]
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        # Every key is checked before any is charged, so a request the user's
+        # budget denies doesn't spend the budget of everyone behind its IP
+        keys = self._keys(request)
+        allowed, remaining = await self.policy.limiter.hit_all(keys, self.cost)
+        if not allowed:
+            logger.warning(
+                "Rate limit exceeded",
+                limit_class=self.policy.name,
+                keys=keys,
+                cost=self.cost,
+                url=str(request.url),
+                method=request.method,
+            )
+            raise RateLimitError(
+                f"Rate limit exceeded for {self.policy.name} requests. "
+                f"Try again in {self.policy.window} seconds."
+            )
+
+        response.headers["X-RateLimit-Class"] = self.policy.name
+        response.headers["X-RateLimit-Class-Limit"] = str(self.policy.requests)
+        response.headers["X-RateLimit-Class-Remaining"] = str(remaining)
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    """Rate limiting middleware."""
+    # Get client identifier
+    client_ip = get_client_ip(request)
     
     # Check rate limit
-    if not rate_limiter.is_allowed(client_ip):
-        remaining = rate_limiter.get_remaining(client_ip)
+    allowed, remaining = await rate_limiter.hit(client_ip)
+    if not allowed:
         logger.warning(
             "Rate limit exceeded",
             client_ip=client_ip,
@@ -70,20 +321,16 @@ async def rate_limit_middleware(request: Request, call_next):
             method=request.method,
         )
         
-        raise RateLimitError(
-            f"Rate limit exceeded. {remaining} requests remaining."
+        # Exceptions raised from middleware bypass the app's exception handlers
+        return await base_exception_handler(
+            request,
+            RateLimitError(f"Rate limit exceeded. {remaining} requests remaining."),
         )
     
     # Add rate limit headers
     response = await call_next(request)
-    remaining = rate_limiter.get_remaining(client_ip)
     response.headers["X-RateLimit-Limit"] = str(settings.RATE_LIMIT_REQUESTS)
     response.headers["X-RateLimit-Remaining"] = str(remaining)
     response.headers["X-RateLimit-Reset"] = str(int(time.time()) + settings.RATE_LIMIT_WINDOW)
     
     return response
-
-
-def create_rate_limiter(requests: int, window: int):
-    """Create a rate limiter with custom settings."""
-    return RateLimiter(requests=requests, window=window)
\ No newline at end of file
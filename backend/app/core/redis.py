@@ -0,0 +1,35 @@
+"""
+Shared Redis client for IQAutoJobs.
+"""
+from typing import Optional
+
+from redis.asyncio import Redis
+from structlog import get_logger
+
+from app.core.config import settings
+
+logger = get_logger()
+
+# Created lazily so importing this module never opens a connection.
+_client: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Get the process-wide Redis client."""
+    global _client
+    if _client is None:
+        _client = Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the process-wide Redis client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Redis client closed")
@@ -0,0 +1,243 @@
+"""
+Admin dashboard statistics for IQAutoJobs.
+"""
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, func, inspect, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from structlog import get_logger
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.db.base import SessionLocal
+from app.db.models import Application, Company, Job, JobStatus, User, UserRole
+from app.db.replicas import replica_router
+
+logger = get_logger()
+
+STATS_FIELDS = (
+    "total_users", "total_companies", "total_jobs", "total_applications",
+    "active_users", "published_jobs", "admins", "employers", "candidates",
+)
+ROLE_FIELDS = {UserRole.ADMIN: "admins", UserRole.EMPLOYER: "employers", UserRole.CANDIDATE: "candidates"}
+
+SNAPSHOT_KEY = "admin_stats"
+REFRESH_LOCK_KEY = "admin_stats:refresh"
+
+# Session.info key for deltas waiting on the transaction to commit
+PENDING_DELTAS = "admin_stats_deltas"
+
+# Deltas only touch an existing snapshot; an expired one is rebuilt from the
+# tables rather than started from partial counts.
+APPLY_DELTAS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    for i = 1, #ARGV, 2 do
+        redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+"""
+
+
+def stats_query():
+    """Every dashboard count in one statement, scanning each table once."""
+    users = select(
+        func.count().label("total_users"),
+        func.count().filter(User.is_active.is_(True)).label("active_users"),
+        func.count().filter(User.role == UserRole.ADMIN).label("admins"),
+        func.count().filter(User.role == UserRole.EMPLOYER).label("employers"),
+        func.count().filter(User.role == UserRole.CANDIDATE).label("candidates"),
+    ).select_from(User).subquery()
+    companies = select(func.count().label("total_companies")).select_from(Company).subquery()
+    jobs = select(
+        func.count().label("total_jobs"),
+        func.count().filter(Job.status == JobStatus.PUBLISHED).label("published_jobs"),
+    ).select_from(Job).subquery()
+    applications = select(func.count().label("total_applications")).select_from(Application).subquery()
+
+    return select(users, companies, jobs, applications).select_from(
+        users.join(companies, true()).join(jobs, true()).join(applications, true())
+    )
+
+
+async def compute_stats(db: AsyncSession) -> Dict[str, int]:
+    """Count everything the dashboard shows, straight from the tables."""
+    row = (await db.execute(stats_query())).one()
+    return {field: int(row._mapping[field]) for field in STATS_FIELDS}
+
+
+def _contribution(model: Any, values: Dict[str, Any]) -> Counter:
+    """What one row with these values adds to the counts."""
+    counts: Counter = Counter()
+    if model is User:
+        counts["total_users"] += 1
+        counts["active_users"] += bool(values["is_active"])
+        field = ROLE_FIELDS.get(values["role"])
+        if field:
+            counts[field] += 1
+    elif model is Company:
+        counts["total_companies"] += 1
+    elif model is Job:
+        counts["total_jobs"] += 1
+        counts["published_jobs"] += values["status"] == JobStatus.PUBLISHED
+    elif model is Application:
+        counts["total_applications"] += 1
+    return counts
+
+
+# Columns whose changes move a count, per model
+TRACKED = {User: ("is_active", "role"), Company: (), Job: ("status",), Application: ()}
+
+
+def _current(obj: Any) -> Dict[str, Any]:
+    return {name: getattr(obj, name) for name in TRACKED[type(obj)]}
+
+
+def _previous(obj: Any) -> Dict[str, Any]:
+    state = inspect(obj)
+    values = {}
+    for name in TRACKED[type(obj)]:
+        history = state.attrs[name].history
+        values[name] = history.deleted[0] if history.deleted else getattr(obj, name)
+    return values
+
+
+def record_stats_delta(db: AsyncSession, **deltas: int) -> None:
+    """
+    Record a change to the counts made outside the ORM unit of work.
+
+    Inserts, deletes and attribute changes of ORM objects are picked up on
+    flush; writes done with UPDATE statements (state transitions) call this.
+    The delta is applied once the transaction commits.
+    """
+    db.info.setdefault(PENDING_DELTAS, Counter()).update(deltas)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flush_deltas(session, flush_context):
+    deltas: Counter = Counter()
+    for obj in session.new:
+        if type(obj) in TRACKED:
+            deltas.update(_contribution(type(obj), _current(obj)))
+    for obj in session.deleted:
+        if type(obj) in TRACKED:
+            deltas.subtract(_contribution(type(obj), _current(obj)))
+    for obj in session.dirty:
+        if type(obj) in TRACKED and TRACKED[type(obj)]:
+            deltas.update(_contribution(type(obj), _current(obj)))
+            deltas.subtract(_contribution(type(obj), _previous(obj)))
+    deltas = Counter({field: delta for field, delta in deltas.items() if delta})
+    if deltas:
+        session.info.setdefault(PENDING_DELTAS, Counter()).update(deltas)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_deltas(session):
+    deltas = session.info.pop(PENDING_DELTAS, None)
+    if deltas:
+        admin_stats.apply_soon(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_deltas(session):
+    session.info.pop(PENDING_DELTAS, None)
+
+
+class AdminStatsSnapshot:
+    """
+    The dashboard counts, kept up to date without counting on every request.
+
+    The snapshot lives in a Redis hash shared by all workers. Committed
+    writes add their deltas to it as they happen, and one worker per
+    ``ADMIN_STATS_REFRESH_INTERVAL`` recounts from the tables to correct any
+    drift (a delta lost to a crash, or a bulk write that bypassed the ORM).
+    Each worker also keeps its own copy, used while Redis is down.
+    """
+
+    def __init__(self, retry_interval: float = 5.0):
+        self.retry_interval = retry_interval
+        self._local: Optional[Dict[str, int]] = None
+        self._local_at = 0.0
+        self._retry_at = 0.0
+        self._tasks: set = set()
+
+    async def get(self, db: AsyncSession) -> Dict[str, int]:
+        """Get the counts, recounting with ``db`` only when there's no snapshot yet."""
+        if time.monotonic() >= self._retry_at:
+            try:
+                cached = await get_redis().hgetall(SNAPSHOT_KEY)
+                if len(cached) == len(STATS_FIELDS):
+                    return {key.decode(): int(value) for key, value in cached.items()}
+            except (RedisError, OSError) as e:
+                self._backoff(e)
+        if self._local is not None and time.monotonic() - self._local_at < settings.ADMIN_STATS_REFRESH_INTERVAL:
+            return dict(self._local)
+        return await self.refresh(db)
+
+    async def refresh(self, db: Optional[AsyncSession] = None) -> Dict[str, int]:
+        """Recount from the tables and replace the snapshot."""
+        if db is None:
+            # Background recounts are reads; let a replica take them
+            async with SessionLocal(bind=replica_router.choose()) as session:
+                stats = await compute_stats(session)
+        else:
+            stats = await compute_stats(db)
+
+        self._local, self._local_at = dict(stats), time.monotonic()
+        if time.monotonic() >= self._retry_at:
+            try:
+                async with get_redis().pipeline(transaction=True) as pipe:
+                    pipe.delete(SNAPSHOT_KEY)
+                    pipe.hset(SNAPSHOT_KEY, mapping=stats)
+                    # Let a snapshot nobody refreshes expire rather than drift forever
+                    pipe.expire(SNAPSHOT_KEY, max(1, int(settings.ADMIN_STATS_REFRESH_INTERVAL * 3)))
+                    await pipe.execute()
+            except (RedisError, OSError) as e:
+                self._backoff(e)
+        return stats
+
+    async def refresh_if_due(self) -> None:
+        """Recount, unless another worker already did this interval."""
+        interval = max(1, int(settings.ADMIN_STATS_REFRESH_INTERVAL))
+        if time.monotonic() >= self._retry_at:
+            try:
+                if not await get_redis().set(REFRESH_LOCK_KEY, 1, nx=True, ex=interval):
+                    return
+            except (RedisError, OSError) as e:
+                self._backoff(e)
+        await self.refresh()
+
+    def apply_soon(self, deltas: Counter) -> None:
+        """Add committed deltas to the snapshot without blocking the caller."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.apply(deltas))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def apply(self, deltas: Counter) -> None:
+        """Add deltas to the local and shared snapshots."""
+        if self._local is not None:
+            for field, delta in deltas.items():
+                self._local[field] = self._local.get(field, 0) + delta
+        if time.monotonic() < self._retry_at:
+            return
+        args = [item for field, delta in deltas.items() for item in (field, delta)]
+        try:
+            client = get_redis()
+            await client.register_script(APPLY_DELTAS_SCRIPT)(keys=[SNAPSHOT_KEY], args=args)
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+
+    def _backoff(self, error: Exception) -> None:
+        self._retry_at = time.monotonic() + self.retry_interval
+        logger.warning("Admin stats snapshot unavailable in Redis", error=str(error))
+
+
+admin_stats = AdminStatsSnapshot()
@@ -1,38 +1,141 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy.engine.url import make_url
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 from app.core.config import settings
+from app.core.deadline import statement_timeout_ms
+from app.db.pool import InstrumentedAsyncPool, install_idle_ping
+
+
+def normalize_db_url(url: str) -> URL:
+    """Parse a database URL, making sure the async driver is used."""
+    parsed = make_url(url)
+    if parsed.drivername.startswith("postgresql"):
+        parsed = parsed._replace(drivername="postgresql+asyncpg")
+    return parsed
+
 
 # Programmatically ensure the correct async driver is used
-db_url = make_url(settings.DATABASE_URL)
-if db_url.drivername.startswith("postgresql"):
-    db_url = db_url._replace(drivername="postgresql+asyncpg")
-
-# Create SQLAlchemy engine
-engine = create_async_engine(
-    db_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.DEBUG,
-)
+db_url = normalize_db_url(settings.DATABASE_URL)
+
+
+def driver_connect_args(url: URL) -> dict:
+    """
+    Get asyncpg's prepared statement cache settings.
+
+    Each connection keeps prepared statements for the SQL it has run, so hot
+    queries skip parsing and planning on the server. Behind PgBouncer in
+    transaction pooling mode a statement prepared on one server connection
+    may be missing on the next, so the caches are disabled and statements get
+    unique names instead.
+    """
+    if not url.drivername.endswith("+asyncpg"):
+        return {}
+    if settings.DB_PGBOUNCER:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+
+
+def create_db_engine(url: URL) -> AsyncEngine:
+    """
+    Create an engine with the configured pool and driver settings.
+
+    Every worker process holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW
+    connections per engine; size them against the server's max_connections.
+    """
+    new_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_LIVENESS == "pre_ping",
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args=driver_connect_args(url),
+        echo=settings.DEBUG,
+    )
+    if settings.DB_POOL_LIVENESS == "idle":
+        install_idle_ping(new_engine, settings.DB_POOL_PING_AFTER_IDLE)
+    return new_engine
+
 
-# Create session factory
+# Create SQLAlchemy engine for the primary
+engine = create_db_engine(db_url)
+
+# Create session factory. Objects stay usable after the request's commit.
 SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine, class_=AsyncSession
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine, class_=AsyncSession
 )
 
 # Create base class for models
 Base = declarative_base()
 
 
-async def get_db() -> AsyncSession:
-    """Get database session."""
+@event.listens_for(Session, "after_flush")
+def _record_flush_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_statement_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    # Bound every query in the transaction by what's left of the request's deadline
+    timeout_ms = statement_timeout_ms()
+    if timeout_ms is not None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+
+
+async def get_db(request: Request) -> AsyncSession:
+    """
+    Get the request's database session.
+
+    The session is the request's unit of work: repositories only flush, and
+    everything the endpoint wrote is committed here in one transaction once it
+    returns, or rolled back if it raised. Requests that committed a write are
+    flagged on ``request.state.db_wrote`` for read-your-writes routing.
+    """
     async with SessionLocal() as db:
-        yield db
+        try:
+            yield db
+            if db.in_transaction():
+                await db.commit()
+                if db.info.pop("wrote", False):
+                    request.state.db_wrote = True
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """
+    End a session's read-only transaction so its connection returns to the pool.
+
+    Sessions only check out a connection when they run their first statement,
+    and get one again for the next statement after this. Sessions holding
+    unflushed or uncommitted writes are left alone.
+    """
+    if not db.in_transaction() or db.info.get("wrote") or db.new or db.dirty or db.deleted:
+        return
+    # Commit rather than roll back: nothing was written, and unlike a rollback
+    # it leaves the loaded objects usable (expire_on_commit is off).
+    await db.commit()
 
 
 async def create_tables():
@@ -0,0 +1,82 @@
+"""
+Concurrent read queries for IQAutoJobs.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+
+ReadQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+# Extra connections all requests in this worker may borrow at once. Every
+# borrower already holds its request's connection, so lending out at most
+# half the pool leaves connections for requests that aren't waiting on a
+# second one; they finish and free theirs instead of every holder waiting.
+FANOUT_CONNECTIONS = (settings.DB_POOL_SIZE + max(settings.DB_MAX_OVERFLOW, 0)) // 2
+_borrowed = 0
+
+
+def _borrow() -> bool:
+    """Take one of the worker's fan-out connections, if one is free."""
+    global _borrowed
+    if _borrowed >= FANOUT_CONNECTIONS:
+        return False
+    _borrowed += 1
+    return True
+
+
+def _give_back() -> None:
+    """Return a fan-out connection taken with ``_borrow``."""
+    global _borrowed
+    _borrowed -= 1
+
+
+async def run_concurrently(
+    db: AsyncSession,
+    *queries: ReadQuery,
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """
+    Run independent read queries at the same time and return their results in order.
+
+    Each query is a callable taking a session. A session runs one statement
+    at a time, so the first query uses ``db`` and the others get short-lived
+    sessions on the same engine (primary or replica), each with its own
+    pooled connection. At most ``max_concurrency`` (default
+    ``DB_REQUEST_FANOUT``) run at once, so one request can't drain the pool,
+    and the worker's requests together borrow at most
+    ``FANOUT_CONNECTIONS``; when none is free a query waits its turn on
+    ``db`` instead of waiting for the pool while holding a connection.
+
+    The extra sessions don't see ``db``'s uncommitted changes; use this for
+    reads only. If one query fails, the others are cancelled and the error
+    propagates unchanged.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or settings.DB_REQUEST_FANOUT)
+    db_lock = asyncio.Lock()
+
+    async def run(query: ReadQuery, own_session: bool) -> Any:
+        async with semaphore:
+            if not (own_session and _borrow()):
+                async with db_lock:
+                    return await query(db)
+            try:
+                async with SessionLocal(bind=db.bind) as session:
+                    return await query(session)
+            finally:
+                _give_back()
+
+    tasks = [
+        asyncio.ensure_future(run(query, own_session=index > 0))
+        for index, query in enumerate(queries)
+    ]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
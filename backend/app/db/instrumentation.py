@@ -0,0 +1,114 @@
+"""
+Per-request SQL instrumentation for IQAutoJobs.
+"""
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog import get_logger
+
+from app.core.config import settings
+from app.db.slow_queries import SKIP_INSTRUMENTATION, slow_query_log
+
+logger = get_logger()
+
+
+class QueryStats:
+    """SQL statements, database time and rows seen during one request."""
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float, rows: int) -> None:
+        """Record one executed statement."""
+        self.statements += 1
+        self.db_time += elapsed
+        self.rows += max(rows, 0)
+        self.shapes[statement] += 1
+
+    def suspected_n_plus_one(self) -> Dict[str, int]:
+        """
+        Get statement shapes repeated often enough to look like N+1 loading.
+
+        Parameters are bound, so a query issued once per parent row shows up
+        as the same SQL text over and over.
+        """
+        threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+# Holds the current request's stats. SQLAlchemy runs the driver calls in a
+# greenlet that shares the caller's context, so engine events see it too.
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Get the stats being collected for the current request, if any."""
+    return _query_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if conn.get_execution_options().get(SKIP_INSTRUMENTATION):
+        return
+
+    elapsed = time.perf_counter() - context.query_start_time
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed, cursor.rowcount)
+    slow_query_log.observe(statement, parameters, elapsed, cursor.rowcount, executemany)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach the query counting and slow query events to an engine."""
+    if slow_query_log.engine is None:
+        slow_query_log.engine = engine
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+async def query_stats_middleware(request: Request, call_next):
+    """Count the SQL each request issues and report it."""
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        _query_stats.reset(token)
+
+    db_time_ms = round(stats.db_time * 1000, 2)
+    suspects = stats.suspected_n_plus_one()
+    logger.info(
+        "Request database usage",
+        method=request.method,
+        path=request.url.path,
+        statements=stats.statements,
+        db_time_ms=db_time_ms,
+        rows=stats.rows,
+    )
+    if suspects:
+        logger.warning(
+            "Suspected N+1 queries",
+            method=request.method,
+            path=request.url.path,
+            repeated={shape[:200]: count for shape, count in suspects.items()},
+        )
+
+    if settings.ENVIRONMENT == "development":
+        response.headers["X-DB-Queries"] = str(stats.statements)
+        response.headers["X-DB-Time-Ms"] = str(db_time_ms)
+        response.headers["X-DB-Rows"] = str(stats.rows)
+        response.headers["X-DB-N-Plus-One"] = str(len(suspects))
+
+    return response
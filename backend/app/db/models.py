@@ -7,10 +7,10 @@ from typing import Optional
 from uuid import uuid4
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Enum, ForeignKey, Integer, JSON, String, Text,
-    UniqueConstraint, func
+    Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, Text,
+    UniqueConstraint, func, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.base import Base
@@ -78,6 +78,17 @@ class User(Base):
     saved_jobs = relationship("SavedJob", back_populates="user")
     refresh_tokens = relationship("RefreshToken", back_populates="user")
     audit_logs = relationship("AuditLog", back_populates="actor")
+    
+    # Fetch updated_at through UPDATE ... RETURNING instead of a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_users_oauth_provider_oauth_id",
+            "oauth_provider",
+            "oauth_id",
+            postgresql_where=text("oauth_provider IS NOT NULL"),
+        ),
+    )
 
 
 class Company(Base):
@@ -85,7 +96,7 @@ class Company(Base):
     __tablename__ = "companies"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    owner_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    owner_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     slug = Column(String(255), unique=True, nullable=False, index=True)
     website = Column(String(500), nullable=True)
@@ -97,9 +108,14 @@ class Company(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
+    # Leading part of the description, filled in by list queries (see company_repo)
+    description_excerpt = query_expression()
+    
     # Relationships
     owner = relationship("User", back_populates="company")
     jobs = relationship("Job", back_populates="company")
+    
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class Job(Base):
@@ -107,7 +123,7 @@ class Job(Base):
     __tablename__ = "jobs"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     slug = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=False)
@@ -121,16 +137,41 @@ class Job(Base):
     status = Column(Enum(JobStatus), default=JobStatus.DRAFT, nullable=False)
     published_at = Column(DateTime(timezone=True), nullable=True)
     apply_email = Column(String(255), nullable=True)  # Optional email for applications
+    # Denormalized counters, folded in from job_counter_deltas (see job_counter_repo)
+    applications_count = Column(Integer, default=0, server_default="0", nullable=False)
+    saves_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
+    # Leading part of the description, filled in by list queries (see job_repo)
+    description_excerpt = query_expression()
+    
     # Relationships
     company = relationship("Company", back_populates="jobs")
     applications = relationship("Application", back_populates="job")
     
-    # Unique constraint for slug per company
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Unique constraint for slug per company; partial indexes for published listings
     __table_args__ = (
         UniqueConstraint('company_id', 'slug', name='uq_company_job_slug'),
+        Index(
+            "ix_jobs_published_at_published",
+            published_at.desc(),
+            postgresql_where=text("status = 'PUBLISHED'"),
+        ),
+        Index(
+            "ix_jobs_company_id_published",
+            company_id,
+            published_at.desc(),
+            postgresql_where=text("status = 'PUBLISHED'"),
+        ),
+        # Finds closed jobs due for the archive
+        Index(
+            "ix_jobs_updated_at_closed",
+            updated_at,
+            postgresql_where=text("status = 'CLOSED'"),
+        ),
     )
 
 
@@ -150,6 +191,12 @@ class Application(Base):
     # Relationships
     job = relationship("Job", back_populates="applications")
     candidate = relationship("User", back_populates="applications")
+    
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_applications_candidate_user_id", "candidate_user_id"),
+        Index("uq_applications_job_candidate", "job_id", "candidate_user_id", unique=True),
+    )
 
 
 class SavedJob(Base):
@@ -167,16 +214,76 @@ class SavedJob(Base):
     # Unique constraint for user-job combination
     __table_args__ = (
         UniqueConstraint('user_id', 'job_id', name='uq_user_saved_job'),
+        Index("ix_saved_jobs_job_id", "job_id"),
     )
 
 
+class JobArchive(Base):
+    """Closed job moved out of the live jobs table (see archive_repo)."""
+    __tablename__ = "jobs_archive"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    slug = Column(String(255), nullable=False)
+    description = Column(Text, nullable=False)
+    location = Column(String(255), nullable=False)
+    type = Column(Enum(EmploymentType), nullable=False)
+    category = Column(String(100), nullable=False)
+    experience_level = Column(String(50), nullable=False)
+    salary_min = Column(Integer, nullable=True)
+    salary_max = Column(Integer, nullable=True)
+    currency = Column(String(3), nullable=False)
+    status = Column(Enum(JobStatus), nullable=False)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    apply_email = Column(String(255), nullable=True)
+    applications_count = Column(Integer, nullable=False)
+    saves_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # Relationships
+    company = relationship("Company")
+
+
+class ApplicationArchive(Base):
+    """Application to an archived job, moved along with it."""
+    __tablename__ = "applications_archive"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs_archive.id"), nullable=False, index=True)
+    candidate_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    cv_key = Column(String(500), nullable=False)
+    cover_letter = Column(Text, nullable=True)
+    status = Column(Enum(ApplicationStatus), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # Relationships
+    job = relationship("JobArchive")
+    candidate = relationship("User")
+
+
+class JobCounterDelta(Base):
+    """Pending change to a job's counters, waiting to be folded into the job row."""
+    __tablename__ = "job_counter_deltas"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    applications = Column(Integer, default=0, nullable=False)
+    saves = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class RefreshToken(Base):
     """Refresh token model."""
     __tablename__ = "refresh_tokens"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    token_hash = Column(String(255), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    token_hash = Column(String(255), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     revoked = Column(Boolean, default=False, nullable=False)
@@ -198,4 +305,36 @@ class AuditLog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    actor = relationship("User", back_populates="audit_logs")
\ No newline at end of file
+    actor = relationship("User", back_populates="audit_logs")
+    
+    # The analytics aggregator reads the log in created_at windows
+    __table_args__ = (
+        Index("ix_audit_logs_created_at", "created_at"),
+    )
+
+
+class AnalyticsRollup(Base):
+    """Event count for one job, metric and hour or day (see analytics_repo)."""
+    __tablename__ = "analytics_rollups"
+    
+    # No foreign key: rollups outlive the job row when it is archived
+    job_id = Column(UUID(as_uuid=True), primary_key=True)
+    grain = Column(String(10), primary_key=True)  # "hour" or "day"
+    metric = Column(String(50), primary_key=True)  # e.g. "applications", "status_HIRED"
+    bucket = Column(DateTime(timezone=True), primary_key=True)  # start of the hour or UTC day
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    value = Column(Integer, default=0, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_analytics_rollups_company", "company_id", "grain", "metric", "bucket"),
+        Index("ix_analytics_rollups_metric", "grain", "metric", "bucket"),
+    )
+
+
+class AnalyticsWatermark(Base):
+    """How far an aggregator has rolled up its source."""
+    __tablename__ = "analytics_watermarks"
+    
+    name = Column(String(100), primary_key=True)
+    position = Column(DateTime(timezone=True), nullable=False)  # source rows before this are rolled up
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
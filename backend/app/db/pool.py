@@ -0,0 +1,132 @@
+"""
+Connection pool instrumentation for IQAutoJobs.
+"""
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+import greenlet
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from structlog import get_logger
+
+from app.core.config import settings
+
+logger = get_logger()
+
+# Upper bounds, in milliseconds, of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolStats:
+    """Checkout counters and wait-time histogram for one pool."""
+
+    def __init__(self):
+        self.waiters = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self.checkouts += 1
+        self.wait_total_ms += wait_ms
+        self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def histogram(self) -> Dict[str, int]:
+        """Cumulative bucket counts keyed by upper bound, Prometheus style."""
+        buckets = {}
+        total = 0
+        for bound, count in zip(list(WAIT_BUCKETS_MS) + ["+Inf"], self.wait_buckets):
+            total += count
+            buckets[str(bound)] = total
+        return buckets
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that tracks callers waiting for a connection.
+
+    The wait covers everything between asking for a connection and getting
+    one, including opening a new connection when the pool may still grow.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self._getting: set = set()
+
+    def _do_get(self):
+        # QueuePool._do_get retries by calling itself; only time the outer call.
+        current = greenlet.getcurrent()
+        if current in self._getting:
+            return super()._do_get()
+
+        self._getting.add(current)
+        self.stats.waiters += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self._getting.discard(current)
+            self.stats.waiters -= 1
+            self.stats.observe_wait((time.perf_counter() - started) * 1000)
+
+
+def install_idle_ping(engine: AsyncEngine, idle_seconds: float) -> None:
+    """
+    Ping connections on checkout only if they sat idle in the pool.
+
+    A cheaper liveness check than pre_ping, which costs a round trip on every
+    checkout: busy connections are handed out as they are, and ones idle long
+    enough for a failover or firewall to have dropped them are tested first.
+    A failed ping makes the pool discard the connection and try another.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            logger.warning("Discarding dead pooled connection", error=str(e))
+            raise exc.DisconnectionError() from e
+
+
+def pool_metrics(engine: AsyncEngine) -> Dict[str, Any]:
+    """Get live pool figures for the metrics endpoint."""
+    pool = engine.pool
+    metrics: Dict[str, Any] = {
+        "class": type(pool).__name__,
+        "status": pool.status(),
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        metrics.update(
+            size=pool.size(),
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            max_connections=pool.size() + max(settings.DB_MAX_OVERFLOW, 0),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, InstrumentedAsyncPool):
+        stats = pool.stats
+        metrics.update(
+            waiters=stats.waiters,
+            checkouts=stats.checkouts,
+            checkout_timeouts=stats.timeouts,
+            checkout_wait_ms_sum=round(stats.wait_total_ms, 2),
+            checkout_wait_ms_buckets=stats.histogram(),
+        )
+    return metrics
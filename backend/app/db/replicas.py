@@ -0,0 +1,195 @@
+"""
+Read-replica routing for IQAutoJobs.
+"""
+import asyncio
+import math
+import time
+from typing import Dict, List, Optional
+
+from fastapi import Request
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from structlog import get_logger
+
+from app.core.config import settings
+from app.core.rate_limit import get_token_subject
+from app.core.redis import get_redis
+from app.db.base import SessionLocal, create_db_engine, engine, normalize_db_url
+
+logger = get_logger()
+
+# Seconds of replay lag; zero when the replica has replayed everything it received
+REPLICATION_LAG_SQL = """
+SELECT CASE
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+class Replica:
+    """One read replica and its last known health."""
+
+    def __init__(self, url: str):
+        parsed = normalize_db_url(url)
+        self.name = parsed.render_as_string(hide_password=True)
+        self.engine = create_db_engine(parsed)
+        self.healthy = False
+        self.latency_ms = 0.0
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+        # A dropped connection takes the replica out of rotation at once
+        # instead of waiting for the next health check.
+        event.listen(self.engine.sync_engine, "handle_error", self._on_error)
+
+    def _on_error(self, exception_context) -> None:
+        if exception_context.is_disconnect:
+            self.healthy = False
+            self.last_error = str(exception_context.original_exception)
+
+    async def check(self, max_lag: float, timeout: float) -> None:
+        """Probe the replica and update its health."""
+        started = time.perf_counter()
+        try:
+            async with self.engine.connect() as conn:
+                result = await asyncio.wait_for(conn.exec_driver_sql(REPLICATION_LAG_SQL), timeout)
+                lag = float(result.scalar() or 0)
+        except Exception as e:
+            if self.healthy:
+                logger.warning("Read replica unhealthy", replica=self.name, error=str(e))
+            self.healthy = False
+            self.last_error = str(e)
+            return
+
+        self.latency_ms = (time.perf_counter() - started) * 1000
+        self.lag_seconds = lag
+        self.last_error = None if lag <= max_lag else f"replication lag {lag:.1f}s"
+        healthy = lag <= max_lag
+        if healthy != self.healthy:
+            logger.info("Read replica health changed", replica=self.name, healthy=healthy, lag_seconds=lag)
+        self.healthy = healthy
+
+
+class RecentWrites:
+    """
+    Users who just committed a write, so their reads go to the primary.
+
+    Kept in Redis so every worker sees the marker, with a per-process copy
+    that still covers the worker that took the write while Redis is down.
+    """
+
+    def __init__(self, window: float, retry_interval: float = 5.0):
+        self.window = window
+        self.retry_interval = retry_interval
+        self._local: Dict[str, float] = {}
+        self._retry_at = 0.0
+
+    async def mark(self, user_id: str) -> None:
+        now = time.monotonic()
+        self._local[user_id] = now + self.window
+        if len(self._local) > 10000:
+            self._local = {key: until for key, until in self._local.items() if until > now}
+
+        if now < self._retry_at:
+            return
+        try:
+            await get_redis().set(f"recent_write:{user_id}", 1, ex=max(1, math.ceil(self.window)))
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+
+    async def is_recent(self, user_id: str) -> bool:
+        now = time.monotonic()
+        if self._local.get(user_id, 0) > now:
+            return True
+        if now < self._retry_at:
+            return False
+        try:
+            return bool(await get_redis().exists(f"recent_write:{user_id}"))
+        except (RedisError, OSError) as e:
+            self._backoff(e)
+            return False
+
+    def _backoff(self, error: Exception) -> None:
+        self._retry_at = time.monotonic() + self.retry_interval
+        logger.warning("Read-your-writes markers unavailable in Redis", error=str(error))
+
+
+class ReplicaRouter:
+    """Picks the engine a read-only request should use."""
+
+    def __init__(self, primary: AsyncEngine, urls: List[str]):
+        self.primary = primary
+        self.replicas = [Replica(url) for url in urls]
+        self.recent_writes = RecentWrites(settings.DB_READ_YOUR_WRITES_WINDOW)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    async def check_health(self) -> None:
+        """Probe every replica concurrently."""
+        await asyncio.gather(*(
+            replica.check(settings.DB_REPLICA_MAX_LAG, settings.DB_REPLICA_CHECK_TIMEOUT)
+            for replica in self.replicas
+        ))
+
+    def choose(self) -> AsyncEngine:
+        """The least busy healthy replica, or the primary when none is healthy."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return self.primary
+        best = min(healthy, key=lambda r: (r.engine.pool.checkedout(), r.latency_ms))
+        return best.engine
+
+    async def engine_for(self, request: Request) -> AsyncEngine:
+        """Route a read, keeping a user who just wrote on the primary."""
+        if not self.enabled:
+            return self.primary
+        user_id = get_token_subject(request)
+        if user_id and await self.recent_writes.is_recent(user_id):
+            return self.primary
+        return self.choose()
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> List[Dict[str, object]]:
+        return [
+            {
+                "replica": replica.name,
+                "healthy": replica.healthy,
+                "latency_ms": round(replica.latency_ms, 2),
+                "lag_seconds": replica.lag_seconds,
+                "checked_out": replica.engine.pool.checkedout(),
+                "error": replica.last_error,
+            }
+            for replica in self.replicas
+        ]
+
+
+replica_router = ReplicaRouter(engine, settings.DATABASE_REPLICA_URLS)
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """
+    Get a session for a read-only endpoint.
+
+    Uses a healthy replica when any are configured, and the primary otherwise
+    or for a short window after the caller's own write. Nothing is committed.
+    """
+    bind = await replica_router.engine_for(request)
+    async with SessionLocal(bind=bind) as db:
+        yield db
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """Remember users whose request committed a write."""
+    response = await call_next(request)
+    if replica_router.enabled and getattr(request.state, "db_wrote", False):
+        user_id = get_token_subject(request)
+        if user_id:
+            await replica_router.recent_writes.mark(user_id)
+    return response
@@ -0,0 +1,221 @@
+"""
+Slow query recorder for IQAutoJobs.
+"""
+import asyncio
+import random
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import greenlet
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog import get_logger
+
+from app.core.config import settings
+
+logger = get_logger()
+
+# Connections carrying this execution option are ignored by the
+# instrumentation, so the EXPLAIN runs below don't record themselves.
+SKIP_INSTRUMENTATION = "skip_instrumentation"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?\b")
+# Expanded IN lists differ in length per call: IN ($1::UUID, $2::UUID, ...)
+_PARAMETER_LIST = re.compile(r"\(\s*\$\d+(?:::[\w ]+)?(?:\s*,\s*\$\d+(?:::[\w ]+)?)+\s*\)")
+# Reads that take row locks, and writes nested in a SELECT's CTEs; re-running
+# either under ANALYZE would lock or change rows behind the live transaction
+_NOT_READ_ONLY = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b|\b(?:INSERT|UPDATE|DELETE|MERGE)\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce a statement to its shape so variants of one query group together."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _PARAMETER_LIST.sub("(...)", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def find_origin() -> Optional[str]:
+    """
+    Find the repository (or service) method that issued the current statement.
+
+    Engine events run inside SQLAlchemy's greenlet, whose stack ends at the
+    sync adapter; the awaiting repository coroutine is on the parent
+    greenlet's stack, so both are walked.
+    """
+    frames = [sys._getframe(1)]
+    parent = greenlet.getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frames.append(parent.gr_frame)
+
+    fallback = None
+    for frame in frames:
+        while frame is not None:
+            filename = frame.f_code.co_filename.replace("\\", "/")
+            if "/app/repositories/" in filename or "/app/services/" in filename:
+                origin = f"{frame.f_code.co_qualname} ({filename.rsplit('/', 1)[-1]}:{frame.f_lineno})"
+                if "/app/repositories/" in filename:
+                    return origin
+                fallback = fallback or origin
+            frame = frame.f_back
+    return fallback
+
+
+class SlowQuery:
+    """The worst recorded run of one statement shape."""
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total_duration_ms = 0.0
+        self.max_duration_ms = 0.0
+        self.rows = 0
+        self.origin: Optional[str] = None
+        self.last_seen: Optional[datetime] = None
+        self.plan: Optional[Any] = None
+        self.plan_captured_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sql": self.sql,
+            "count": self.count,
+            "total_duration_ms": round(self.total_duration_ms, 2),
+            "max_duration_ms": round(self.max_duration_ms, 2),
+            "rows": self.rows,
+            "origin": self.origin,
+            "last_seen": self.last_seen,
+            "plan": self.plan,
+            "plan_captured_at": self.plan_captured_at,
+        }
+
+
+class SlowQueryLog:
+    """
+    Bounded record of the slowest statement shapes.
+
+    Keeps at most ``size`` shapes; when full, the shape with the smallest
+    worst-case duration is evicted. A sample of slow SELECTs is re-run under
+    EXPLAIN (ANALYZE, BUFFERS) in the background on a separate connection,
+    so the request that hit the slow query doesn't wait for the plan.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        size: int = 50,
+        explain_rate: float = 0.0,
+        explain_timeout_ms: int = 5000,
+    ):
+        self.threshold_ms = threshold_ms
+        self.size = size
+        self.explain_rate = explain_rate
+        self.explain_timeout_ms = explain_timeout_ms
+        self.engine: Optional[AsyncEngine] = None
+        self._entries: Dict[str, SlowQuery] = {}
+        self._lock = threading.Lock()
+        self._explaining: set = set()
+        self._tasks: set = set()
+
+    def observe(self, statement: str, parameters: Any, duration: float, rows: int, executemany: bool) -> None:
+        """Record a statement if it ran longer than the threshold."""
+        duration_ms = duration * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        sql = normalize_sql(statement)
+        origin = find_origin()
+        logger.warning(
+            "Slow query",
+            sql=sql[:1000],
+            duration_ms=round(duration_ms, 2),
+            rows=rows,
+            origin=origin,
+        )
+
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is None:
+                if len(self._entries) >= self.size:
+                    fastest = min(self._entries.values(), key=lambda e: e.max_duration_ms)
+                    if fastest.max_duration_ms >= duration_ms:
+                        return
+                    del self._entries[fastest.sql]
+                entry = self._entries[sql] = SlowQuery(sql)
+
+            entry.count += 1
+            entry.total_duration_ms += duration_ms
+            entry.last_seen = datetime.now(timezone.utc)
+            if duration_ms >= entry.max_duration_ms:
+                entry.max_duration_ms = duration_ms
+                entry.rows = max(rows, 0)
+                entry.origin = origin
+
+        if self._should_explain(statement, sql, executemany):
+            self._schedule_explain(sql, statement, parameters)
+
+    def top(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get recorded shapes, slowest first."""
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: e.max_duration_ms, reverse=True)
+            return [entry.to_dict() for entry in entries[:limit]]
+
+    def clear(self) -> None:
+        """Forget every recorded shape."""
+        with self._lock:
+            self._entries.clear()
+
+    def _should_explain(self, statement: str, sql: str, executemany: bool) -> bool:
+        if self.engine is None or executemany or sql in self._explaining:
+            return False
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return False  # ANALYZE executes the statement; never re-run writes
+        if _NOT_READ_ONLY.search(sql):
+            return False  # nor row-locking reads
+        return random.random() < self.explain_rate
+
+    def _schedule_explain(self, sql: str, statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # not running under the app's event loop
+        self._explaining.add(sql)
+        task = loop.create_task(self._explain(sql, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, sql: str, statement: str, parameters: Any) -> None:
+        try:
+            async with self.engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_INSTRUMENTATION: True})
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar_one()
+                await conn.rollback()
+        except Exception as e:
+            logger.warning("Failed to capture slow query plan", sql=sql[:1000], error=str(e))
+            return
+        finally:
+            self._explaining.discard(sql)
+
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is not None:
+                entry.plan = plan
+                entry.plan_captured_at = datetime.now(timezone.utc)
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.DB_SLOW_QUERY_MS,
+    size=settings.DB_SLOW_QUERY_TOP_N,
+    explain_rate=settings.DB_SLOW_QUERY_EXPLAIN_RATE,
+    explain_timeout_ms=settings.DB_SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+)
@@ -3,7 +3,7 @@ Domain models for IQAutoJobs.
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 
 from pydantic import BaseModel, Field, EmailStr, HttpUrl
@@ -139,6 +139,25 @@ class CompanyResponse(CompanyBase):
         from_attributes = True
 
 
+class CompanyBriefResponse(BaseModel):
+    """Company as shown alongside a job in list views."""
+    id: UUID
+    name: str
+    slug: str
+    logo_url: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class CompanySummaryResponse(CompanyBriefResponse):
+    """Company list item; ``description`` is only the leading excerpt."""
+    industry: Optional[str] = None
+    size: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = Field(None, validation_alias="description_excerpt")
+
+
 class JobBase(BaseModel):
     """Base job model."""
     title: str = Field(..., min_length=2, max_length=255)
@@ -182,6 +201,36 @@ class JobResponse(JobBase):
     created_at: datetime
     updated_at: datetime
     company: CompanyResponse
+    # May trail the true counts by up to JOB_COUNTER_FOLD_INTERVAL
+    applications_count: int = 0
+    saves_count: int = 0
+    
+    class Config:
+        from_attributes = True
+
+
+class JobSummaryResponse(BaseModel):
+    """Job list item; ``description`` is only the leading excerpt."""
+    id: UUID
+    title: str
+    slug: str
+    description: Optional[str] = Field(None, validation_alias="description_excerpt")
+    location: str
+    type: EmploymentType
+    category: str
+    experience_level: str
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    currency: str
+    status: JobStatus
+    published_at: Optional[datetime] = None
+    created_at: datetime
+    company: CompanyBriefResponse
+    applications_count: int = 0
+    saves_count: int = 0
+    # Set for signed-in users on search results, None otherwise
+    is_applied: Optional[bool] = None
+    is_saved: Optional[bool] = None
     
     class Config:
         from_attributes = True
@@ -268,7 +317,7 @@ class JobSearchFilters(BaseModel):
 
 class JobSearchResponse(BaseModel):
     """Job search response."""
-    jobs: List[JobResponse]
+    jobs: List[JobSummaryResponse]
     total: int
     page: int
     size: int
@@ -303,4 +352,51 @@ class AuditLogResponse(BaseModel):
     actor: Optional[UserResponse] = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class SlowQueryResponse(BaseModel):
+    """Slow query response model."""
+    sql: str
+    count: int
+    total_duration_ms: float
+    max_duration_ms: float
+    rows: int
+    origin: Optional[str] = None
+    last_seen: Optional[datetime] = None
+    plan: Optional[Any] = None
+    plan_captured_at: Optional[datetime] = None
+
+
+class AnalyticsPoint(BaseModel):
+    """One bucket of an analytics time series."""
+    bucket: datetime
+    value: int
+
+
+class AnalyticsSeriesResponse(BaseModel):
+    """Analytics time series response model."""
+    metric: str
+    grain: str
+    start: datetime
+    end: datetime
+    points: List[AnalyticsPoint]
+
+
+class AnalyticsFunnel(BaseModel):
+    """Applications and status changes, with each status's share of applications."""
+    counts: Dict[str, int]
+    conversion: Dict[str, float]
+
+
+class JobAnalyticsFunnel(AnalyticsFunnel):
+    """Application funnel for one job."""
+    job_id: UUID
+
+
+class AnalyticsFunnelResponse(BaseModel):
+    """Analytics funnel response model."""
+    start: datetime
+    end: datetime
+    total: AnalyticsFunnel
+    jobs: List[JobAnalyticsFunnel]
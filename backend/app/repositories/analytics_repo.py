@@ -0,0 +1,208 @@
+"""
+Analytics rollup repository for IQAutoJobs.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+from sqlalchemy import cast, delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import (
+    AnalyticsRollup, AnalyticsWatermark, Application, ApplicationArchive, ApplicationStatus, AuditLog, Job,
+    JobArchive
+)
+from app.repositories.base import BaseRepository
+
+# Watermark of the audit log aggregator
+AUDIT_LOG_SOURCE = "audit_logs"
+
+ROLLUP_GRAINS = ("hour", "day")
+FUNNEL_METRICS = ("applications",) + tuple(f"status_{status.value}" for status in ApplicationStatus)
+ROLLUP_METRICS = FUNNEL_METRICS + ("jobs_published",)
+
+
+def utc_trunc(grain: str, column):
+    """Start of the hour/day/week ``column`` falls in, on the UTC calendar."""
+    return func.timezone("UTC", func.date_trunc(grain, func.timezone("UTC", column)))
+
+
+def audit_log_events(start: datetime, end: datetime):
+    """
+    Audit log entries in [start, end) as (created_at, metric, job_id, company_id).
+
+    New applications, application status changes and job publications are
+    the events rolled up; each is attributed to its job and company. Jobs
+    and applications are looked up in both the live and the archive tables,
+    so events of a job archived before they were rolled up still count.
+    """
+    in_window = (AuditLog.created_at >= start, AuditLog.created_at < end)
+    subject_id = cast(AuditLog.subject_id, PG_UUID(as_uuid=True))
+    # One statement sees one snapshot, so an archived row is in exactly one of the pair
+    applications = union_all(
+        select(Application.id, Application.job_id),
+        select(ApplicationArchive.id, ApplicationArchive.job_id),
+    ).subquery("all_applications")
+    jobs = union_all(
+        select(Job.id, Job.company_id),
+        select(JobArchive.id, JobArchive.company_id),
+    ).subquery("all_jobs")
+    return union_all(
+        select(AuditLog.created_at, literal("applications").label("metric"), applications.c.job_id, jobs.c.company_id)
+        .join(applications, applications.c.id == subject_id)
+        .join(jobs, jobs.c.id == applications.c.job_id)
+        .where(AuditLog.action == "APPLICATION_CREATE", *in_window),
+        select(
+            AuditLog.created_at,
+            (literal("status_") + AuditLog.payload["status"].as_string()).label("metric"),
+            applications.c.job_id,
+            jobs.c.company_id,
+        )
+        .join(applications, applications.c.id == subject_id)
+        .join(jobs, jobs.c.id == applications.c.job_id)
+        .where(AuditLog.action == "APPLICATION_STATUS_UPDATE", *in_window),
+        select(AuditLog.created_at, literal("jobs_published").label("metric"), jobs.c.id.label("job_id"), jobs.c.company_id)
+        .join(jobs, jobs.c.id == subject_id)
+        .where(AuditLog.action == "JOB_PUBLISH", *in_window),
+    ).cte("events")
+
+
+class AnalyticsRepository(BaseRepository[AnalyticsRollup]):
+    """
+    Rollups of audit log events per job at hourly and daily grain.
+
+    The aggregator works through the audit log in time windows. Each window
+    is added to the rollups and the watermark moved past it in the same
+    transaction, so every event is counted once even if a run dies halfway.
+    Events younger than the lag are left for the next run: a transaction
+    still in flight may yet commit entries stamped inside the window.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(AnalyticsRollup, db)
+
+    async def lock_watermark(self, name: str) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Lock a source's watermark for this transaction.
+
+        Returns (position, database time now), or None if another worker
+        holds the lock. A new source starts at its oldest audit log entry.
+        """
+        await self.db.execute(
+            pg_insert(AnalyticsWatermark)
+            .values(
+                name=name,
+                position=select(func.coalesce(func.min(AuditLog.created_at), func.now())).scalar_subquery(),
+            )
+            .on_conflict_do_nothing(index_elements=[AnalyticsWatermark.name])
+        )
+        result = await self.db.execute(
+            select(AnalyticsWatermark.position, func.now())
+            .where(AnalyticsWatermark.name == name)
+            .with_for_update(skip_locked=True)
+        )
+        row = result.first()
+        return (row[0], row[1]) if row else None
+
+    async def roll_up_audit_logs(self, start: datetime, end: datetime) -> None:
+        """Add the events in [start, end) to the hourly and daily rollups."""
+        events = audit_log_events(start, end)
+        grains = [
+            select(
+                events.c.job_id,
+                literal(grain).label("grain"),
+                events.c.metric,
+                utc_trunc(grain, events.c.created_at).label("bucket"),
+                events.c.company_id,
+                func.count().label("value"),
+            ).group_by(events.c.job_id, events.c.metric, "bucket", events.c.company_id)
+            for grain in ROLLUP_GRAINS
+        ]
+        stmt = pg_insert(AnalyticsRollup).from_select(
+            ["job_id", "grain", "metric", "bucket", "company_id", "value"],
+            union_all(*grains),
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[AnalyticsRollup.job_id, AnalyticsRollup.grain, AnalyticsRollup.metric, AnalyticsRollup.bucket],
+                set_={"value": AnalyticsRollup.value + stmt.excluded.value},
+            )
+        )
+
+    async def set_watermark(self, name: str, position: datetime) -> None:
+        """Move a source's watermark (its row must be locked)."""
+        await self.db.execute(
+            AnalyticsWatermark.__table__.update()
+            .where(AnalyticsWatermark.name == name)
+            .values(position=position, updated_at=func.now())
+        )
+
+    async def prune_hourly(self, before: datetime) -> int:
+        """Drop hourly rollups older than ``before``; daily ones are kept."""
+        result = await self.db.execute(
+            delete(AnalyticsRollup).where(AnalyticsRollup.grain == "hour", AnalyticsRollup.bucket < before)
+        )
+        return result.rowcount
+
+    def _scope(self, query, company_id: Optional[UUID], job_id: Optional[UUID]):
+        if job_id is not None:
+            query = query.where(AnalyticsRollup.job_id == job_id)
+        if company_id is not None:
+            query = query.where(AnalyticsRollup.company_id == company_id)
+        return query
+
+    async def get_series(
+        self,
+        metric: str,
+        grain: str,
+        start: datetime,
+        end: datetime,
+        company_id: Optional[UUID] = None,
+        job_id: Optional[UUID] = None,
+    ) -> List[Tuple[datetime, int]]:
+        """
+        Get a metric's totals per bucket in [start, end), oldest first.
+
+        Weekly totals are summed from the daily rollups. Buckets with no
+        events are left out.
+        """
+        source_grain = "day" if grain == "week" else grain
+        bucket = AnalyticsRollup.bucket if grain == source_grain else utc_trunc(grain, AnalyticsRollup.bucket)
+        query = (
+            select(bucket.label("bucket"), func.sum(AnalyticsRollup.value))
+            .where(
+                AnalyticsRollup.grain == source_grain,
+                AnalyticsRollup.metric == metric,
+                AnalyticsRollup.bucket >= start,
+                AnalyticsRollup.bucket < end,
+            )
+            .group_by("bucket")
+            .order_by("bucket")
+        )
+        result = await self.db.execute(self._scope(query, company_id, job_id))
+        return [(row[0], int(row[1])) for row in result.all()]
+
+    async def get_funnel_counts(
+        self,
+        start: datetime,
+        end: datetime,
+        company_id: Optional[UUID] = None,
+        job_id: Optional[UUID] = None,
+        metrics: Sequence[str] = FUNNEL_METRICS,
+    ) -> Dict[UUID, Dict[str, int]]:
+        """Get each job's funnel metric totals over the days in [start, end)."""
+        query = (
+            select(AnalyticsRollup.job_id, AnalyticsRollup.metric, func.sum(AnalyticsRollup.value))
+            .where(
+                AnalyticsRollup.grain == "day",
+                AnalyticsRollup.metric.in_(metrics),
+                AnalyticsRollup.bucket >= start,
+                AnalyticsRollup.bucket < end,
+            )
+            .group_by(AnalyticsRollup.job_id, AnalyticsRollup.metric)
+        )
+        result = await self.db.execute(self._scope(query, company_id, job_id))
+        counts: Dict[UUID, Dict[str, int]] = {}
+        for job_id_, metric, value in result.all():
+            counts.setdefault(job_id_, {})[metric] = int(value)
+        return counts
@@ -1,13 +1,13 @@
 """
 Application repository for IQAutoJobs.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
 from uuid import UUID
 from sqlalchemy.orm import Session
 import sqlalchemy.orm
-from sqlalchemy import and_, select, func
+from sqlalchemy import select, func, lambda_stmt
 
-from app.db.models import Application, ApplicationStatus, Job
+from app.db.models import Application, ApplicationStatus, Company, Job
 from app.repositories.base import BaseRepository
 
 
@@ -20,11 +20,8 @@ class ApplicationRepository(BaseRepository[Application]):
     async def get_by_job_and_candidate(self, job_id: UUID, candidate_user_id: UUID) -> Optional[Application]:
         """Get application by job and candidate."""
         result = await self.db.execute(
-            select(Application).filter(
-                and_(
-                    Application.job_id == job_id,
-                    Application.candidate_user_id == candidate_user_id
-                )
+            lambda_stmt(
+                lambda: select(Application).where(Application.job_id == job_id, Application.candidate_user_id == candidate_user_id)
             )
         )
         return result.scalars().first()
@@ -32,14 +29,16 @@ class ApplicationRepository(BaseRepository[Application]):
     async def get_applications_by_job(self, job_id: UUID, skip: int = 0, limit: int = 100) -> List[Application]:
         """Get applications by job."""
         result = await self.db.execute(
-            select(Application).filter(Application.job_id == job_id).offset(skip).limit(limit)
+            select(Application).filter(Application.job_id == job_id)
+            .order_by(Application.created_at.desc(), Application.id).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
     async def get_applications_by_candidate(self, candidate_user_id: UUID, skip: int = 0, limit: int = 100) -> List[Application]:
         """Get applications by candidate."""
         result = await self.db.execute(
-            select(Application).filter(Application.candidate_user_id == candidate_user_id).offset(skip).limit(limit)
+            select(Application).filter(Application.candidate_user_id == candidate_user_id)
+            .order_by(Application.created_at.desc(), Application.id).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
@@ -73,7 +72,8 @@ class ApplicationRepository(BaseRepository[Application]):
             select(Application).options(
                 sqlalchemy.orm.joinedload(Application.job),
                 sqlalchemy.orm.joinedload(Application.candidate)
-            ).join(Application.job).filter(Job.company_id == company_id).offset(skip).limit(limit)
+            ).join(Application.job).filter(Job.company_id == company_id)
+            .order_by(Application.created_at.desc(), Application.id).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
@@ -129,14 +129,34 @@ class ApplicationRepository(BaseRepository[Application]):
         result = await self.db.execute(query)
         return result.scalar_one()
     
-    async def update_application_status(self, application_id: UUID, status: ApplicationStatus) -> Optional[Application]:
-        """Update application status."""
-        application = await self.get(application_id)
-        if application:
-            application.status = status
-            await self.db.commit()
-            await self.db.refresh(application)
-        return application
+    async def update_application_status(
+        self,
+        application_id: UUID,
+        status: ApplicationStatus,
+        owner_user_id: Optional[UUID] = None,
+        expected_status: Optional[List[ApplicationStatus]] = None,
+    ) -> Optional[Application]:
+        """
+        Update application status, with its job, company and candidate loaded.
+
+        With ``owner_user_id``, only an application to one of that user's
+        company's jobs is updated; with ``expected_status``, only one
+        currently in one of those statuses. Returns None when nothing matched.
+        """
+        where = []
+        if owner_user_id is not None:
+            where = [
+                Application.job_id == Job.id,
+                Job.company_id == Company.id,
+                Company.owner_user_id == owner_user_id,
+            ]
+        return await self.conditional_update(
+            application_id,
+            {"status": status},
+            expected={"status": expected_status} if expected_status else None,
+            where=where,
+            load=["job.company.owner", "candidate"],
+        )
     
     async def get_recent_applications(self, limit: int = 10) -> List[Application]:
         """Get recent applications."""
@@ -148,11 +168,20 @@ class ApplicationRepository(BaseRepository[Application]):
     async def has_candidate_applied(self, job_id: UUID, candidate_user_id: UUID) -> bool:
         """Check if candidate has applied to a job."""
         result = await self.db.execute(
-            select(Application).filter(
-                and_(
-                    Application.job_id == job_id,
-                    Application.candidate_user_id == candidate_user_id
-                )
+            lambda_stmt(
+                lambda: select(Application).where(Application.job_id == job_id, Application.candidate_user_id == candidate_user_id)
             )
         )
         return result.scalars().first() is not None
+    
+    async def get_applied_job_ids(self, candidate_user_id: UUID, job_ids: List[UUID]) -> Set[UUID]:
+        """Get which of the given jobs a candidate has applied to, in one query."""
+        if not job_ids:
+            return set()
+        result = await self.db.execute(
+            select(Application.job_id).where(
+                Application.candidate_user_id == candidate_user_id,
+                Application.job_id.in_(job_ids),
+            )
+        )
+        return set(result.scalars().all())
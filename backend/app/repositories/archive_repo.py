@@ -0,0 +1,147 @@
+"""
+Job archive repository for IQAutoJobs.
+"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.admin_stats import record_stats_delta
+from app.db.models import Application, ApplicationArchive, Job, JobArchive, JobStatus, SavedJob
+from app.repositories.base import BaseRepository
+
+jobs = Job.__table__
+applications = Application.__table__
+JOB_COLUMNS = [column.name for column in JobArchive.__table__.c if column.name != "archived_at"]
+APPLICATION_COLUMNS = [column.name for column in ApplicationArchive.__table__.c if column.name != "archived_at"]
+
+
+class JobArchiveRepository(BaseRepository[JobArchive]):
+    """
+    Moves long-closed jobs, with their applications, out of the live tables.
+
+    Archived jobs keep their IDs, so audit log entries and analytics rollups
+    that refer to them stay valid.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(JobArchive, db)
+
+    async def archive_closed_jobs(self, closed_before: datetime, limit: int) -> List[UUID]:
+        """
+        Move up to ``limit`` jobs closed before ``closed_before`` into the archive.
+
+        A closed job's ``updated_at`` is taken as when it was closed. The
+        jobs are locked first (skipping any another archiver holds), then
+        copied with their applications, and only then deleted, all in the
+        caller's transaction. The archived counters are recounted from the
+        rows, so pending counter deltas are accounted for. Saved-job
+        bookmarks of archived jobs are dropped. Returns the archived job IDs.
+        """
+        result = await self.db.execute(
+            select(jobs.c.id)
+            .where(jobs.c.status == JobStatus.CLOSED, jobs.c.updated_at < closed_before)
+            .order_by(jobs.c.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        job_ids = list(result.scalars().all())
+        if not job_ids:
+            return []
+
+        applied = (
+            select(func.count()).select_from(applications)
+            .where(applications.c.job_id == jobs.c.id)
+            .scalar_subquery()
+        )
+        saved = (
+            select(func.count()).select_from(SavedJob)
+            .where(SavedJob.job_id == jobs.c.id)
+            .scalar_subquery()
+        )
+        recounted = {"applications_count": applied, "saves_count": saved}
+        await self.db.execute(
+            insert(JobArchive.__table__).from_select(
+                JOB_COLUMNS,
+                select(*(recounted.get(name, jobs.c[name]) for name in JOB_COLUMNS))
+                .where(jobs.c.id.in_(job_ids)),
+            )
+        )
+        await self.db.execute(
+            insert(ApplicationArchive.__table__).from_select(
+                APPLICATION_COLUMNS,
+                select(*(applications.c[name] for name in APPLICATION_COLUMNS))
+                .where(applications.c.job_id.in_(job_ids)),
+            )
+        )
+
+        result = await self.db.execute(delete(applications).where(applications.c.job_id.in_(job_ids)))
+        record_stats_delta(self.db, total_jobs=-len(job_ids), total_applications=-result.rowcount)
+        await self.db.execute(delete(SavedJob.__table__).where(SavedJob.job_id.in_(job_ids)))
+        # Pending counter deltas go with the job (ON DELETE CASCADE)
+        await self.db.execute(delete(jobs).where(jobs.c.id.in_(job_ids)))
+        return job_ids
+
+
+class ApplicationArchiveRepository(BaseRepository[ApplicationArchive]):
+    """
+    Reads applications to archived jobs.
+
+    The job is loaded with each application (from ``jobs_archive``), so the
+    rows can be serialized like live applications.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(ApplicationArchive, db)
+
+    async def get_application_with_job(self, application_id: UUID) -> Optional[ApplicationArchive]:
+        """Get an archived application with its archived job."""
+        result = await self.db.execute(
+            select(ApplicationArchive)
+            .options(selectinload(ApplicationArchive.job))
+            .where(ApplicationArchive.id == application_id)
+        )
+        return result.scalars().first()
+
+    async def get_applications_by_candidate(
+        self, candidate_user_id: UUID, skip: int = 0, limit: int = 100
+    ) -> List[ApplicationArchive]:
+        """Get a candidate's archived applications, newest first, with their archived jobs."""
+        result = await self.db.execute(
+            select(ApplicationArchive)
+            .options(selectinload(ApplicationArchive.job))
+            .where(ApplicationArchive.candidate_user_id == candidate_user_id)
+            .order_by(ApplicationArchive.created_at.desc(), ApplicationArchive.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_applications_by_job(self, job_id: UUID, skip: int = 0, limit: int = 100) -> List[ApplicationArchive]:
+        """Get an archived job's applications, newest first, with the archived job."""
+        result = await self.db.execute(
+            select(ApplicationArchive)
+            .options(selectinload(ApplicationArchive.job))
+            .where(ApplicationArchive.job_id == job_id)
+            .order_by(ApplicationArchive.created_at.desc(), ApplicationArchive.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def get_applications_by_company(
+        self, company_id: UUID, skip: int = 0, limit: int = 100
+    ) -> List[ApplicationArchive]:
+        """Get applications to a company's archived jobs, newest first, with their archived jobs."""
+        result = await self.db.execute(
+            select(ApplicationArchive)
+            .options(selectinload(ApplicationArchive.job))
+            .join(JobArchive, JobArchive.id == ApplicationArchive.job_id)
+            .where(JobArchive.company_id == company_id)
+            .order_by(ApplicationArchive.created_at.desc(), ApplicationArchive.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
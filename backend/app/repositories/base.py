@@ -1,27 +1,42 @@
 """
 Base repository class for IQAutoJobs.
 """
-from typing import Generic, TypeVar, Type, Optional, List, Dict, Any
+from typing import Generic, TypeVar, Type, Optional, List, Dict, Any, Iterator, Sequence
 from uuid import UUID
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, or_, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload
 
+from app.core.config import settings
 from app.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Split a sequence into consecutive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 class BaseRepository(Generic[ModelType]):
-    """Base repository with common CRUD operations."""
+    """
+    Base repository with common CRUD operations.
+
+    Write methods flush but never commit; the owner of the session (the
+    ``get_db`` request dependency, or a script) commits the unit of work.
+    Server-generated columns come back through INSERT/UPDATE ... RETURNING
+    on flush, so no refresh SELECT is needed.
+    """
     
     def __init__(self, model: Type[ModelType], db: AsyncSession):
         self.model = model
         self.db = db
     
     async def get(self, id: UUID) -> Optional[ModelType]:
-        """Get record by ID."""
-        result = await self.db.execute(select(self.model).filter(self.model.id == id))
-        return result.scalar_one_or_none()
+        """Get record by ID, from the session's identity map when already loaded."""
+        return await self.db.get(self.model, id)
 
     async def get_all(self) -> List[ModelType]:
         """Get all objects."""
@@ -59,8 +74,7 @@ class BaseRepository(Generic[ModelType]):
         """Create a new record."""
         db_obj = self.model(**obj_in)
         self.db.add(db_obj)
-        await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self.db.flush()
         return db_obj
 
     async def update(self, db_obj: ModelType, obj_in: Dict[str, Any]) -> ModelType:
@@ -69,16 +83,56 @@ class BaseRepository(Generic[ModelType]):
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
-        await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self.db.flush()
         return db_obj
 
+    async def conditional_update(
+        self,
+        id: UUID,
+        values: Dict[str, Any],
+        expected: Optional[Dict[str, Any]] = None,
+        where: Sequence[Any] = (),
+        load: Sequence[str] = (),
+    ) -> Optional[ModelType]:
+        """
+        Update a record in one UPDATE ... RETURNING, only if it is as expected.
+
+        ``expected`` maps fields to the value they must currently hold (a list
+        means any of them); ``where`` adds further criteria, which may refer
+        to other tables (UPDATE ... FROM). Checking and writing in the same
+        statement means two concurrent transitions can't both succeed.
+        ``load`` names relationships to return with the record, dotted for
+        nested ones; they're joined onto the UPDATE in the same round trip.
+
+        Returns the updated record, or None when no row matched.
+        """
+        stmt = update(self.model).where(self.model.id == id, *where).values(**values)
+        for field, value in (expected or {}).items():
+            column = getattr(self.model, field)
+            stmt = stmt.where(column.in_(value) if isinstance(value, list) else column == value)
+
+        updated = aliased(self.model, stmt.returning(*self.model.__table__.c).cte("updated"))
+        query = select(updated)
+        for path in load:
+            entity, option = updated, None
+            for name in path.split("."):
+                attr = getattr(entity, name)
+                option = joinedload(attr) if option is None else option.joinedload(attr)
+                entity = attr.property.mapper.class_
+            query = query.options(option)
+
+        # The UPDATE runs as a SELECT over its CTE, which the session's write
+        # tracking (do_orm_execute) doesn't see as a write
+        self.db.info["wrote"] = True
+        result = await self.db.execute(query, execution_options={"populate_existing": True})
+        return result.scalar_one_or_none()
+
     async def delete(self, id: UUID) -> Optional[ModelType]:
         """Delete a record."""
         db_obj = await self.get(id)
         if db_obj:
             await self.db.delete(db_obj)
-            await self.db.commit()
+            await self.db.flush()
         return db_obj
 
     async def exists(self, id: UUID) -> bool:
@@ -140,3 +194,174 @@ class BaseRepository(Generic[ModelType]):
         """Get multiple records by IDs."""
         result = await self.db.execute(select(self.model).filter(self.model.id.in_(ids)))
         return result.scalars().all()
+
+    async def bulk_create(
+        self,
+        objs_in: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+    ) -> List[ModelType]:
+        """
+        Create many records with multi-row INSERT ... RETURNING.
+
+        Rows are sent ``chunk_size`` at a time and come back as ORM objects in
+        input order, server defaults included.
+        """
+        chunk_size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+
+        created: List[ModelType] = []
+        for chunk in chunked(objs_in, chunk_size):
+            result = await self.db.scalars(stmt, list(chunk))
+            created.extend(result.all())
+        return created
+
+    async def bulk_insert(
+        self,
+        objs_in: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        copy_threshold: Optional[int] = None,
+    ) -> int:
+        """
+        Insert many records without loading them back.
+
+        Batches of at least ``copy_threshold`` rows with the same keys are
+        streamed with COPY, which skips statement parsing and per-row
+        parameter handling entirely; smaller or mixed batches use multi-row
+        INSERTs. Returns the number of rows inserted.
+        """
+        copy_threshold = copy_threshold or settings.DB_BULK_COPY_THRESHOLD
+        if not objs_in:
+            return 0
+
+        if len(objs_in) >= copy_threshold:
+            copied = await self._copy_records(objs_in)
+            if copied is not None:
+                return copied
+
+        chunk_size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        for chunk in chunked(objs_in, chunk_size):
+            await self.db.execute(insert(self.model), list(chunk))
+        return len(objs_in)
+
+    async def bulk_upsert(
+        self,
+        objs_in: List[Dict[str, Any]],
+        conflict_columns: Optional[List[str]] = None,
+        constraint: Optional[str] = None,
+        update_fields: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[ModelType]:
+        """
+        Insert many records, updating the ones that already exist.
+
+        Conflicts are detected on ``conflict_columns`` (or the named
+        ``constraint``). ``update_fields`` are overwritten from the incoming
+        row, defaulting to every supplied column outside the conflict target;
+        pass an empty list to leave existing rows alone (ON CONFLICT DO
+        NOTHING), in which case only newly inserted rows are returned.
+        """
+        if not conflict_columns and not constraint:
+            raise ValueError("bulk_upsert needs conflict_columns or a constraint")
+        if not objs_in:
+            return []
+
+        chunk_size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        target = {"index_elements": conflict_columns} if conflict_columns else {"constraint": constraint}
+        if update_fields is None:
+            skip = set(conflict_columns or []) | {"id", "created_at"}
+            update_fields = [field for field in objs_in[0] if field not in skip]
+
+        stmt = pg_insert(self.model)
+        if update_fields:
+            set_ = {field: stmt.excluded[field] for field in update_fields}
+            # onupdate defaults don't fire for ON CONFLICT DO UPDATE
+            if hasattr(self.model, "updated_at") and "updated_at" not in set_:
+                set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(set_=set_, **target)
+        else:
+            stmt = stmt.on_conflict_do_nothing(**target)
+        stmt = stmt.returning(self.model)
+
+        upserted: List[ModelType] = []
+        for chunk in chunked(objs_in, chunk_size):
+            result = await self.db.scalars(
+                stmt, list(chunk), execution_options={"populate_existing": True}
+            )
+            upserted.extend(result.all())
+        return upserted
+
+    async def bulk_update_by_ids(
+        self,
+        ids: List[UUID],
+        obj_in: Dict[str, Any],
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """Apply the same field values to many records; returns the number updated."""
+        if not ids or not obj_in:
+            return 0
+
+        chunk_size = chunk_size or settings.DB_BULK_CHUNK_SIZE
+        updated = 0
+        for chunk in chunked(ids, chunk_size):
+            result = await self.db.execute(
+                update(self.model)
+                .where(self.model.id.in_(chunk))
+                .values(**obj_in)
+                .execution_options(synchronize_session="fetch")
+            )
+            updated += result.rowcount
+        return updated
+
+    async def _copy_records(self, objs_in: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        Stream rows into the table with asyncpg's COPY.
+
+        Returns None when the rows can't be copied (mixed keys, or a column
+        default that only SQL can compute), so the caller falls back to
+        INSERT. Columns left out fall back to their server defaults.
+        """
+        keys = list(objs_in[0])
+        if any(len(row) != len(keys) or any(key not in row for key in keys) for row in objs_in):
+            return None
+
+        table = self.model.__table__
+        defaults = {}
+        for column in table.columns:
+            if column.key in objs_in[0] or column.default is None:
+                continue
+            if column.default.is_scalar or column.default.is_callable:
+                defaults[column.key] = column.default
+            else:
+                return None
+
+        await self.db.flush()
+        conn = await self.db.connection()
+        dialect = conn.dialect
+        columns = [table.c[key] for key in keys] + [table.c[key] for key in defaults]
+        processors = [
+            column.type.dialect_impl(dialect).bind_processor(dialect) for column in columns
+        ]
+
+        def record(row: Dict[str, Any]) -> tuple:
+            values = [row[key] for key in keys]
+            for default in defaults.values():
+                values.append(default.arg if default.is_scalar else default.arg(None))
+            return tuple(
+                process(value) if process and value is not None else value
+                for process, value in zip(processors, values)
+            )
+
+        # The driver opens its transaction lazily on the first statement; make
+        # sure COPY runs inside the session's transaction, not autocommitted.
+        raw = await conn.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if not driver_connection.is_in_transaction():
+            await conn.exec_driver_sql("SELECT 1")
+
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=[record(row) for row in objs_in],
+            columns=[column.name for column in columns],
+            schema_name=table.schema,
+        )
+        return len(objs_in)
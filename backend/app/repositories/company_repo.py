@@ -5,11 +5,26 @@ from typing import Optional, List, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session
 import sqlalchemy.orm
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, func, lambda_stmt
 
+from app.core.config import settings
 from app.db.models import Company
 from app.repositories.base import BaseRepository
 
+# Columns list views show; descriptions come back as an excerpt instead
+COMPANY_BRIEF_COLUMNS = (Company.id, Company.name, Company.slug)
+COMPANY_SUMMARY_COLUMNS = COMPANY_BRIEF_COLUMNS + (Company.industry, Company.size, Company.location)
+
+
+def company_summary_options() -> tuple:
+    """Loader options for company list items; other columns raise if touched."""
+    return (
+        sqlalchemy.orm.load_only(*COMPANY_SUMMARY_COLUMNS, raiseload=True),
+        sqlalchemy.orm.with_expression(
+            Company.description_excerpt, func.left(Company.description, settings.LIST_DESCRIPTION_EXCERPT)
+        ),
+    )
+
 
 class CompanyRepository(BaseRepository[Company]):
     """Company repository with company-specific operations."""
@@ -19,14 +34,25 @@ class CompanyRepository(BaseRepository[Company]):
     
     async def get_by_slug(self, slug: str) -> Optional[Company]:
         """Get company by slug."""
-        result = await self.db.execute(select(Company).filter(Company.slug == slug))
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(Company).where(Company.slug == slug))
+        )
         return result.scalars().first()
     
     async def get_by_owner(self, owner_user_id: UUID) -> Optional[Company]:
         """Get company by owner."""
-        result = await self.db.execute(select(Company).filter(Company.owner_user_id == owner_user_id))
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(Company).where(Company.owner_user_id == owner_user_id))
+        )
         return result.scalars().first()
     
+    async def get_companies(self, skip: int = 0, limit: int = 100) -> List[Company]:
+        """Get company list items."""
+        result = await self.db.execute(
+            select(Company).options(*company_summary_options()).offset(skip).limit(limit)
+        )
+        return result.scalars().all()
+    
     async def get_with_jobs(self, company_id: UUID) -> Optional[Company]:
         """Get company with jobs relationship loaded."""
         result = await self.db.execute(
@@ -44,7 +70,7 @@ class CompanyRepository(BaseRepository[Company]):
     async def get_companies_with_jobs(self, skip: int = 0, limit: int = 100) -> List[Company]:
         """Get companies with their jobs."""
         result = await self.db.execute(
-            select(Company).options(sqlalchemy.orm.joinedload(Company.jobs)).offset(skip).limit(limit)
+            select(Company).options(sqlalchemy.orm.selectinload(Company.jobs)).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
@@ -57,7 +83,7 @@ class CompanyRepository(BaseRepository[Company]):
         limit: int = 100
     ) -> List[Company]:
         """Search companies by name, description, or other fields."""
-        query = select(Company)
+        query = select(Company).options(*company_summary_options())
         
         if search_term:
             search_conditions = [
@@ -79,14 +105,22 @@ class CompanyRepository(BaseRepository[Company]):
     async def get_companies_by_industry(self, industry: str, skip: int = 0, limit: int = 100) -> List[Company]:
         """Get companies by industry."""
         result = await self.db.execute(
-            select(Company).filter(Company.industry.ilike(f"%{industry}%")).offset(skip).limit(limit)
+            select(Company)
+            .options(*company_summary_options())
+            .filter(Company.industry.ilike(f"%{industry}%"))
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
     
     async def get_companies_by_location(self, location: str, skip: int = 0, limit: int = 100) -> List[Company]:
         """Get companies by location."""
         result = await self.db.execute(
-            select(Company).filter(Company.location.ilike(f"%{location}%")).offset(skip).limit(limit)
+            select(Company)
+            .options(*company_summary_options())
+            .filter(Company.location.ilike(f"%{location}%"))
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
     
@@ -0,0 +1,157 @@
+"""
+Job counter repository for IQAutoJobs.
+"""
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import bindparam, delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Application, Job, JobCounterDelta, SavedJob
+from app.repositories.base import BaseRepository
+
+jobs = Job.__table__
+deltas = JobCounterDelta.__table__
+
+
+class JobCounterRepository(BaseRepository[JobCounterDelta]):
+    """
+    Maintains the denormalized ``applications_count`` and ``saves_count`` on jobs.
+
+    Writers never touch the job row: each apply, save or unsave appends a
+    delta row in its own transaction, so a popular job doesn't make every
+    writer queue on one row lock. ``fold`` later adds the deltas to the job
+    rows in bulk. A job's true count is its column plus its pending deltas.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(JobCounterDelta, db)
+
+    async def record(self, job_id: UUID, applications: int = 0, saves: int = 0) -> None:
+        """Record a change to a job's counters in the current transaction."""
+        await self.db.execute(
+            insert(deltas).values(job_id=job_id, applications=applications, saves=saves)
+        )
+
+    async def fold(self, limit: int) -> int:
+        """
+        Fold up to ``limit`` pending deltas into the job rows.
+
+        The deltas are deleted and their sums added to the jobs in the same
+        transaction, so a delta is counted exactly once. Deltas locked by
+        another folder are skipped. The job rows are locked in ID order
+        before they are updated, as ``reconcile`` locks them, so folders in
+        other workers and reconcilers queue rather than deadlock on hot
+        jobs. Returns how many deltas were folded.
+        """
+        batch = (
+            delete(deltas)
+            .where(deltas.c.id.in_(
+                select(deltas.c.id).limit(limit).with_for_update(skip_locked=True).scalar_subquery()
+            ))
+            .returning(deltas.c.job_id, deltas.c.applications, deltas.c.saves)
+            .cte("batch")
+        )
+        result = await self.db.execute(
+            select(
+                batch.c.job_id,
+                func.sum(batch.c.applications).label("applications"),
+                func.sum(batch.c.saves).label("saves"),
+                func.count().label("deltas"),
+            )
+            .group_by(batch.c.job_id)
+            .order_by(batch.c.job_id)
+        )
+        totals = result.all()
+        if not totals:
+            return 0
+
+        await self.lock_jobs([row.job_id for row in totals])
+        await self.db.execute(
+            update(jobs)
+            .where(jobs.c.id == bindparam("target_id", type_=jobs.c.id.type))
+            .values(
+                applications_count=jobs.c.applications_count + bindparam("applications_delta"),
+                saves_count=jobs.c.saves_count + bindparam("saves_delta"),
+                # Counters aren't an edit; leave the job's updated_at alone
+                updated_at=jobs.c.updated_at,
+            ),
+            [
+                {"target_id": row.job_id, "applications_delta": row.applications, "saves_delta": row.saves}
+                for row in totals
+            ],
+        )
+        return sum(row.deltas for row in totals)
+
+    async def lock_jobs(self, job_ids: List[UUID]) -> None:
+        """Lock these job rows for the transaction, in ID order so lockers can't deadlock."""
+        await self.db.execute(
+            select(jobs.c.id).where(jobs.c.id.in_(job_ids)).order_by(jobs.c.id).with_for_update()
+        )
+
+    async def get_job_ids_after(self, after: Optional[UUID], limit: int) -> List[UUID]:
+        """Get the next page of job IDs in ID order, for walking every job."""
+        query = select(jobs.c.id).order_by(jobs.c.id).limit(limit)
+        if after is not None:
+            query = query.where(jobs.c.id > after)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def reconcile(self, job_ids: List[UUID]) -> List[UUID]:
+        """
+        Recompute these jobs' counters from applications and saved_jobs.
+
+        The job rows are locked first, so a concurrent ``fold`` either
+        finished before (its deltas are gone and already in the column) or
+        waits until after (its deltas are still pending and get subtracted
+        here). Returns the IDs of jobs whose counters had drifted.
+        """
+        if not job_ids:
+            return []
+        await self.lock_jobs(job_ids)
+
+        pending = (
+            select(
+                deltas.c.job_id,
+                func.sum(deltas.c.applications).label("applications"),
+                func.sum(deltas.c.saves).label("saves"),
+            )
+            .where(deltas.c.job_id.in_(job_ids))
+            .group_by(deltas.c.job_id)
+            .subquery()
+        )
+        applied = (
+            select(func.count()).select_from(Application)
+            .where(Application.job_id == jobs.c.id)
+            .scalar_subquery()
+        )
+        saved = (
+            select(func.count()).select_from(SavedJob)
+            .where(SavedJob.job_id == jobs.c.id)
+            .scalar_subquery()
+        )
+        expected = (
+            select(
+                jobs.c.id,
+                (applied - func.coalesce(pending.c.applications, 0)).label("applications"),
+                (saved - func.coalesce(pending.c.saves, 0)).label("saves"),
+            )
+            .outerjoin(pending, pending.c.job_id == jobs.c.id)
+            .where(jobs.c.id.in_(job_ids))
+            .cte("expected")
+        )
+        result = await self.db.execute(
+            update(jobs)
+            .where(
+                jobs.c.id == expected.c.id,
+                tuple_(jobs.c.applications_count, jobs.c.saves_count).is_distinct_from(
+                    tuple_(expected.c.applications, expected.c.saves)
+                ),
+            )
+            .values(
+                applications_count=expected.c.applications,
+                saves_count=expected.c.saves,
+                updated_at=jobs.c.updated_at,
+            )
+            .returning(jobs.c.id)
+        )
+        return list(result.scalars().all())
@@ -1,14 +1,72 @@
 """
 Job repository for IQAutoJobs.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from uuid import UUID
 from sqlalchemy.orm import Session
 import sqlalchemy.orm
-from sqlalchemy import and_, or_, func, select
+from sqlalchemy import String, and_, or_, func, select, lambda_stmt, type_coerce
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from app.db.models import Job, JobStatus, EmploymentType, Company
+from app.core.config import settings
+from app.db.admin_stats import record_stats_delta
+from app.db.models import Job, JobStatus, EmploymentType, Company, User
 from app.repositories.base import BaseRepository
+from app.repositories.company_repo import COMPANY_BRIEF_COLUMNS
+
+# Columns list views show; the description comes back as an excerpt instead
+JOB_SUMMARY_COLUMNS = (
+    Job.id, Job.company_id, Job.title, Job.slug, Job.location, Job.type, Job.category,
+    Job.experience_level, Job.salary_min, Job.salary_max, Job.currency, Job.status,
+    Job.published_at, Job.created_at, Job.applications_count, Job.saves_count,
+)
+
+
+def job_summary_options() -> tuple:
+    """Loader options for job list items; other columns raise if touched."""
+    return (
+        sqlalchemy.orm.load_only(*JOB_SUMMARY_COLUMNS, raiseload=True),
+        sqlalchemy.orm.with_expression(
+            Job.description_excerpt, func.left(Job.description, settings.LIST_DESCRIPTION_EXCERPT)
+        ),
+        sqlalchemy.orm.joinedload(Job.company).load_only(*COMPANY_BRIEF_COLUMNS, raiseload=True),
+    )
+
+
+def job_summary_row_columns() -> tuple:
+    """
+    Columns of a job list item as plain values, for the row read path.
+
+    Enum columns come back as their names (which are also their values)
+    rather than enum members, and the company's columns are flattened in
+    at the end; ``job_summary_dicts`` nests them again. The ``updated_at``
+    stamps aren't shown; they version the cached JSON of each item.
+    """
+    return (
+        Job.id, Job.title, Job.slug,
+        func.left(Job.description, settings.LIST_DESCRIPTION_EXCERPT).label("description_excerpt"),
+        Job.location, type_coerce(Job.type, String).label("type"), Job.category,
+        Job.experience_level, Job.salary_min, Job.salary_max, Job.currency,
+        type_coerce(Job.status, String).label("status"), Job.published_at, Job.created_at,
+        Job.updated_at, Job.applications_count, Job.saves_count,
+        Company.id.label("company_id"), Company.name.label("company_name"), Company.slug.label("company_slug"),
+        Company.updated_at.label("company_updated_at"),
+    )
+
+
+COMPANY_ROW_FIELDS = ("id", "name", "slug", "updated_at")
+JOB_ROW_FIELDS = tuple(column.key for column in job_summary_row_columns()[:-len(COMPANY_ROW_FIELDS)])
+
+
+def job_summary_dicts(rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+    """Map job summary rows to dicts ``JobSummaryResponse`` validates from."""
+    split = len(JOB_ROW_FIELDS)
+    items = []
+    for row in rows:
+        item = dict(zip(JOB_ROW_FIELDS, row[:split]))
+        item["company"] = dict(zip(COMPANY_ROW_FIELDS, row[split:]))
+        items.append(item)
+    return items
 
 
 class JobRepository(BaseRepository[Job]):
@@ -19,7 +77,7 @@ class JobRepository(BaseRepository[Job]):
     
     async def get_by_slug(self, slug: str) -> Optional[Job]:
         """Get job by slug."""
-        result = await self.db.execute(select(Job).filter(Job.slug == slug))
+        result = await self.db.execute(lambda_stmt(lambda: select(Job).where(Job.slug == slug)))
         return result.scalars().first()
     
     async def get_by_company_and_slug(self, company_id: UUID, slug: str) -> Optional[Job]:
@@ -39,10 +97,23 @@ class JobRepository(BaseRepository[Job]):
     async def get_jobs_by_company(self, company_id: UUID, skip: int = 0, limit: int = 100) -> List[Job]:
         """Get jobs by company."""
         result = await self.db.execute(
-            select(Job).filter(Job.company_id == company_id).offset(skip).limit(limit)
+            select(Job).options(*job_summary_options()).filter(Job.company_id == company_id).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
+    async def get_job_rows_by_company(self, company_id: UUID, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get jobs by company as list item dicts, without building ORM objects."""
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(*job_summary_row_columns())
+                .join(Company, Company.id == Job.company_id)
+                .where(Job.company_id == company_id)
+                .offset(skip)
+                .limit(limit)
+            )
+        )
+        return job_summary_dicts(result)
+    
     async def get_jobs_by_status(self, status: JobStatus, skip: int = 0, limit: int = 100) -> List[Job]:
         """Get jobs by status."""
         result = await self.db.execute(
@@ -53,21 +124,43 @@ class JobRepository(BaseRepository[Job]):
     async def get_jobs_by_type(self, employment_type: EmploymentType, skip: int = 0, limit: int = 100) -> List[Job]:
         """Get jobs by employment type."""
         result = await self.db.execute(
-            select(Job).filter(Job.type == employment_type).offset(skip).limit(limit)
+            select(Job).options(*job_summary_options()).filter(Job.type == employment_type).offset(skip).limit(limit)
         )
         return result.scalars().all()
     
     async def get_jobs_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[Job]:
         """Get jobs by category."""
         result = await self.db.execute(
-            select(Job).filter(Job.category.ilike(f"%{category}%")).offset(skip).limit(limit)
+            select(Job)
+            .options(*job_summary_options())
+            .filter(Job.category.ilike(f"%{category}%"))
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
     
+    async def get_job_rows_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get jobs by category as list item dicts, without building ORM objects."""
+        category_pattern = f"%{category}%"
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(*job_summary_row_columns())
+                .join(Company, Company.id == Job.company_id)
+                .where(Job.category.ilike(category_pattern))
+                .offset(skip)
+                .limit(limit)
+            )
+        )
+        return job_summary_dicts(result)
+    
     async def get_jobs_by_location(self, location: str, skip: int = 0, limit: int = 100) -> List[Job]:
         """Get jobs by location."""
         result = await self.db.execute(
-            select(Job).filter(Job.location.ilike(f"%{location}%")).offset(skip).limit(limit)
+            select(Job)
+            .options(*job_summary_options())
+            .filter(Job.location.ilike(f"%{location}%"))
+            .offset(skip)
+            .limit(limit)
         )
         return result.scalars().all()
     
@@ -78,6 +171,28 @@ class JobRepository(BaseRepository[Job]):
         )
         return result.scalars().first()
     
+    async def get_job_version(self, job_id: UUID) -> Optional[tuple]:
+        """
+        Get what a job's detail JSON depends on, without loading it.
+
+        Returns ``(status, version)``, where the version is the job's, its
+        company's and the company owner's ``updated_at`` with the job's
+        counters, or None if the job doesn't exist.
+        """
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(
+                    Job.status, Job.updated_at, Job.applications_count, Job.saves_count,
+                    Company.updated_at, User.updated_at,
+                )
+                .join(Company, Company.id == Job.company_id)
+                .join(User, User.id == Company.owner_user_id)
+                .where(Job.id == job_id)
+            )
+        )
+        row = result.first()
+        return (row[0], tuple(row[1:])) if row else None
+    
     async def get_job_with_applications(self, job_id: UUID) -> Optional[Job]:
         """Get job with applications relationship loaded."""
         result = await self.db.execute(
@@ -85,8 +200,9 @@ class JobRepository(BaseRepository[Job]):
         )
         return result.scalars().first()
     
-    async def search_jobs(
-        self,
+    @staticmethod
+    def _filter_search(
+        stmt: StatementLambdaElement,
         search_term: Optional[str] = None,
         location: Optional[str] = None,
         employment_type: Optional[EmploymentType] = None,
@@ -95,45 +211,103 @@ class JobRepository(BaseRepository[Job]):
         salary_min: Optional[int] = None,
         salary_max: Optional[int] = None,
         company_id: Optional[UUID] = None,
-        status: JobStatus = JobStatus.PUBLISHED,
-        skip: int = 0,
-        limit: int = 100
-    ) -> List[Job]:
-        """Search jobs with multiple filters."""
-        query = select(Job).filter(Job.status == status).options(sqlalchemy.orm.selectinload(Job.company).selectinload(Company.owner))
-        
+    ) -> StatementLambdaElement:
+        """
+        Add the search filters to a lambda statement.
+
+        Each filter is cached by its code location, so a given combination of
+        filters is built and compiled once; the values are bound parameters.
+        Patterns are built outside the lambdas so they bind as plain strings.
+        """
         if search_term:
-            search_conditions = [
-                Job.title.ilike(f"%{search_term}%"),
-                Job.description.ilike(f"%{search_term}%"),
-                Job.category.ilike(f"%{search_term}%")
-            ]
-            query = query.filter(or_(*search_conditions))
+            term = f"%{search_term}%"
+            stmt += lambda s: s.where(
+                or_(Job.title.ilike(term), Job.description.ilike(term), Job.category.ilike(term))
+            )
         
         if location:
-            query = query.filter(Job.location.ilike(f"%{location}%"))
+            location_pattern = f"%{location}%"
+            stmt += lambda s: s.where(Job.location.ilike(location_pattern))
         
         if employment_type:
-            query = query.filter(Job.type == employment_type)
+            stmt += lambda s: s.where(Job.type == employment_type)
         
         if category:
-            query = query.filter(Job.category.ilike(f"%{category}%"))
+            category_pattern = f"%{category}%"
+            stmt += lambda s: s.where(Job.category.ilike(category_pattern))
         
         if experience_level:
-            query = query.filter(Job.experience_level == experience_level)
+            stmt += lambda s: s.where(Job.experience_level == experience_level)
         
         if salary_min is not None:
-            query = query.filter(Job.salary_min >= salary_min)
+            stmt += lambda s: s.where(Job.salary_min >= salary_min)
         
         if salary_max is not None:
-            query = query.filter(Job.salary_max <= salary_max)
+            stmt += lambda s: s.where(Job.salary_max <= salary_max)
         
         if company_id:
-            query = query.filter(Job.company_id == company_id)
+            stmt += lambda s: s.where(Job.company_id == company_id)
         
-        result = await self.db.execute(query.offset(skip).limit(limit))
+        return stmt
+    
+    async def search_jobs(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        employment_type: Optional[EmploymentType] = None,
+        category: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+        company_id: Optional[UUID] = None,
+        status: JobStatus = JobStatus.PUBLISHED,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Job]:
+        """Search jobs with multiple filters."""
+        stmt = lambda_stmt(
+            lambda: select(Job)
+            .where(Job.status == status)
+            .options(*job_summary_options())
+        )
+        stmt = self._filter_search(
+            stmt, search_term, location, employment_type, category,
+            experience_level, salary_min, salary_max, company_id,
+        )
+        stmt += lambda s: s.offset(skip).limit(limit)
+        
+        result = await self.db.execute(stmt)
         return result.scalars().all()
     
+    async def search_job_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        employment_type: Optional[EmploymentType] = None,
+        category: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+        company_id: Optional[UUID] = None,
+        status: JobStatus = JobStatus.PUBLISHED,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Search jobs like ``search_jobs``, as list item dicts without building ORM objects."""
+        stmt = lambda_stmt(
+            lambda: select(*job_summary_row_columns())
+            .join(Company, Company.id == Job.company_id)
+            .where(Job.status == status)
+        )
+        stmt = self._filter_search(
+            stmt, search_term, location, employment_type, category,
+            experience_level, salary_min, salary_max, company_id,
+        )
+        stmt += lambda s: s.offset(skip).limit(limit)
+        
+        result = await self.db.execute(stmt)
+        return job_summary_dicts(result)
+    
     async def count_search_jobs(
         self,
         search_term: Optional[str] = None,
@@ -147,47 +321,74 @@ class JobRepository(BaseRepository[Job]):
         status: JobStatus = JobStatus.PUBLISHED
     ) -> int:
         """Count jobs with search filters."""
-        query = select(func.count(Job.id)).filter(Job.status == status)
-        
-        if search_term:
-            search_conditions = [
-                Job.title.ilike(f"%{search_term}%"),
-                Job.description.ilike(f"%{search_term}%"),
-                Job.category.ilike(f"%{search_term}%")
-            ]
-            query = query.filter(or_(*search_conditions))
-        
-        if location:
-            query = query.filter(Job.location.ilike(f"%{location}%"))
-        
-        if employment_type:
-            query = query.filter(Job.type == employment_type)
-        
-        if category:
-            query = query.filter(Job.category.ilike(f"%{category}%"))
-        
-        if experience_level:
-            query = query.filter(Job.experience_level == experience_level)
-        
-        if salary_min is not None:
-            query = query.filter(Job.salary_min >= salary_min)
-        
-        if salary_max is not None:
-            query = query.filter(Job.salary_max <= salary_max)
-        
-        if company_id:
-            query = query.filter(Job.company_id == company_id)
+        stmt = lambda_stmt(lambda: select(func.count(Job.id)).where(Job.status == status))
+        stmt = self._filter_search(
+            stmt, search_term, location, employment_type, category,
+            experience_level, salary_min, salary_max, company_id,
+        )
         
-        result = await self.db.execute(query)
+        result = await self.db.execute(stmt)
         return result.scalar_one()
     
     async def get_recent_jobs(self, limit: int = 10) -> List[Job]:
         """Get recent published jobs."""
         result = await self.db.execute(
-            select(Job).filter(Job.status == JobStatus.PUBLISHED).order_by(Job.published_at.desc()).limit(limit)
+            lambda_stmt(
+                lambda: select(Job)
+                .options(*job_summary_options())
+                .where(Job.status == JobStatus.PUBLISHED)
+                .order_by(Job.published_at.desc())
+                .limit(limit)
+            )
         )
         return result.scalars().all()
     
+    async def get_recent_job_rows(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get recent published jobs as list item dicts, without building ORM objects."""
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(*job_summary_row_columns())
+                .join(Company, Company.id == Job.company_id)
+                .where(Job.status == JobStatus.PUBLISHED)
+                .order_by(Job.published_at.desc())
+                .limit(limit)
+            )
+        )
+        return job_summary_dicts(result)
+    
+    async def transition_status(
+        self,
+        job_id: UUID,
+        owner_user_id: UUID,
+        status: JobStatus,
+        values: Optional[Dict[str, Any]] = None,
+        from_status: Optional[JobStatus] = None,
+    ) -> Optional[Job]:
+        """
+        Move a job owned by ``owner_user_id`` into ``status``, with its company loaded.
+
+        Returns None if the job doesn't exist, belongs to another company
+        owner, is already in ``status``, or isn't in ``from_status`` when
+        that is given.
+        """
+        job = await self.conditional_update(
+            job_id,
+            {"status": status, **(values or {})},
+            expected={"status": from_status} if from_status else None,
+            where=[
+                Job.status != status,
+                Job.company_id == Company.id,
+                Company.owner_user_id == owner_user_id,
+            ],
+            load=["company.owner"],
+        )
+        if job:
+            if status == JobStatus.PUBLISHED:
+                record_stats_delta(self.db, published_jobs=1)
+            elif from_status == JobStatus.PUBLISHED:
+                record_stats_delta(self.db, published_jobs=-1)
+        return job
+    
     async def is_slug_available(self, company_id: UUID, slug: str, exclude_id: Optional[UUID] = None) -> bool:
         """Check if slug is available for a company."""
         query = select(Job).filter(and_(Job.company_id == company_id, Job.slug == slug))
@@ -0,0 +1,140 @@
+"""
+Request-scoped batch loaders for IQAutoJobs.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+
+from app.core.config import settings
+from app.db.models import Company, Job, User
+from app.repositories.base import BaseRepository
+from app.repositories.company_repo import CompanyRepository
+from app.repositories.job_repo import JobRepository
+from app.repositories.user_repo import UserRepository
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces lookups by key into batched fetches and memoizes the results.
+
+    Every ``load`` made before the event loop next gets round to the loader
+    is answered by a single call to ``batch_load``. Results (including
+    misses, as None) are kept for the loader's lifetime, so asking again for
+    the same key costs nothing.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: Optional[int] = None,
+    ):
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size or settings.DB_BULK_CHUNK_SIZE
+        self._results: Dict[K, asyncio.Future] = {}
+        self._queue: List[K] = []
+        self._tasks: set = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """Get one value, batched with every other load in the same tick."""
+        future = self._results.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._results[key] = loop.create_future()
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                loop.call_soon(self._dispatch)
+        return await future
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """Get several values in input order."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Remember a value fetched some other way."""
+        if key not in self._results:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._results[key] = future
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self._max_batch_size):
+            task = asyncio.ensure_future(self._run(keys[start:start + self._max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: List[K]) -> None:
+        try:
+            found = await self._batch_load(keys)
+        except BaseException as e:
+            # Forget the failed keys so a later load retries them
+            for key in keys:
+                future = self._results.pop(key)
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for key in keys:
+            future = self._results[key]
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class Loaders:
+    """
+    Batch loaders for entities by ID, one set per database session.
+
+    A session runs one statement at a time, so the loaders take turns on it;
+    lookups still collapse into one ``IN (...)`` query per entity type.
+    Loaded objects live in the session's identity map, so once a related
+    object has been loaded, a many-to-one attribute pointing at it resolves
+    without another query.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        self._lock = asyncio.Lock()
+        self.users: BatchLoader[UUID, User] = BatchLoader(self._by_ids(UserRepository(db)))
+        self.companies: BatchLoader[UUID, Company] = BatchLoader(self._by_ids(CompanyRepository(db)))
+        self.jobs: BatchLoader[UUID, Job] = BatchLoader(self._by_ids(JobRepository(db)))
+
+    async def load_job_companies(self, jobs: Iterable[Job]) -> None:
+        """Load the companies of these jobs, and the companies' owners."""
+        companies = await self.companies.load_many({job.company_id for job in jobs})
+        await self.users.load_many({company.owner_user_id for company in companies if company})
+
+    def _by_ids(self, repo: BaseRepository) -> Callable[[List[UUID]], Awaitable[Dict[UUID, Any]]]:
+        async def batch_load(ids: List[UUID]) -> Dict[UUID, Any]:
+            # Objects the session already holds (say, from a joinedload) need no query
+            found = {}
+            missing = []
+            for id in ids:
+                obj = self._db.identity_map.get(identity_key(repo.model, id))
+                if obj is not None:
+                    found[id] = obj
+                else:
+                    missing.append(id)
+            if missing:
+                async with self._lock:
+                    found.update({obj.id: obj for obj in await repo.get_by_ids(missing)})
+            return found
+        return batch_load
+
+
+def get_loaders(db: AsyncSession) -> Loaders:
+    """Get the loaders for a session, which lasts as long as the request."""
+    loaders = db.info.get("loaders")
+    if loaders is None:
+        loaders = db.info["loaders"] = Loaders(db)
+    return loaders
@@ -1,13 +1,14 @@
 """
 Saved job repository for IQAutoJobs.
 """
-from typing import Optional, List
+from typing import Optional, List, Set
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, select, func
+from sqlalchemy import delete, select, func, lambda_stmt
 
 from app.db.models import SavedJob
 from app.repositories.base import BaseRepository
+from app.repositories.job_counter_repo import JobCounterRepository
 
 
 class SavedJobRepository(BaseRepository[SavedJob]):
@@ -19,11 +20,8 @@ class SavedJobRepository(BaseRepository[SavedJob]):
     async def get_by_user_and_job(self, user_id: UUID, job_id: UUID) -> Optional[SavedJob]:
         """Get saved job by user and job."""
         result = await self.db.execute(
-            select(SavedJob).filter(
-                and_(
-                    SavedJob.user_id == user_id,
-                    SavedJob.job_id == job_id
-                )
+            lambda_stmt(
+                lambda: select(SavedJob).where(SavedJob.user_id == user_id, SavedJob.job_id == job_id)
             )
         )
         return result.scalars().first()
@@ -45,31 +43,47 @@ class SavedJobRepository(BaseRepository[SavedJob]):
     async def is_job_saved_by_user(self, user_id: UUID, job_id: UUID) -> bool:
         """Check if job is saved by user."""
         result = await self.db.execute(
-            select(SavedJob).filter(
-                and_(
-                    SavedJob.user_id == user_id,
-                    SavedJob.job_id == job_id
-                )
+            lambda_stmt(
+                lambda: select(SavedJob).where(SavedJob.user_id == user_id, SavedJob.job_id == job_id)
             )
         )
         return result.scalars().first() is not None
     
+    async def get_saved_job_ids(self, user_id: UUID, job_ids: List[UUID]) -> Set[UUID]:
+        """Get which of the given jobs a user has saved, in one query."""
+        if not job_ids:
+            return set()
+        result = await self.db.execute(
+            select(SavedJob.job_id).where(SavedJob.user_id == user_id, SavedJob.job_id.in_(job_ids))
+        )
+        return set(result.scalars().all())
+    
     async def save_job(self, user_id: UUID, job_id: UUID) -> SavedJob:
         """Save a job for a user."""
         saved_job_data = {
             "user_id": user_id,
             "job_id": job_id
         }
-        return await self.create(saved_job_data)
+        saved_job = await self.create(saved_job_data)
+        await JobCounterRepository(self.db).record(job_id, saves=1)
+        return saved_job
     
     async def unsave_job(self, user_id: UUID, job_id: UUID) -> bool:
-        """Unsave a job for a user."""
-        saved_job = await self.get_by_user_and_job(user_id, job_id)
-        if saved_job:
-            await self.db.delete(saved_job)
-            await self.db.commit()
-            return True
-        return False
+        """
+        Unsave a job for a user.
+
+        The counter delta is recorded only if this call deleted the row, so
+        concurrent unsaves of the same job count once.
+        """
+        result = await self.db.execute(
+            delete(SavedJob)
+            .where(SavedJob.user_id == user_id, SavedJob.job_id == job_id)
+            .returning(SavedJob.id)
+        )
+        if result.first() is None:
+            return False
+        await JobCounterRepository(self.db).record(job_id, saves=-1)
+        return True
     
     async def get_recent_saved_jobs(self, user_id: UUID, limit: int = 10) -> List[SavedJob]:
         """Get recent saved jobs for a user."""
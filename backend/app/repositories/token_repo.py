@@ -4,7 +4,7 @@ Refresh token repository for IQAutoJobs.
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy import select, and_, update, delete
+from sqlalchemy import select, and_, update, delete, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import RefreshToken
@@ -20,7 +20,7 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
     async def get_by_token_hash(self, token_hash: str) -> Optional[RefreshToken]:
         """Get refresh token by hash."""
         result = await self.db.execute(
-            select(RefreshToken).filter(RefreshToken.token_hash == token_hash)
+            lambda_stmt(lambda: select(RefreshToken).where(RefreshToken.token_hash == token_hash))
         )
         return result.scalar_one_or_none()
     
@@ -55,13 +55,8 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         return await self.create(token_data)
     
     async def revoke_token(self, token_id: UUID) -> Optional[RefreshToken]:
-        """Revoke a refresh token."""
-        token = await self.get(token_id)
-        if token:
-            token.revoked = True
-            await self.db.commit()
-            await self.db.refresh(token)
-        return token
+        """Revoke a refresh token; returns None if it doesn't exist or was already revoked."""
+        return await self.conditional_update(token_id, {"revoked": True}, expected={"revoked": False})
     
     async def revoke_all_user_tokens(self, user_id: UUID) -> int:
         """Revoke all refresh tokens for a user."""
@@ -70,7 +65,6 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
             .where(RefreshToken.user_id == user_id)
             .values(revoked=True)
         )
-        await self.db.commit()
         return result.rowcount
     
     async def revoke_all_active_user_tokens(self, user_id: UUID) -> int:
@@ -86,7 +80,6 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
             )
             .values(revoked=True)
         )
-        await self.db.commit()
         return result.rowcount
     
     async def cleanup_expired_tokens(self) -> int:
@@ -94,7 +87,6 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         result = await self.db.execute(
             delete(RefreshToken).where(RefreshToken.expires_at <= datetime.utcnow())
         )
-        await self.db.commit()
         return result.rowcount
     
     async def cleanup_revoked_tokens(self) -> int:
@@ -107,5 +99,4 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
                 )
             )
         )
-        await self.db.commit()
         return result.rowcount
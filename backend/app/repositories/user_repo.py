@@ -3,10 +3,11 @@ User repository for IQAutoJobs.
 """
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, or_, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 import sqlalchemy.orm
 
+from app.db.admin_stats import record_stats_delta
 from app.db.models import User, UserRole
 from app.repositories.base import BaseRepository
 
@@ -19,14 +20,18 @@ class UserRepository(BaseRepository[User]):
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
-        result = await self.db.execute(select(User).filter(User.email == email))
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(User).where(User.email == email))
+        )
         return result.scalar_one_or_none()
 
     async def get_by_oauth(self, provider: str, oauth_id: str) -> Optional[User]:
         """Get user by OAuth provider and ID."""
         result = await self.db.execute(
-            select(User).filter(
-                User.oauth_provider == provider, User.oauth_id == oauth_id
+            lambda_stmt(
+                lambda: select(User).where(
+                    User.oauth_provider == provider, User.oauth_id == oauth_id
+                )
             )
         )
         return result.scalar_one_or_none()
@@ -57,21 +62,19 @@ class UserRepository(BaseRepository[User]):
 
     async def deactivate_user(self, user_id: UUID) -> Optional[User]:
         """Deactivate a user."""
-        user = await self.get(user_id)
-        if user:
-            user.is_active = False
-            await self.db.commit()
-            await self.db.refresh(user)
-        return user
+        return await self._set_active(user_id, False)
 
     async def activate_user(self, user_id: UUID) -> Optional[User]:
         """Activate a user."""
-        user = await self.get(user_id)
+        return await self._set_active(user_id, True)
+
+    async def _set_active(self, user_id: UUID, active: bool) -> Optional[User]:
+        user = await self.conditional_update(user_id, {"is_active": active}, expected={"is_active": not active})
         if user:
-            user.is_active = True
-            await self.db.commit()
-            await self.db.refresh(user)
-        return user
+            record_stats_delta(self.db, active_users=1 if active else -1)
+            return user
+        # Already in that state, or missing
+        return await self.get(user_id)
     
     async def get_employers(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get employer users."""
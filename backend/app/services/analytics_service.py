@@ -0,0 +1,175 @@
+"""
+Analytics service for IQAutoJobs.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from structlog import get_logger
+
+from app.core.config import settings
+from app.core.errors import AuthorizationError, NotFoundError, ValidationError
+from app.db.base import SessionLocal
+from app.domain.models import (
+    AnalyticsFunnel, AnalyticsFunnelResponse, AnalyticsPoint, AnalyticsSeriesResponse,
+    JobAnalyticsFunnel, UserRole
+)
+from app.repositories.analytics_repo import AUDIT_LOG_SOURCE, AnalyticsRepository, ROLLUP_METRICS
+from app.repositories.archive_repo import JobArchiveRepository
+from app.repositories.loaders import get_loaders
+
+logger = get_logger()
+
+SERIES_GRAINS = ("hour", "day", "week")
+DEFAULT_RANGE = timedelta(days=30)
+
+
+class AnalyticsService:
+    """Analytics service; reads only the rollup tables."""
+
+    def __init__(self, db: AsyncSession, analytics_repo: AnalyticsRepository):
+        self.db = db
+        self.analytics_repo = analytics_repo
+
+    async def get_series(
+        self,
+        user,
+        metric: str,
+        grain: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        company_id: Optional[UUID] = None,
+        job_id: Optional[UUID] = None,
+    ) -> AnalyticsSeriesResponse:
+        """Get a metric per hour, day or week for a job, a company, or the whole site."""
+        if metric not in ROLLUP_METRICS:
+            raise ValidationError(f"Unknown metric; expected one of {', '.join(ROLLUP_METRICS)}")
+        if grain not in SERIES_GRAINS:
+            raise ValidationError(f"Unknown grain; expected one of {', '.join(SERIES_GRAINS)}")
+        start, end = self._range(start, end)
+        if grain == "hour" and end - start > timedelta(days=settings.ANALYTICS_HOURLY_RETENTION_DAYS):
+            raise ValidationError(
+                f"Hourly series cover at most {settings.ANALYTICS_HOURLY_RETENTION_DAYS} days"
+            )
+        await self._check_access(user, company_id, job_id)
+
+        rows = await self.analytics_repo.get_series(metric, grain, start, end, company_id, job_id)
+        return AnalyticsSeriesResponse(
+            metric=metric,
+            grain=grain,
+            start=start,
+            end=end,
+            points=[AnalyticsPoint(bucket=bucket, value=value) for bucket, value in rows],
+        )
+
+    async def get_funnel(
+        self,
+        user,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        company_id: Optional[UUID] = None,
+        job_id: Optional[UUID] = None,
+    ) -> AnalyticsFunnelResponse:
+        """Get application status conversions per job, and in total."""
+        start, end = self._range(start, end)
+        await self._check_access(user, company_id, job_id)
+
+        per_job = await self.analytics_repo.get_funnel_counts(start, end, company_id, job_id)
+        total: Dict[str, int] = {}
+        for counts in per_job.values():
+            for metric, value in counts.items():
+                total[metric] = total.get(metric, 0) + value
+        return AnalyticsFunnelResponse(
+            start=start,
+            end=end,
+            total=AnalyticsFunnel(**self._funnel(total)),
+            jobs=[
+                JobAnalyticsFunnel(job_id=job_id_, **self._funnel(counts))
+                for job_id_, counts in per_job.items()
+            ],
+        )
+
+    @staticmethod
+    def _funnel(counts: Dict[str, int]) -> Dict[str, Dict]:
+        applications = counts.get("applications", 0)
+        conversion = {
+            metric: round(value / applications, 4) if applications else 0.0
+            for metric, value in counts.items()
+            if metric != "applications"
+        }
+        return {"counts": counts, "conversion": conversion}
+
+    @staticmethod
+    def _utc(value: Optional[datetime]) -> Optional[datetime]:
+        """Convert a query bound to UTC; one without an offset is taken to be UTC already."""
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @classmethod
+    def _range(cls, start: Optional[datetime], end: Optional[datetime]):
+        """Resolve the query range in UTC, defaulting to the last ``DEFAULT_RANGE``."""
+        end = cls._utc(end) or datetime.now(timezone.utc)
+        start = cls._utc(start) or end - DEFAULT_RANGE
+        if start >= end:
+            raise ValidationError("start must be before end")
+        return start, end
+
+    async def _check_access(self, user, company_id: Optional[UUID], job_id: Optional[UUID]) -> None:
+        """Admins see everything; employers only their own company and its jobs."""
+        if getattr(user.role, "value", user.role) == UserRole.ADMIN.value:
+            return
+        if company_id is None and job_id is None:
+            raise AuthorizationError("Site-wide analytics are for admins only")
+
+        loaders = get_loaders(self.db)
+        if job_id is not None:
+            # Rollups outlive the live row, so archived jobs stay viewable
+            job = await loaders.jobs.load(job_id) or await JobArchiveRepository(self.db).get(job_id)
+            if not job:
+                raise NotFoundError("Job not found")
+            if company_id is not None and job.company_id != company_id:
+                raise NotFoundError("Job not found")
+            company_id = job.company_id
+
+        company = await loaders.companies.load(company_id)
+        if not company:
+            raise NotFoundError("Company not found")
+        if company.owner_user_id != user.id:
+            raise AuthorizationError("You don't have permission to view this company's analytics")
+
+
+# Day the hourly rollups were last pruned, so pruning runs once a day per worker
+_pruned_on: Optional[date] = None
+
+
+async def roll_up_analytics() -> None:
+    """
+    Roll the audit log up to the watermark's lag, one window per transaction.
+
+    Runs in the background of each worker; whichever holds the watermark's
+    row lock does the work and the others skip the run.
+    """
+    global _pruned_on
+    lag = timedelta(seconds=settings.ANALYTICS_ROLLUP_LAG)
+    window = timedelta(seconds=settings.ANALYTICS_ROLLUP_WINDOW)
+    while True:
+        async with SessionLocal() as db:
+            repo = AnalyticsRepository(db)
+            locked = await repo.lock_watermark(AUDIT_LOG_SOURCE)
+            if locked is None:
+                return
+            position, now = locked
+            upto = min(now - lag, position + window)
+            if upto > position:
+                await repo.roll_up_audit_logs(position, upto)
+                await repo.set_watermark(AUDIT_LOG_SOURCE, upto)
+                logger.debug("Analytics rolled up", start=position.isoformat(), end=upto.isoformat())
+            if _pruned_on != now.date():
+                await repo.prune_hourly(now - timedelta(days=settings.ANALYTICS_HOURLY_RETENTION_DAYS))
+                _pruned_on = now.date()
+            await db.commit()
+        if upto >= now - lag:
+            return
@@ -1,7 +1,8 @@
 """
 Application service for IQAutoJobs.
 """
-from typing import Optional, List, Dict, Any
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 
@@ -12,7 +13,11 @@ from app.repositories.application_repo import ApplicationRepository
 from app.repositories.job_repo import JobRepository
 from app.repositories.user_repo import UserRepository
 from app.repositories.audit_log_repo import AuditLogRepository
+from app.repositories.job_counter_repo import JobCounterRepository
+from app.repositories.archive_repo import ApplicationArchiveRepository
 from app.core.errors import NotFoundError, ConflictError
+from app.db.models import Application, ApplicationArchive
+from app.repositories.loaders import get_loaders
 
 
 class ApplicationService:
@@ -24,36 +29,58 @@ class ApplicationService:
         app_repo: ApplicationRepository,
         job_repo: JobRepository,
         user_repo: UserRepository,
-        audit_repo: AuditLogRepository
+        audit_repo: AuditLogRepository,
+        archive_repo: Optional[ApplicationArchiveRepository] = None
     ):
         self.db = db
         self.app_repo = app_repo
         self.job_repo = job_repo
         self.user_repo = user_repo
         self.audit_repo = audit_repo
+        self.archive_repo = archive_repo or ApplicationArchiveRepository(db)
     
     async def get_application_by_id(self, application_id: UUID) -> Optional[ApplicationResponse]:
-        """Get application by ID."""
+        """Get application by ID, including applications to archived jobs."""
         application = await self.app_repo.get_application_with_job_and_candidate(application_id)
+        if not application:
+            application = await self.archive_repo.get_application_with_job(application_id)
         if not application:
             raise NotFoundError("Application not found")
         
-        return ApplicationResponse.from_orm(application)
+        return (await self._to_responses([application]))[0]
     
     async def get_applications_by_job(self, job_id: UUID, skip: int = 0, limit: int = 100) -> List[ApplicationResponse]:
-        """Get applications by job."""
-        applications = await self.app_repo.get_applications_by_job(job_id, skip=skip, limit=limit)
-        return [ApplicationResponse.from_orm(app) for app in applications]
+        """Get applications by job, whether the job is live or archived."""
+        applications = await self._live_then_archived(
+            await self.app_repo.get_applications_by_job(job_id, skip=skip, limit=limit),
+            lambda: self.app_repo.count_applications(job_id=job_id),
+            lambda skip, limit: self.archive_repo.get_applications_by_job(job_id, skip=skip, limit=limit),
+            skip,
+            limit,
+        )
+        return await self._to_responses(applications)
     
     async def get_applications_by_candidate(self, candidate_user_id: UUID, skip: int = 0, limit: int = 100) -> List[ApplicationResponse]:
-        """Get applications by candidate."""
-        applications = await self.app_repo.get_applications_by_candidate(candidate_user_id, skip=skip, limit=limit)
-        return [ApplicationResponse.from_orm(app) for app in applications]
+        """Get applications by candidate; applications to archived jobs follow the live ones."""
+        applications = await self._live_then_archived(
+            await self.app_repo.get_applications_by_candidate(candidate_user_id, skip=skip, limit=limit),
+            lambda: self.app_repo.count_applications(candidate_user_id=candidate_user_id),
+            lambda skip, limit: self.archive_repo.get_applications_by_candidate(candidate_user_id, skip=skip, limit=limit),
+            skip,
+            limit,
+        )
+        return await self._to_responses(applications)
     
     async def get_applications_by_company(self, company_id: UUID, skip: int = 0, limit: int = 100) -> List[ApplicationResponse]:
-        """Get applications by company."""
-        applications = await self.app_repo.get_applications_by_company_with_details(company_id, skip=skip, limit=limit)
-        return [ApplicationResponse.from_orm(app) for app in applications]
+        """Get applications by company; applications to archived jobs follow the live ones."""
+        applications = await self._live_then_archived(
+            await self.app_repo.get_applications_by_company_with_details(company_id, skip=skip, limit=limit),
+            lambda: self.app_repo.count_applications(company_id=company_id),
+            lambda skip, limit: self.archive_repo.get_applications_by_company(company_id, skip=skip, limit=limit),
+            skip,
+            limit,
+        )
+        return await self._to_responses(applications)
     
     async def create_application(self, application_data: ApplicationCreate, candidate_user_id: UUID, cv_key: str) -> ApplicationResponse:
         """Create a new application."""
@@ -75,6 +102,7 @@ class ApplicationService:
         app_dict["cv_key"] = cv_key
         
         application = await self.app_repo.create(app_dict)
+        await JobCounterRepository(self.db).record(application.job_id, applications=1)
         
         # Log audit
         await self.audit_repo.log_user_action(
@@ -85,21 +113,17 @@ class ApplicationService:
             payload={"job_id": str(application_data.job_id), "cv_key": cv_key}
         )
         
-        return ApplicationResponse.from_orm(application)
+        return (await self._to_responses([application]))[0]
     
     async def update_application_status(self, application_id: UUID, status: ApplicationStatus, user_id: UUID) -> ApplicationResponse:
         """Update application status."""
-        application = await self.app_repo.get_application_with_job_and_candidate(application_id)
+        # Ownership is checked by the UPDATE itself
+        application = await self.app_repo.update_application_status(application_id, status, owner_user_id=user_id)
         if not application:
-            raise NotFoundError("Application not found")
-        
-        # Check if user owns the company
-        if application.job.company.owner_user_id != user_id:
+            if not await self.app_repo.exists(application_id):
+                raise NotFoundError("Application not found")
             raise ConflictError("You don't have permission to update this application")
         
-        # Update status
-        application = await self.app_repo.update_application_status(application_id, status)
-        
         # Log audit
         await self.audit_repo.log_user_action(
             action="APPLICATION_STATUS_UPDATE",
@@ -129,7 +153,7 @@ class ApplicationService:
             skip=skip,
             limit=limit
         )
-        return [ApplicationResponse.from_orm(app) for app in applications]
+        return await self._to_responses(applications)
     
     async def count_applications(
         self,
@@ -149,13 +173,56 @@ class ApplicationService:
     async def get_recent_applications(self, limit: int = 10) -> List[ApplicationResponse]:
         """Get recent applications."""
         applications = await self.app_repo.get_recent_applications(limit)
-        return [ApplicationResponse.from_orm(app) for app in applications]
+        return await self._to_responses(applications)
     
     async def get_applications_by_status(self, status: ApplicationStatus, skip: int = 0, limit: int = 100) -> List[ApplicationResponse]:
         """Get applications by status."""
         applications = await self.app_repo.get_applications_by_status(status, skip, limit)
-        return [ApplicationResponse.from_orm(app) for app in applications]
+        return await self._to_responses(applications)
     
     async def has_candidate_applied(self, job_id: UUID, candidate_user_id: UUID) -> bool:
         """Check if candidate has applied to a job."""
         return await self.app_repo.has_candidate_applied(job_id, candidate_user_id)
+    
+    @staticmethod
+    async def _live_then_archived(
+        live: List[Application],
+        count_live: Callable[[], Awaitable[int]],
+        get_archived: Callable[[int, int], Awaitable[List[ApplicationArchive]]],
+        skip: int,
+        limit: int,
+    ) -> List[Any]:
+        """
+        Fill a page of live applications with archived ones, as if they followed the live rows.
+
+        ``live`` is the page of live rows already fetched at ``skip``. The live
+        total is only counted when the page starts past the last live row.
+        """
+        applications = list(live)
+        if len(applications) < limit:
+            if applications or not skip:
+                live_total = skip + len(applications)
+            else:
+                live_total = await count_live()
+            applications += await get_archived(max(0, skip - live_total), limit - len(applications))
+        return applications
+    
+    async def _to_responses(self, applications: List[Application]) -> List[ApplicationResponse]:
+        """
+        Serialize applications with their job, company and candidate details.
+
+        Related rows are loaded in one batch per entity type rather than once
+        per application, so a page costs the same few queries at any size.
+        Archived applications come with their archived job loaded already.
+        """
+        loaders = get_loaders(self.db)
+        jobs, _ = await asyncio.gather(
+            loaders.jobs.load_many({
+                application.job_id for application in applications
+                if not isinstance(application, ApplicationArchive)
+            }),
+            loaders.users.load_many({application.candidate_user_id for application in applications}),
+        )
+        archived_jobs = [application.job for application in applications if isinstance(application, ApplicationArchive)]
+        await loaders.load_job_companies([job for job in jobs if job] + archived_jobs)
+        return [ApplicationResponse.from_orm(application) for application in applications]
@@ -186,10 +186,8 @@ class AuthService:
         refresh_token_hash = await get_password_hash(refresh_token)
         token = await self.token_repo.get_by_token_hash(refresh_token_hash)
         
-        if token:
-            # Revoke the refresh token
-            await self.token_repo.revoke_token(token.id)
-            
+        # Revoke the refresh token, unless a concurrent logout got there first
+        if token and await self.token_repo.revoke_token(token.id):
             # Log audit
             await self.audit_repo.log_user_action(
                 action="USER_LOGOUT",
@@ -0,0 +1,40 @@
+"""
+Job archiving for IQAutoJobs.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from structlog import get_logger
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.repositories.archive_repo import JobArchiveRepository
+
+logger = get_logger()
+
+
+async def archive_closed_jobs(
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+) -> int:
+    """
+    Move jobs closed for over ``JOB_ARCHIVE_AFTER_DAYS`` into the archive.
+
+    Each batch is its own short transaction, so live traffic only waits on
+    the rows being moved. Returns how many jobs were archived.
+    """
+    batch_size = batch_size or settings.JOB_ARCHIVE_BATCH
+    closed_before = datetime.now(timezone.utc) - timedelta(days=settings.JOB_ARCHIVE_AFTER_DAYS)
+    archived = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        async with SessionLocal() as db:
+            job_ids = await JobArchiveRepository(db).archive_closed_jobs(closed_before, batch_size)
+            await db.commit()
+        archived += len(job_ids)
+        batches += 1
+        if len(job_ids) < batch_size:
+            break
+    if archived:
+        logger.info("Closed jobs archived", jobs=archived, closed_before=closed_before.isoformat())
+    return archived
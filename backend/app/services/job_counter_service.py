@@ -0,0 +1,54 @@
+"""
+Job counter maintenance for IQAutoJobs.
+"""
+from typing import Optional
+from uuid import UUID
+
+from structlog import get_logger
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.repositories.job_counter_repo import JobCounterRepository
+
+logger = get_logger()
+
+
+async def fold_job_counters() -> None:
+    """
+    Fold every pending counter delta into the job rows.
+
+    Runs in the background of each worker. Each batch commits on its own, so
+    the job rows are locked only briefly; workers folding at the same time
+    skip each other's deltas.
+    """
+    batch_size = settings.JOB_COUNTER_FOLD_BATCH
+    while True:
+        async with SessionLocal() as db:
+            folded = await JobCounterRepository(db).fold(batch_size)
+            await db.commit()
+        if folded:
+            logger.debug("Job counters folded", deltas=folded)
+        if folded < batch_size:
+            return
+
+
+async def reconcile_job_counters(batch_size: int = 500) -> int:
+    """
+    Repair counter drift on every job, one batch of jobs per transaction.
+
+    Returns how many jobs had drifted.
+    """
+    drifted = 0
+    after: Optional[UUID] = None
+    while True:
+        async with SessionLocal() as db:
+            repo = JobCounterRepository(db)
+            job_ids = await repo.get_job_ids_after(after, batch_size)
+            if not job_ids:
+                return drifted
+            repaired = await repo.reconcile(job_ids)
+            await db.commit()
+        if repaired:
+            logger.warning("Job counters drifted", jobs=[str(job_id) for job_id in repaired])
+        drifted += len(repaired)
+        after = job_ids[-1]
@@ -5,16 +5,34 @@ import re
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.domain.models import (
-    JobCreate, JobUpdate, JobResponse, JobSearchFilters, JobSearchResponse,
+    JobCreate, JobUpdate, JobResponse, JobSummaryResponse, JobSearchFilters, JobSearchResponse,
     JobStatus, EmploymentType
 )
 from app.repositories.job_repo import JobRepository
 from app.repositories.company_repo import CompanyRepository
 from app.repositories.audit_log_repo import AuditLogRepository
+from app.repositories.application_repo import ApplicationRepository
+from app.repositories.saved_job_repo import SavedJobRepository
+from app.core.config import settings
 from app.core.errors import NotFoundError, ConflictError
+from app.core.fragments import FragmentCache
+from app.db.concurrent import run_concurrently
+from app.db.models import Job
+from app.repositories.loaders import get_loaders
+
+# Whole lists validate in one call into pydantic-core rather than one per item
+JOBS = TypeAdapter(List[JobResponse])
+JOB_SUMMARIES = TypeAdapter(List[JobSummaryResponse])
+JOB = TypeAdapter(JobResponse)
+JOB_SUMMARY = TypeAdapter(JobSummaryResponse)
+
+# JSON of published jobs, under ("job", id) for the detail and ("job_summary", id)
+# for the list item; see JobService.get_job_json and _summary_array
+job_fragments = FragmentCache(settings.JOB_FRAGMENT_CACHE_SIZE)
 
 
 class JobService:
@@ -25,12 +43,16 @@ class JobService:
         db: Session,
         job_repo: JobRepository,
         company_repo: CompanyRepository,
-        audit_repo: AuditLogRepository
+        audit_repo: AuditLogRepository,
+        app_repo: Optional[ApplicationRepository] = None,
+        saved_job_repo: Optional[SavedJobRepository] = None
     ):
         self.db = db
         self.job_repo = job_repo
         self.company_repo = company_repo
         self.audit_repo = audit_repo
+        self.app_repo = app_repo or ApplicationRepository(db)
+        self.saved_job_repo = saved_job_repo or SavedJobRepository(db)
     
     async def get_job_by_id(self, job_id: UUID) -> Optional[JobResponse]:
         """Get job by ID."""
@@ -38,7 +60,25 @@ class JobService:
         if not job:
             raise NotFoundError("Job not found")
         
-        return JobResponse.from_orm(job)
+        return (await self._to_responses([job]))[0]
+    
+    async def get_job_json(self, job_id: UUID) -> bytes:
+        """
+        Get a job as ``JobResponse`` JSON.
+
+        One small query reads the job's version; a published job whose
+        cached JSON was built from that version is served as is, without
+        loading or serializing anything.
+        """
+        found = await self.job_repo.get_job_version(job_id)
+        if not found:
+            raise NotFoundError("Job not found")
+        status, version = found
+        if status.value == JobStatus.PUBLISHED.value:
+            body = job_fragments.get(("job", job_id), version)
+            if body is not None:
+                return body
+        return self._refresh_fragments(await self.get_job_by_id(job_id))
     
     async def get_job_by_slug(self, slug: str) -> Optional[JobResponse]:
         """Get job by slug."""
@@ -46,22 +86,28 @@ class JobService:
         if not job:
             return None
         
-        return JobResponse.from_orm(job)
+        return (await self._to_responses([job]))[0]
     
     async def get_jobs(self, skip: int = 0, limit: int = 100) -> List[JobResponse]:
         """Get jobs with pagination."""
         jobs = await self.job_repo.get_multi(skip=skip, limit=limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return await self._to_responses(jobs)
     
     async def get_published_jobs(self, skip: int = 0, limit: int = 100) -> List[JobResponse]:
         """Get published jobs."""
         jobs = await self.job_repo.get_published_jobs(skip=skip, limit=limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return await self._to_responses(jobs)
     
-    async def get_jobs_by_company(self, company_id: UUID, skip: int = 0, limit: int = 100) -> List[JobResponse]:
+    async def get_jobs_by_company(self, company_id: UUID, skip: int = 0, limit: int = 100) -> List[JobSummaryResponse]:
         """Get jobs by company."""
+        if settings.JOB_LIST_ROW_READS:
+            return self._summaries(await self.job_repo.get_job_rows_by_company(company_id, skip=skip, limit=limit))
         jobs = await self.job_repo.get_jobs_by_company(company_id, skip=skip, limit=limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return JOB_SUMMARIES.validate_python(jobs, from_attributes=True)
+    
+    async def get_jobs_by_company_json(self, company_id: UUID, skip: int = 0, limit: int = 100) -> bytes:
+        """``get_jobs_by_company`` as a JSON array, spliced from the fragment cache."""
+        return self._summary_array(await self.job_repo.get_job_rows_by_company(company_id, skip=skip, limit=limit))
     
     async def create_job(self, job_data: JobCreate, company_id: UUID, user_id: UUID) -> JobResponse:
         """Create a new job."""
@@ -95,7 +141,7 @@ class JobService:
             payload={"title": job.title, "company_id": str(company_id)}
         )
         
-        return JobResponse.from_orm(job)
+        return (await self._to_responses([job]))[0]
     
     async def update_job(self, job_id: UUID, job_data: JobUpdate, user_id: UUID) -> JobResponse:
         """Update a job."""
@@ -104,7 +150,8 @@ class JobService:
             raise NotFoundError("Job not found")
         
         # Check if user owns the company
-        if job.company.owner_user_id != user_id:
+        company = await get_loaders(self.db).companies.load(job.company_id)
+        if company.owner_user_id != user_id:
             raise ConflictError("You don't have permission to update this job")
         
         # Convert to dict and remove None values
@@ -134,23 +181,17 @@ class JobService:
             payload=update_data
         )
         
-        return JobResponse.from_orm(job)
+        response = (await self._to_responses([job]))[0]
+        self._refresh_fragments(response)
+        return response
     
     async def publish_job(self, job_id: UUID, user_id: UUID) -> JobResponse:
         """Publish a job."""
-        job = await self.job_repo.get(job_id)
+        job = await self.job_repo.transition_status(
+            job_id, user_id, JobStatus.PUBLISHED, {"published_at": datetime.utcnow()}
+        )
         if not job:
-            raise NotFoundError("Job not found")
-        
-        # Check if user owns the company
-        if job.company.owner_user_id != user_id:
-            raise ConflictError("You don't have permission to publish this job")
-        
-        # Update job status
-        job.status = JobStatus.PUBLISHED
-        job.published_at = datetime.utcnow()
-        await self.db.commit()
-        await self.db.refresh(job)
+            await self._raise_transition_error(job_id, user_id, "publish", JobStatus.PUBLISHED)
         
         # Log audit
         await self.audit_repo.log_user_action(
@@ -160,22 +201,20 @@ class JobService:
             subject_id=str(job_id)
         )
         
-        return JobResponse.from_orm(job)
+        response = JobResponse.from_orm(job)
+        self._refresh_fragments(response)
+        return response
     
     async def close_job(self, job_id: UUID, user_id: UUID) -> JobResponse:
         """Close a job."""
-        job = await self.job_repo.get(job_id)
+        # Try the usual published -> closed first, so the published count knows what changed
+        job = await self.job_repo.transition_status(
+            job_id, user_id, JobStatus.CLOSED, from_status=JobStatus.PUBLISHED
+        )
         if not job:
-            raise NotFoundError("Job not found")
-        
-        # Check if user owns the company
-        if job.company.owner_user_id != user_id:
-            raise ConflictError("You don't have permission to close this job")
-        
-        # Update job status
-        job.status = JobStatus.CLOSED
-        await self.db.commit()
-        await self.db.refresh(job)
+            job = await self.job_repo.transition_status(job_id, user_id, JobStatus.CLOSED)
+        if not job:
+            await self._raise_transition_error(job_id, user_id, "close", JobStatus.CLOSED)
         
         # Log audit
         await self.audit_repo.log_user_action(
@@ -185,26 +224,80 @@ class JobService:
             subject_id=str(job_id)
         )
         
-        return JobResponse.from_orm(job)
+        response = JobResponse.from_orm(job)
+        self._refresh_fragments(response)
+        return response
+    
+    async def _raise_transition_error(self, job_id: UUID, user_id: UUID, action: str, status: JobStatus) -> None:
+        """Work out why a status transition matched no job."""
+        job = await self.job_repo.get(job_id)
+        if not job:
+            raise NotFoundError("Job not found")
+        
+        company = await get_loaders(self.db).companies.load(job.company_id)
+        if not company or company.owner_user_id != user_id:
+            raise ConflictError(f"You don't have permission to {action} this job")
+        
+        raise ConflictError(f"Job is already {status.value.lower()}")
     
-    async def search_jobs(self, filters: JobSearchFilters, page: int = 1, size: int = 20) -> JobSearchResponse:
-        """Search jobs with filters."""
+    async def search_jobs(
+        self,
+        filters: JobSearchFilters,
+        page: int = 1,
+        size: int = 20,
+        user_id: Optional[UUID] = None
+    ) -> JobSearchResponse:
+        """Search jobs with filters, flagging the ones ``user_id`` applied to or saved."""
         skip = (page - 1) * size
+        criteria = self._search_criteria(filters)
+        
+        search = self.job_repo.search_job_rows if settings.JOB_LIST_ROW_READS else self.job_repo.search_jobs
+        # The page and the total are independent; fetch them side by side
+        jobs, total = await run_concurrently(
+            self.db,
+            lambda db: search(**criteria, skip=skip, limit=size),
+            lambda db: JobRepository(db).count_search_jobs(**criteria),
+        )
         
-        jobs = await self.job_repo.search_jobs(
-            search_term=filters.search,
-            location=filters.location,
-            employment_type=filters.type,
-            category=filters.category,
-            experience_level=filters.experience_level,
-            salary_min=filters.salary_min,
-            salary_max=filters.salary_max,
-            status=filters.status,
-            skip=skip,
-            limit=size
+        pages = (total + size - 1) // size
+        
+        if settings.JOB_LIST_ROW_READS:
+            items = self._summaries(jobs)
+        else:
+            items = JOB_SUMMARIES.validate_python(jobs, from_attributes=True)
+        if user_id:
+            await self._flag_for_user(items, user_id)
+        
+        # The items are validated already; don't walk them again
+        return JobSearchResponse.model_construct(
+            jobs=items,
+            total=total,
+            page=page,
+            size=size,
+            pages=pages
+        )
+    
+    async def search_jobs_json(self, filters: JobSearchFilters, page: int = 1, size: int = 20) -> bytes:
+        """``search_jobs`` as ``JobSearchResponse`` JSON, for readers who aren't signed in."""
+        skip = (page - 1) * size
+        criteria = self._search_criteria(filters)
+        
+        rows, total = await run_concurrently(
+            self.db,
+            lambda db: self.job_repo.search_job_rows(**criteria, skip=skip, limit=size),
+            lambda db: JobRepository(db).count_search_jobs(**criteria),
         )
         
-        total = await self.job_repo.count_search_jobs(
+        pages = (total + size - 1) // size
+        # Field order follows JobSearchResponse
+        return b'{"jobs":%s,"total":%d,"page":%d,"size":%d,"pages":%d}' % (
+            self._summary_array(rows), total, page, size, pages
+        )
+    
+    @staticmethod
+    def _search_criteria(filters: JobSearchFilters) -> Dict[str, Any]:
+        """Map search filters to the job repository's search arguments."""
+        return dict(
             search_term=filters.search,
             location=filters.location,
             employment_type=filters.type,
@@ -214,36 +307,115 @@ class JobService:
             salary_max=filters.salary_max,
             status=filters.status
         )
-        
-        pages = (total + size - 1) // size
-        
-        return JobSearchResponse(
-            jobs=[JobResponse.from_orm(job) for job in jobs],
-            total=total,
-            page=page,
-            size=size,
-            pages=pages
+    
+    async def _flag_for_user(self, items: List[JobSummaryResponse], user_id: UUID) -> None:
+        """Set is_applied/is_saved on a page of jobs with one query each."""
+        job_ids = [item.id for item in items]
+        applied, saved = await run_concurrently(
+            self.db,
+            lambda db: self.app_repo.get_applied_job_ids(user_id, job_ids),
+            lambda db: SavedJobRepository(db).get_saved_job_ids(user_id, job_ids),
         )
+        for item in items:
+            item.is_applied = item.id in applied
+            item.is_saved = item.id in saved
     
-    async def get_recent_jobs(self, limit: int = 10) -> List[JobResponse]:
+    async def get_recent_jobs(self, limit: int = 10) -> List[JobSummaryResponse]:
         """Get recent published jobs."""
+        if settings.JOB_LIST_ROW_READS:
+            return self._summaries(await self.job_repo.get_recent_job_rows(limit))
         jobs = await self.job_repo.get_recent_jobs(limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return JOB_SUMMARIES.validate_python(jobs, from_attributes=True)
+    
+    async def get_recent_jobs_json(self, limit: int = 10) -> bytes:
+        """``get_recent_jobs`` as a JSON array, spliced from the fragment cache."""
+        return self._summary_array(await self.job_repo.get_recent_job_rows(limit))
     
-    async def get_jobs_by_type(self, employment_type: EmploymentType, skip: int = 0, limit: int = 100) -> List[JobResponse]:
+    async def get_jobs_by_type(self, employment_type: EmploymentType, skip: int = 0, limit: int = 100) -> List[JobSummaryResponse]:
         """Get jobs by employment type."""
         jobs = await self.job_repo.get_jobs_by_type(employment_type, skip, limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return JOB_SUMMARIES.validate_python(jobs, from_attributes=True)
     
-    async def get_jobs_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[JobResponse]:
+    async def get_jobs_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[JobSummaryResponse]:
         """Get jobs by category."""
+        if settings.JOB_LIST_ROW_READS:
+            return self._summaries(await self.job_repo.get_job_rows_by_category(category, skip, limit))
         jobs = await self.job_repo.get_jobs_by_category(category, skip, limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return JOB_SUMMARIES.validate_python(jobs, from_attributes=True)
     
-    async def get_jobs_by_location(self, location: str, skip: int = 0, limit: int = 100) -> List[JobResponse]:
+    async def get_jobs_by_category_json(self, category: str, skip: int = 0, limit: int = 100) -> bytes:
+        """``get_jobs_by_category`` as a JSON array, spliced from the fragment cache."""
+        return self._summary_array(await self.job_repo.get_job_rows_by_category(category, skip, limit))
+    
+    async def get_jobs_by_location(self, location: str, skip: int = 0, limit: int = 100) -> List[JobSummaryResponse]:
         """Get jobs by location."""
         jobs = await self.job_repo.get_jobs_by_location(location, skip, limit)
-        return [JobResponse.from_orm(job) for job in jobs]
+        return JOB_SUMMARIES.validate_python(jobs, from_attributes=True)
+    
+    @staticmethod
+    def _summaries(rows: List[Dict[str, Any]]) -> List[JobSummaryResponse]:
+        """Validate list item dicts from the row read path (see job_repo.job_summary_dicts)."""
+        return JOB_SUMMARIES.validate_python(rows)
+    
+    @staticmethod
+    def _refresh_fragments(job: JobResponse) -> bytes:
+        """
+        Re-serialize a job after a read miss or a write, and return its JSON.
+
+        A published job's detail JSON is cached under its new version and
+        its list item is dropped, to be rebuilt from the next list query;
+        any other job is dropped from the cache.
+        """
+        body = JOB.dump_json(job, by_alias=True)
+        job_fragments.discard(("job_summary", job.id))
+        if job.status == JobStatus.PUBLISHED:
+            job_fragments.put(("job", job.id), JobService._job_version(job), body)
+        else:
+            job_fragments.discard(("job", job.id))
+        return body
+    
+    @staticmethod
+    def _job_version(job: JobResponse) -> tuple:
+        """A job's version as ``JobRepository.get_job_version`` reads it."""
+        return (
+            job.updated_at, job.applications_count, job.saves_count,
+            job.company.updated_at, job.company.owner.updated_at,
+        )
+    
+    @staticmethod
+    def _summary_array(rows: List[Dict[str, Any]]) -> bytes:
+        """
+        Splice list item dicts from the row read path into a JSON array.
+
+        Items whose cached JSON matches the row's version (the job's and
+        its company's ``updated_at``, and the counters) are used as is;
+        only the rest are validated and serialized, and cached if published.
+        """
+        fragments: List[Optional[bytes]] = []
+        missing = []
+        for row in rows:
+            fragment = job_fragments.get(("job_summary", row["id"]), JobService._summary_version(row))
+            if fragment is None:
+                missing.append(len(fragments))
+            fragments.append(fragment)
+        
+        if missing:
+            items = JOB_SUMMARIES.validate_python([rows[index] for index in missing])
+            for index, item in zip(missing, items):
+                fragment = fragments[index] = JOB_SUMMARY.dump_json(item, by_alias=True)
+                if item.status == JobStatus.PUBLISHED:
+                    job_fragments.put(("job_summary", item.id), JobService._summary_version(rows[index]), fragment)
+        return b"[" + b",".join(fragments) + b"]"
+    
+    @staticmethod
+    def _summary_version(row: Dict[str, Any]) -> tuple:
+        """A summary row's version: the job's and its company's changes, plus the counters."""
+        return (row["updated_at"], row["applications_count"], row["saves_count"], row["company"]["updated_at"])
+    
+    async def _to_responses(self, jobs: List[Job]) -> List[JobResponse]:
+        """Serialize jobs, loading their companies and owners in one batch each."""
+        await get_loaders(self.db).load_job_companies(jobs)
+        return JOBS.validate_python(jobs, from_attributes=True)
     
     def _generate_slug(self, title: str) -> str:
         """Generate URL-friendly slug from job title."""
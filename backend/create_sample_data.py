@@ -24,7 +24,9 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text, delete
 
 from app.db.base import Base
-from app.db.models import User, Company, Job, Application, SavedJob, AuditLog, UserRole
+from app.db.models import (
+    User, Company, Job, Application, SavedJob, AuditLog, UserRole, JobArchive, ApplicationArchive
+)
 from app.core.security import get_password_hash
 from app.repositories.base import BaseRepository
 from app.repositories.user_repo import UserRepository
@@ -32,6 +34,7 @@ from app.repositories.company_repo import CompanyRepository
 from app.repositories.job_repo import JobRepository
 from app.repositories.application_repo import ApplicationRepository
 from app.repositories.saved_job_repo import SavedJobRepository
+from app.repositories.job_counter_repo import JobCounterRepository
 from app.repositories.audit_log_repo import AuditLogRepository
 
 # Sample data
@@ -217,6 +220,8 @@ async def create_sample_data():
             await session.execute(delete(AuditLog))
             await session.execute(delete(SavedJob))
             await session.execute(delete(Application))
+            await session.execute(delete(ApplicationArchive))
+            await session.execute(delete(JobArchive))
             await session.execute(delete(Job))
             await session.execute(delete(Company))
             await session.execute(delete(User))
@@ -234,28 +239,30 @@ async def create_sample_data():
             print("Creating sample data...")
 
             # Create users
-            users = []
+            user_rows = []
             for user_data in SAMPLE_USERS:
                 user_create_data = user_data.copy()
                 user_create_data["hashed_password"] = await get_password_hash(user_create_data.pop("password"))
                 user_create_data["role"] = user_create_data["role"].upper()
-                user = await user_repo.create(user_create_data)
-                users.append(user)
+                user_rows.append(user_create_data)
+            users = await user_repo.bulk_create(user_rows)
+            for user in users:
                 print(f"Created user: {user.first_name} {user.last_name}")
 
             # Create companies
-            companies = []
+            company_rows = []
             for i, company_data in enumerate(SAMPLE_COMPANIES):
                 company_create_data = company_data.copy()
                 company_create_data["id"] = uuid.uuid4()
                 company_create_data["owner_user_id"] = users[2 + (i % 2)].id
                 company_create_data["slug"] = company_create_data["name"].lower().replace(" ", "-")
-                company = await company_repo.create(company_create_data)
-                companies.append(company)
+                company_rows.append(company_create_data)
+            companies = await company_repo.bulk_create(company_rows)
+            for company in companies:
                 print(f"Created company: {company.name}")
             
             # Create jobs
-            jobs = []
+            job_rows = []
             for i, job_data in enumerate(SAMPLE_JOBS):
                 job_create_data = job_data.copy()
                 job_create_data["id"] = uuid.uuid4()
@@ -271,68 +278,86 @@ async def create_sample_data():
                     job_create_data["type"] = "CONTRACT"
                 elif job_create_data["type"] == "Internship":
                     job_create_data["type"] = "INTERN"
-                job = await job_repo.create(job_create_data)
-                jobs.append(job)
+                job_rows.append(job_create_data)
+            jobs = await job_repo.bulk_create(job_rows)
+            for i, job in enumerate(jobs):
                 print(f"Created job: {job.title} at {companies[i % len(companies)].name}")
 
-            # Create applications
+            companies_by_id = {company.id: company for company in companies}
+            candidates = [u for u in users if u.role == UserRole.CANDIDATE]
+
+            # Create applications. A candidate can apply to a job only once.
             application_statuses = ["RECEIVED", "SHORTLISTED", "INTERVIEW", "REJECTED", "HIRED"]
-            for i in range(20):  # Create 20 applications
-                candidate = random.choice([u for u in users if u.role == UserRole.CANDIDATE])
+            application_rows = []
+            applied_set = set()
+            for i in range(20):  # Create up to 20 applications
+                candidate = random.choice(candidates)
                 job = random.choice(jobs)
 
-                application_create_data = {
+                if (candidate.id, job.id) in applied_set:
+                    continue
+
+                application_rows.append({
                     "id": uuid.uuid4(),
                     "candidate_user_id": candidate.id,
                     "job_id": job.id,
                     "status": random.choice(application_statuses),
-                    "cover_letter": f"I am excited to apply for the {job.title} position at {job.company.name}. My skills and experience make me a strong candidate for this role.",
+                    "cover_letter": f"I am excited to apply for the {job.title} position at {companies_by_id[job.company_id].name}. My skills and experience make me a strong candidate for this role.",
                     "cv_key": "dummy_cv.pdf"
-                }
-                await application_repo.create(application_create_data)
+                })
+                applied_set.add((candidate.id, job.id))
                 print(f"Created application: {candidate.first_name} {candidate.last_name} -> {job.title}")
+            await application_repo.bulk_insert(application_rows)
 
             # Create saved jobs
+            saved_job_rows = []
             saved_jobs_set = set()
-            for i in range(15):  # Create 15 saved jobs
-                candidate = random.choice([u for u in users if u.role == UserRole.CANDIDATE])
+            for i in range(15):  # Create up to 15 saved jobs
+                candidate = random.choice(candidates)
                 job = random.choice(jobs)
 
                 if (candidate.id, job.id) in saved_jobs_set:
                     continue
 
-                saved_job_create_data = {
+                saved_job_rows.append({
                     "id": uuid.uuid4(),
                     "user_id": candidate.id,
                     "job_id": job.id,
-                }
-                await saved_job_repo.create(saved_job_create_data)
+                })
                 saved_jobs_set.add((candidate.id, job.id))
                 print(f"Created saved job: {candidate.first_name} {candidate.last_name} saved {job.title}")
+            await saved_job_repo.bulk_insert(saved_job_rows)
             
             # Create audit logs
             actions = ["USER_LOGIN", "USER_LOGOUT", "JOB_CREATE", "JOB_UPDATE", "APPLICATION_SUBMIT"]
+            audit_log_rows = []
             for i in range(50):  # Create 50 audit logs
                 user = random.choice(users)
                 action = random.choice(actions)
 
-                audit_log_create_data = {
+                audit_log_rows.append({
                     "id": uuid.uuid4(),
                     "actor_user_id": user.id,
                     "action": action,
                     "subject_type": random.choice(["user", "company", "job", "application"]),
                     "subject_id": str(uuid.uuid4()),
                     "payload": {"details": f"User {user.first_name} {user.last_name} performed {action} action"},
-                }
-                await audit_repo.create(audit_log_create_data)
+                })
                 print(f"Created audit log: {user.first_name} {user.last_name} - {action}")
+            await audit_repo.bulk_insert(audit_log_rows)
+            
+            # Bulk inserts skip the counter deltas; set the job counters directly
+            await JobCounterRepository(session).reconcile([job.id for job in jobs])
+            
+            # Repositories only flush; commit the whole data set at once
+            await session.commit()
             
             print("\nSample data creation completed!")
             print(f"Created {len(users)} users")
             print(f"Created {len(companies)} companies")
             print(f"Created {len(jobs)} jobs")
-            print(f"Created 20 applications")
-            print(f"Created 15 saved jobs")
+            print(f"Created {len(application_rows)} applications")
+            print(f"Created {len(saved_job_rows)} saved jobs")
             print(f"Created 50 audit logs")
         except Exception as e:
             print(f"An error occurred: {e}")
@@ -13,15 +13,25 @@ from contextlib import asynccontextmanager
 from concurrent.futures import ProcessPoolExecutor
 
 from app.core.config import settings
-from app.core.security import get_executor, shutdown_executor
 from app.core.errors import (
     BaseHTTPException,
     base_exception_handler,
     validation_exception_handler,
     http_exception_handler,
 )
-from app.api.routers import auth, jobs, applications, companies, admin, files, public, users, oauth
+from app.api.routers import auth, jobs, applications, companies, admin, files, public, users, oauth, analytics
 from app.core import executors
+from app.core.rate_limit import rate_limit_middleware
+from app.core.redis import close_redis
+from app.core.background import PeriodicTask
+from app.db.base import engine
+from app.db.instrumentation import instrument_engine, query_stats_middleware
+from app.db.pool import pool_metrics
+from app.db.replicas import replica_router, read_your_writes_middleware
+from app.db.admin_stats import admin_stats
+from app.services.job_counter_service import fold_job_counters
+from app.services.analytics_service import roll_up_analytics
+from app.services.job_archive_service import archive_closed_jobs
 
 # Configure structured logging
 logger = get_logger()
@@ -33,19 +43,45 @@ async def lifespan(app: FastAPI):
     # Create executor on startup
     executors.executor = ProcessPoolExecutor()
     logger.info("Process pool executor created")
+    # Keep read replica health current
+    replica_health = PeriodicTask(
+        "replica-health", replica_router.check_health, settings.DB_REPLICA_CHECK_INTERVAL
+    )
+    if replica_router.enabled:
+        replica_health.start()
+    # Fold apply/save counter deltas into the job rows
+    job_counters = PeriodicTask("job-counters", fold_job_counters, settings.JOB_COUNTER_FOLD_INTERVAL)
+    job_counters.start()
+    # Recount the admin dashboard numbers (one worker per interval does the work)
+    admin_stats_refresh = PeriodicTask(
+        "admin-stats", admin_stats.refresh_if_due, settings.ADMIN_STATS_REFRESH_INTERVAL
+    )
+    admin_stats_refresh.start()
+    # Roll new audit log events up into the analytics tables
+    analytics_rollup = PeriodicTask("analytics-rollup", roll_up_analytics, settings.ANALYTICS_ROLLUP_INTERVAL)
+    analytics_rollup.start()
+    # Move long-closed jobs out of the live jobs table
+    job_archive = PeriodicTask("job-archive", archive_closed_jobs, settings.JOB_ARCHIVE_INTERVAL)
+    job_archive.start()
     yield
+    await job_archive.stop()
+    await analytics_rollup.stop()
+    await admin_stats_refresh.stop()
+    await job_counters.stop()
+    await replica_health.stop()
+    await replica_router.dispose()
     # Shutdown executor on shutdown
     if executors.executor:
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, executors.executor.shutdown, True)
         logger.info("Process pool executor shut down")
+    await close_redis()
     logger.info("Application shutdown")
 
 # Create FastAPI app
 app = FastAPI(
     lifespan=lifespan,
     title=settings.PROJECT_NAME,
-    lifespan=lifespan,
     description="IQAutoJobs - A modern job board platform",
     version="1.0.0",
     docs_url="/api/docs" if settings.ENVIRONMENT == "development" else None,
@@ -67,6 +103,18 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
+# Add rate limiting middleware
+app.middleware("http")(rate_limit_middleware)
+
+# Count the SQL each request issues
+instrument_engine(engine)
+for replica in replica_router.replicas:
+    instrument_engine(replica.engine)
+app.middleware("http")(query_stats_middleware)
+
+# Keep users on the primary briefly after their own writes
+app.middleware("http")(read_your_writes_middleware)
+
 # Add security headers middleware
 @app.middleware("http")
 async def add_security_headers(request: Request, call_next):
@@ -102,6 +150,7 @@ app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 app.include_router(files.router, prefix="/api/files", tags=["files"])
 app.include_router(public.router, prefix="/api/public", tags=["public"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"])
 
 # Health check endpoints
 @app.get("/healthz")
@@ -122,6 +171,11 @@ async def metrics():
         "service": "IQAutoJobs API",
         "version": "1.0.0",
         "environment": settings.ENVIRONMENT,
+        "db_pool": pool_metrics(engine),
+        "db_replicas": [
+            {**status, "pool": pool_metrics(replica.engine)}
+            for status, replica in zip(replica_router.status(), replica_router.replicas)
+        ],
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+"""Move long-closed jobs and their applications into the archive tables.
+
+The application does this in the background every ``JOB_ARCHIVE_INTERVAL``
+seconds; run this to work through a backlog on demand, for example right
+after enabling the archive on a large database.
+
+Usage:
+    python -m scripts.archive_jobs --batch-size 500 --max-batches 100
+
+Run from the ``backend`` directory with ``DATABASE_URL`` (and the other
+required settings) in the environment. ``JOB_ARCHIVE_AFTER_DAYS`` sets how
+long a job must have been closed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.db.base import engine  # noqa: E402
+from app.services.job_archive_service import archive_closed_jobs  # noqa: E402
+
+
+async def run(batch_size: int, max_batches: int | None) -> None:
+    archived = await archive_closed_jobs(batch_size, max_batches)
+    print(f"Archived {archived} job(s)")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500, help="jobs per transaction")
+    parser.add_argument("--max-batches", type=int, default=None, help="stop after this many batches")
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size, args.max_batches))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark the bulk repository writes against the per-row ``create`` loop.
+
+Inserts the same batch of audit log rows with each strategy and prints the
+wall time and rows per second. Every run happens inside a transaction that is
+rolled back, so the database is left untouched.
+
+Usage:
+    python -m scripts.bench_bulk_insert --rows 10000
+
+Run from the ``backend`` directory with ``DATABASE_URL`` (and the other
+required settings) in the environment.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+from uuid import uuid4
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.db.base import SessionLocal, engine  # noqa: E402
+from app.repositories.audit_log_repo import AuditLogRepository  # noqa: E402
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Build ``count`` audit log rows with the same keys."""
+    return [
+        {
+            "id": uuid4(),
+            "action": "BENCHMARK",
+            "subject_type": "job",
+            "subject_id": str(uuid4()),
+            "payload": {"index": i},
+        }
+        for i in range(count)
+    ]
+
+
+async def per_row(repo: AuditLogRepository, rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        await repo.create(row)
+
+
+async def bulk_create(repo: AuditLogRepository, rows: List[Dict[str, Any]]) -> None:
+    await repo.bulk_create(rows)
+
+
+async def bulk_insert(repo: AuditLogRepository, rows: List[Dict[str, Any]]) -> None:
+    await repo.bulk_insert(rows, copy_threshold=len(rows) + 1)
+
+
+async def bulk_copy(repo: AuditLogRepository, rows: List[Dict[str, Any]]) -> None:
+    await repo.bulk_insert(rows, copy_threshold=1)
+
+
+STRATEGIES: Dict[str, Callable[[AuditLogRepository, List[Dict[str, Any]]], Awaitable[None]]] = {
+    "per-row create": per_row,
+    "bulk_create (INSERT RETURNING)": bulk_create,
+    "bulk_insert (INSERT)": bulk_insert,
+    "bulk_insert (COPY)": bulk_copy,
+}
+
+
+async def run(rows: int, skip_per_row: bool) -> None:
+    for name, strategy in STRATEGIES.items():
+        if skip_per_row and strategy is per_row:
+            continue
+
+        batch = make_rows(rows)
+        async with SessionLocal() as session:
+            repo = AuditLogRepository(session)
+            started = time.perf_counter()
+            await strategy(repo, batch)
+            await session.flush()
+            elapsed = time.perf_counter() - started
+            await session.rollback()
+
+        print(f"{name:<32} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/s")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="rows per strategy")
+    parser.add_argument(
+        "--skip-per-row",
+        action="store_true",
+        help="skip the per-row loop, which is slow for large batches",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.skip_per_row))
+
+
+if __name__ == "__main__":
+    main()
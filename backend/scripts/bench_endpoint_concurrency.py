@@ -0,0 +1,145 @@
+"""Load-test list endpoints at rising concurrency.
+
+Fires the same GET at each endpoint from a growing number of concurrent
+clients and prints throughput and latency per level, so endpoints can be
+compared: one whose handler does its database work on the event loop
+without blocking scales with concurrency until the connection pool or the
+database saturates, while one that blocks the loop stays flat at its
+single-client throughput.
+
+By default the app runs in-process behind httpx's ASGI transport, with the
+rate limits raised (and kept in memory) so they don't cut the run short;
+``--base-url`` targets a running server instead, subject to its limits.
+Admin endpoints are called with a token minted for the first admin user in
+the database (or ``--token``).
+
+Usage:
+    python -m scripts.bench_endpoint_concurrency --concurrency 1,4,16,64 --requests 400
+    python -m scripts.bench_endpoint_concurrency --base-url http://localhost:8000 --token <jwt>
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx  # noqa: E402
+
+ENDPOINTS: Dict[str, str] = {
+    "jobs": "/api/jobs/?limit=20",
+    "companies": "/api/companies/?limit=20",
+    "companies-with-jobs": "/api/companies/with-jobs?limit=20",
+    "public-users": "/api/public/users?limit=20",
+    "admin-users": "/api/admin/users?limit=20",
+    "admin-companies": "/api/admin/companies?limit=20",
+}
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def admin_token() -> Optional[str]:
+    """Mint a token for the first admin user, if there is one."""
+    from sqlalchemy import select
+
+    from app.core.security import create_access_token
+    from app.db.base import SessionLocal
+    from app.db.models import User, UserRole
+
+    async with SessionLocal() as session:
+        result = await session.execute(select(User.id).where(User.role == UserRole.ADMIN).limit(1))
+        user_id = result.scalar_one_or_none()
+    return create_access_token(data={"sub": str(user_id)}) if user_id else None
+
+
+async def run_level(
+    client: httpx.AsyncClient, path: str, headers: Dict[str, str], concurrency: int, requests: int
+) -> Tuple[float, List[float], int]:
+    """Send ``requests`` GETs from ``concurrency`` workers; return elapsed, latencies, errors."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, errors
+
+
+async def run(
+    base_url: Optional[str], levels: List[int], requests: int, names: List[str], token: Optional[str]
+) -> None:
+    if base_url:
+        client = httpx.AsyncClient(base_url=base_url, timeout=60)
+        dispose = None
+    else:
+        from main import app
+        from app.db.base import engine
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+        dispose = engine.dispose
+        token = token or await admin_token()
+
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    print(f"{'endpoint':<22} {'clients':>7} {'req/s':>9} {'scaling':>8} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    async with client:
+        for name in names:
+            path = ENDPOINTS[name]
+            await client.get(path, headers=headers)  # warm up pools and caches
+            baseline = None
+            for concurrency in levels:
+                elapsed, latencies, errors = await run_level(client, path, headers, concurrency, requests)
+                throughput = requests / elapsed
+                baseline = baseline or throughput
+                print(
+                    f"{name:<22} {concurrency:>7} {throughput:9.1f} {throughput / baseline:7.2f}x "
+                    f"{statistics.median(latencies) * 1e3:8.1f} {percentile(latencies, 0.95) * 1e3:8.1f} {errors:>7}"
+                )
+    if dispose:
+        await dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="target a running server instead of the in-process app")
+    parser.add_argument("--concurrency", default="1,4,16,64", help="comma-separated client counts")
+    parser.add_argument("--requests", type=int, default=400, help="requests per endpoint and level")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="comma-separated endpoint names")
+    parser.add_argument("--token", help="bearer token for admin endpoints")
+    args = parser.parse_args()
+
+    names = [name for name in args.endpoints.split(",") if name]
+    unknown = [name for name in names if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+    if not args.base_url:
+        # The in-process app reads its settings on import, so raise the limits first
+        os.environ["RATE_LIMIT_BACKEND"] = "memory"
+        for name in ("RATE_LIMIT_REQUESTS", "RATE_LIMIT_SEARCH_REQUESTS", "RATE_LIMIT_ADMIN_REQUESTS"):
+            os.environ[name] = "1000000000"
+    levels = [int(level) for level in args.concurrency.split(",")]
+    asyncio.run(run(args.base_url, levels, args.requests, names, args.token))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compare the ORM and row read paths of the hot job list queries.
+
+For each list query the "orm" variant loads ``Job`` objects (with their
+companies) and builds ``JobSummaryResponse.from_orm`` from each, and the
+"rows" variant selects the same columns as plain rows, maps them to dicts
+and validates those (``JOB_LIST_ROW_READS``). Two rates are printed per
+variant, in rows per second:
+
+* fetch: the repository call alone, i.e. executing the query and turning the
+  result into ORM objects or dicts.
+* total: fetch plus building the response models.
+
+Each iteration uses a fresh session, as a request would, so the ORM variant
+can't reuse objects from the identity map. Rates depend on how many jobs
+match; seed more data for steadier numbers.
+
+Usage:
+    python -m scripts.bench_job_list_reads --iterations 200 --limit 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.db.base import SessionLocal, engine  # noqa: E402
+from app.db.models import Job  # noqa: E402
+from app.domain.models import JobSummaryResponse  # noqa: E402
+from app.repositories.job_repo import JobRepository  # noqa: E402
+
+Fetch = Callable[[JobRepository], Awaitable[List[Any]]]
+
+
+def cases(limit: int, company_id: Any) -> Dict[str, Tuple[Fetch, Fetch]]:
+    return {
+        "search": (
+            lambda repo: repo.search_jobs(search_term="e", limit=limit),
+            lambda repo: repo.search_job_rows(search_term="e", limit=limit),
+        ),
+        "recent": (
+            lambda repo: repo.get_recent_jobs(limit),
+            lambda repo: repo.get_recent_job_rows(limit),
+        ),
+        "by_category": (
+            lambda repo: repo.get_jobs_by_category("e", limit=limit),
+            lambda repo: repo.get_job_rows_by_category("e", limit=limit),
+        ),
+        "by_company": (
+            lambda repo: repo.get_jobs_by_company(company_id, limit=limit),
+            lambda repo: repo.get_job_rows_by_company(company_id, limit=limit),
+        ),
+    }
+
+
+def build_orm(jobs: List[Any]) -> List[JobSummaryResponse]:
+    return [JobSummaryResponse.from_orm(job) for job in jobs]
+
+
+def build_rows(rows: List[Any]) -> List[JobSummaryResponse]:
+    return [JobSummaryResponse.model_validate(row) for row in rows]
+
+
+async def bench(fetch: Fetch, build: Callable[[List[Any]], Any], iterations: int) -> Tuple[int, float, float]:
+    """Rows per query, and rows per second for fetching and for fetching plus building."""
+    fetch_time = build_time = 0.0
+    rows = 0
+    for iteration in range(iterations + 1):
+        async with SessionLocal() as session:
+            repo = JobRepository(session)
+            started = time.perf_counter()
+            items = await fetch(repo)
+            fetched = time.perf_counter()
+            build(items)
+            built = time.perf_counter()
+        if iteration == 0:
+            continue  # warm-up: statement caches and the pooled connection
+        fetch_time += fetched - started
+        build_time += built - fetched
+        rows = len(items)
+    total_rows = rows * iterations
+    if not total_rows:
+        return 0, 0.0, 0.0
+    return rows, total_rows / fetch_time, total_rows / (fetch_time + build_time)
+
+
+async def run(iterations: int, limit: int) -> None:
+    async with SessionLocal() as session:
+        company_id = (await session.execute(select(Job.company_id).limit(1))).scalar_one_or_none()
+    print(f"{'query':<12} {'variant':<8} {'rows':>5} {'fetch rows/s':>13} {'total rows/s':>13}")
+    for name, (orm, rows) in cases(limit, company_id).items():
+        for variant, fetch, build in (("orm", orm, build_orm), ("rows", rows, build_rows)):
+            count, fetch_rate, total_rate = await bench(fetch, build, iterations)
+            print(f"{name:<12} {variant:<8} {count:>5} {fetch_rate:13.0f} {total_rate:13.0f}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=100, help="page size of each query")
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Measure the per-query Python overhead of the hot repository queries.
+
+For each query the "before" variant builds a fresh ``select()`` the way the
+repositories used to, and the "after" variant uses the cached lambda
+statement the repositories use now. Two numbers are printed per variant:
+
+* prepare: building the statement and computing its cache key, which is the
+  Python work SQLAlchemy repeats on every execution before it can reuse the
+  compiled SQL. No database is needed for this part.
+* execute: the full round trip through an AsyncSession, including the driver
+  and the database. Skipped with ``--no-db``.
+
+Usage:
+    python -m scripts.bench_query_overhead --iterations 5000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import sqlalchemy.orm  # noqa: E402
+from sqlalchemy import func, lambda_stmt, or_, select  # noqa: E402
+
+from app.db.base import SessionLocal, engine  # noqa: E402
+from app.db.models import Company, Job, JobStatus, User  # noqa: E402
+from app.repositories.job_repo import JobRepository  # noqa: E402
+
+SEARCH = {"search_term": "engineer", "location": "CA", "salary_min": 50000}
+
+
+def email_before(email: str):
+    return select(User).filter(User.email == email)
+
+
+def email_after(email: str):
+    return lambda_stmt(lambda: select(User).where(User.email == email))
+
+
+def search_before(search_term: str, location: str, salary_min: int):
+    query = select(Job).filter(Job.status == JobStatus.PUBLISHED).options(
+        sqlalchemy.orm.selectinload(Job.company).selectinload(Company.owner)
+    )
+    query = query.filter(
+        or_(
+            Job.title.ilike(f"%{search_term}%"),
+            Job.description.ilike(f"%{search_term}%"),
+            Job.category.ilike(f"%{search_term}%"),
+        )
+    )
+    query = query.filter(Job.location.ilike(f"%{location}%"))
+    query = query.filter(Job.salary_min >= salary_min)
+    return query.offset(0).limit(20)
+
+
+def search_after(search_term: str, location: str, salary_min: int):
+    status = JobStatus.PUBLISHED
+    stmt = lambda_stmt(
+        lambda: select(Job)
+        .where(Job.status == status)
+        .options(sqlalchemy.orm.selectinload(Job.company).selectinload(Company.owner))
+    )
+    stmt = JobRepository._filter_search(
+        stmt, search_term=search_term, location=location, salary_min=salary_min
+    )
+    skip, limit = 0, 20
+    stmt += lambda s: s.offset(skip).limit(limit)
+    return stmt
+
+
+def count_before(search_term: str, location: str, salary_min: int):
+    query = select(func.count(Job.id)).filter(Job.status == JobStatus.PUBLISHED)
+    query = query.filter(
+        or_(
+            Job.title.ilike(f"%{search_term}%"),
+            Job.description.ilike(f"%{search_term}%"),
+            Job.category.ilike(f"%{search_term}%"),
+        )
+    )
+    query = query.filter(Job.location.ilike(f"%{location}%"))
+    return query.filter(Job.salary_min >= salary_min)
+
+
+def count_after(search_term: str, location: str, salary_min: int):
+    status = JobStatus.PUBLISHED
+    stmt = lambda_stmt(lambda: select(func.count(Job.id)).where(Job.status == status))
+    return JobRepository._filter_search(
+        stmt, search_term=search_term, location=location, salary_min=salary_min
+    )
+
+
+CASES: Dict[str, Tuple[Callable[..., Any], Callable[..., Any], Dict[str, Any]]] = {
+    "get_by_email": (email_before, email_after, {"email": "john.doe@example.com"}),
+    "search_jobs": (search_before, search_after, SEARCH),
+    "count_search_jobs": (count_before, count_after, SEARCH),
+}
+
+
+def bench_prepare(build: Callable[..., Any], kwargs: Dict[str, Any], iterations: int) -> float:
+    """Average microseconds spent building a statement and its cache key."""
+    build(**kwargs)._generate_cache_key()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        build(**kwargs)._generate_cache_key()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def bench_execute(build: Callable[..., Any], kwargs: Dict[str, Any], iterations: int) -> float:
+    """Average microseconds per execution through an AsyncSession."""
+    async with SessionLocal() as session:
+        (await session.execute(build(**kwargs))).all()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            (await session.execute(build(**kwargs))).all()
+        return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def run(iterations: int, with_db: bool) -> None:
+    print(f"{'query':<20} {'variant':<8} {'prepare us':>11} {'execute us':>11}")
+    for name, (before, after, kwargs) in CASES.items():
+        for variant, build in (("before", before), ("after", after)):
+            prepare = bench_prepare(build, kwargs, iterations)
+            execute = await bench_execute(build, kwargs, iterations) if with_db else float("nan")
+            print(f"{name:<20} {variant:<8} {prepare:11.1f} {execute:11.1f}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--no-db", action="store_true", help="only measure statement preparation")
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, not args.no_db))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Measure building and serializing a 100-item job list response.
+
+Starts from the dicts the row read path produces (``job_summary_dicts``),
+so no database is needed, and times three ways of turning them into a
+response body:
+
+* per-item: ``JobSummaryResponse.model_validate`` per item, then FastAPI's
+  own ``serialize_response`` against the route's ``response_model`` and a
+  ``JSONResponse``, which is what a route returning models used to cost.
+* batch: one ``TypeAdapter`` validation for the whole list, then the same
+  FastAPI serialization.
+* trusted: the batch validation, then ``ModelJSONResponse``, which
+  pydantic-core dumps to bytes in one pass (``TRUSTED_SERIALIZATION``).
+
+The bodies are checked to be identical before timing.
+
+Usage:
+    python -m scripts.bench_response_serialization --items 100 --iterations 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from app.api.responses import ModelJSONResponse  # noqa: E402
+from app.domain.models import JobSummaryResponse  # noqa: E402
+from app.services.job_service import JOB_SUMMARIES  # noqa: E402
+
+RESPONSE_TYPE = List[JobSummaryResponse]
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Dicts shaped like the row read path's output."""
+    now = datetime.now(timezone.utc)
+    company = {"id": uuid4(), "name": "TechCorp Solutions", "slug": "techcorp-solutions"}
+    return [
+        {
+            "id": uuid4(),
+            "title": f"Senior Engineer {index}",
+            "slug": f"senior-engineer-{index}",
+            "description_excerpt": "We are looking for an engineer to join our team. " * 6,
+            "location": "Portland, OR",
+            "type": "FT",
+            "category": "Engineering",
+            "experience_level": "Senior",
+            "salary_min": 120000,
+            "salary_max": 180000,
+            "currency": "USD",
+            "status": "PUBLISHED",
+            "published_at": now - timedelta(hours=index),
+            "created_at": now - timedelta(days=1, hours=index),
+            "applications_count": index,
+            "saves_count": index // 2,
+            "company": dict(company),
+        }
+        for index in range(count)
+    ]
+
+
+async def fastapi_body(items: List[JobSummaryResponse], field: Any) -> bytes:
+    content = await serialize_response(field=field, response_content=items)
+    return JSONResponse(content).body
+
+
+async def per_item(rows: List[Dict[str, Any]], field: Any) -> bytes:
+    return await fastapi_body([JobSummaryResponse.model_validate(row) for row in rows], field)
+
+
+async def batch(rows: List[Dict[str, Any]], field: Any) -> bytes:
+    return await fastapi_body(JOB_SUMMARIES.validate_python(rows), field)
+
+
+async def trusted(rows: List[Dict[str, Any]], field: Any) -> bytes:
+    return ModelJSONResponse(JOB_SUMMARIES.validate_python(rows), RESPONSE_TYPE).body
+
+
+VARIANTS: Dict[str, Callable[..., Any]] = {"per-item": per_item, "batch": batch, "trusted": trusted}
+
+
+async def run(items: int, iterations: int) -> None:
+    rows = make_rows(items)
+    field = create_model_field(name="Response", type_=RESPONSE_TYPE, mode="serialization")
+
+    bodies = {name: await variant(rows, field) for name, variant in VARIANTS.items()}
+    if len({json.dumps(json.loads(body), sort_keys=True) for body in bodies.values()}) != 1:
+        raise SystemExit("variants produced different responses")
+
+    print(f"{'variant':<10} {'us/response':>12} {'items/s':>10} {'speedup':>8}")
+    baseline = None
+    for name, variant in VARIANTS.items():
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await variant(rows, field)
+        per_response = (time.perf_counter() - started) / iterations
+        baseline = baseline or per_response
+        print(f"{name:<10} {per_response * 1e6:12.1f} {items / per_response:10.0f} {baseline / per_response:7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100, help="jobs per list")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
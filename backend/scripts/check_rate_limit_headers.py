@@ -0,0 +1,86 @@
+"""Check that rate-limited job routes keep their rate limit class headers.
+
+Routes that serialize their own responses (``model_response``, or
+``json_bytes_response`` for cached job fragments) return a
+``Response`` that FastAPI sends as it is, so the ``X-RateLimit-Class``
+headers ``RateLimit`` sets have to be carried over by the route. This calls
+each rate-limited job list route in-process under every serialization mode
+and fails if a response comes back without them.
+
+Usage:
+    python -m scripts.check_rate_limit_headers
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Ensure the backend package is importable when running as a module
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx  # noqa: E402
+
+PATHS: List[str] = [
+    "/api/jobs/?search=engineer",
+    "/api/jobs/by-category/Engineering",
+    "/api/jobs/by-location/Portland",
+]
+
+HEADERS = ("X-RateLimit-Class", "X-RateLimit-Class-Limit", "X-RateLimit-Class-Remaining")
+
+
+def modes() -> Dict[str, Callable[[], None]]:
+    """Serialization modes, each as a function switching the settings to it."""
+    from app.core.config import settings
+    from app.services.job_service import job_fragments
+
+    fragment_size = job_fragments.max_entries
+
+    def configure(trusted: bool, fragments: bool) -> Callable[[], None]:
+        def apply() -> None:
+            settings.TRUSTED_SERIALIZATION = trusted
+            job_fragments.max_entries = fragment_size if fragments else 0
+        return apply
+
+    return {
+        "fastapi": configure(trusted=False, fragments=False),
+        "trusted": configure(trusted=True, fragments=False),
+        "fragments": configure(trusted=True, fragments=True),
+    }
+
+
+async def run() -> int:
+    from main import app
+    from app.db.base import engine
+
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+        for mode, apply in modes().items():
+            apply()
+            for path in PATHS:
+                response = await client.get(path)
+                missing = [name for name in HEADERS if name not in response.headers]
+                status = "ok" if response.status_code == 200 and not missing else "FAIL"
+                failures += status == "FAIL"
+                detail = f"missing {', '.join(missing)}" if missing else response.headers["X-RateLimit-Class"]
+                print(f"{mode:<10} {response.status_code} {status:<4} {path} ({detail})")
+    await engine.dispose()
+    return failures
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+    os.environ.setdefault("RATE_LIMIT_BACKEND", "memory")
+    if asyncio.run(run()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()